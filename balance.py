@@ -0,0 +1,316 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import traceback
+
+from controller.input_policy import RandomPolicy, ScriptedPolicy
+from headless import make_game
+from utils import config
+from utils.ids.difficulty_id import DifficultyID
+from utils.ids.enemy_id import EnemyID
+from utils.ids.gamemode_id import GameModeID
+from utils.ids.player_id import PlayerID
+from utils.ids.weapon_id import WeaponID
+from utils.score_storage import write_atomic
+
+"""Plays many seeded headless games for each configuration across every core, for tuning the wave AIs. Each finished
+game is appended to a JSON lines file as soon as it is over, so a sweep that was stopped can be run again with the same
+arguments to play only the games it is missing. Games are kept apart by their tick limit, and games that raised an error
+are played again. The games in the file are then summed up into one report of how long the player survived, the waves
+and score reached, and how fast each configuration ticked.
+
+Configurations are either every combination of the given modes, difficulties, ships, and weapons, or read from a JSON
+file holding a list of them. A configuration in a file can also replace settings of the AI once it is made for its
+difficulty, with enemy names as the keys of combat ratings:
+    [{"NAME": "fast ramp", "MODE": "CLASSIC", "DIFFICULTY": "HARD",
+      "AI": {"_combat_ratio": 30, "_combat_ratings": {"MANTIS": 60}}}]
+
+Example:
+    python balance.py --modes CLASSIC HEAVEN --difficulties NORMAL HARD --games 200 --output sweep.jsonl
+    python balance.py --configs tuning.json --games 500 --output tuning.jsonl --report tuning_report.json
+"""
+
+
+"""Makes the name a configuration is stored under in the results, given one if it has none.
+
+:param setup: configuration with MODE, DIFFICULTY, SHIP, and WEAPON names and optional AI settings
+:type setup: dict
+:returns: the name
+:rtype: str
+"""
+
+
+def get_name(setup):
+    if "NAME" in setup:
+        return setup["NAME"]
+    name = " ".join([setup["MODE"], setup["DIFFICULTY"], setup["SHIP"], setup["WEAPON"]])
+    if setup.get("AI"):
+        name += " " + json.dumps(setup["AI"], sort_keys=True)
+    return name
+
+
+"""Replaces settings of the AI the model made for its difficulty.
+
+:param ai: AI to change
+:type ai: EnemyWaveAI
+:param settings: attribute names of the AI and their new values
+:type settings: dict
+:raises: ValueError if the AI has no such setting
+"""
+
+
+def apply_ai_settings(ai, settings):
+    for name, value in settings.items():
+        if not hasattr(ai, name):
+            raise ValueError("AI has no setting:", name)
+        if name == "_combat_ratings":
+            ai._combat_ratings.update({EnemyID[enemy]: rating for enemy, rating in value.items()})
+        elif isinstance(value, list):
+            setattr(ai, name, tuple(value))
+        else:
+            setattr(ai, name, value)
+
+
+"""Plays one game of a configuration in a worker process. A game that raises an error is recorded with the error
+instead, so one broken configuration does not stop the rest of the sweep.
+
+:param job: configuration, seed, most ticks to play, and script of directions or None for random inputs
+:type job: (dict, int, int, [[str]] or None)
+:returns: how the game went, or the error it raised
+:rtype: dict
+"""
+
+
+def play(job):
+    setup, seed, max_ticks, _ = job
+    try:
+        return play_game(*job)
+    except Exception as e:
+        return {"CONFIG": get_name(setup), "SEED": seed, "MAX TICKS": max_ticks,
+                "ERROR": "".join(traceback.format_exception_only(type(e), e)).strip()}
+
+
+"""Plays one game of a configuration.
+
+:param setup: configuration to play
+:type setup: dict
+:param seed: seed for the game and the random input policy
+:type seed: int
+:param max_ticks: most ticks to play
+:type max_ticks: int
+:param script: lists of direction names to hold each tick, or None for random inputs
+:type script: [[str]] or None
+:returns: how the game went
+:rtype: dict
+"""
+
+
+def play_game(setup, seed, max_ticks, script):
+    if script is None:
+        policy = RandomPolicy(seed)
+    else:
+        policy = ScriptedPolicy.from_names(script)
+    controller = make_game(GameModeID[setup["MODE"]], DifficultyID[setup["DIFFICULTY"]], PlayerID[setup["SHIP"]],
+                           WeaponID[setup["WEAPON"]], policy, seed)
+    model = controller.get_model()
+    apply_ai_settings(model.get_ai(), setup.get("AI", {}))
+    ticks = controller.run_game(max_ticks)
+    return {"CONFIG": get_name(setup),
+            "SEED": seed,
+            "MAX TICKS": max_ticks,
+            "TICKS": ticks,
+            "SECONDS SURVIVED": round(ticks / config.game_fps, 2),
+            "WAVE": model.get_ai().get_wave(),
+            "SCORE": model.get_player().score,
+            "DIED": model.get_player().is_dead,
+            "TICKS PER SECOND": round(ticks / controller.elapsed, 1) if controller.elapsed > 0 else 0}
+
+
+"""Reads the games already played from a results file. A line cut off part way, such as by the sweep being stopped
+while it was written, is dropped from the file, and a missing newline after the last line is added, so new games can be
+appended after it.
+
+:param file_path: JSON lines file of results
+:type file_path: str
+:returns: results of every game in the file
+:rtype: [dict]
+"""
+
+
+def load_results(file_path):
+    if not os.path.exists(file_path):
+        return []
+    results = []
+    cut_off = False
+    with open(file_path) as f:
+        text = f.read()
+    for line in text.splitlines():
+        try:
+            results.append(json.loads(line))
+        except ValueError:
+            cut_off = True
+    if cut_off or (text and not text.endswith("\n")):
+        write_atomic(file_path, "".join(json.dumps(result) + "\n" for result in results))
+    return results
+
+
+"""Returns the key a game is stored under, so a game is only played once for each tick limit.
+
+:param result: result of a game
+:type result: dict
+:returns: configuration name, seed, and tick limit
+:rtype: (str, int, int or None)
+"""
+
+
+def get_key(result):
+    return result["CONFIG"], result["SEED"], result.get("MAX TICKS")
+
+
+"""Sums up the results of each configuration. Games that raised an error are left out of the statistics, each seed
+that only ever raised one is counted along with how often each error was raised.
+
+:param results: results of every game played
+:type results: [dict]
+:returns: statistics of each configuration, by name
+:rtype: {str: dict}
+"""
+
+
+def summarize(results):
+    by_config = {}
+    for result in results:
+        by_config.setdefault(result["CONFIG"], []).append(result)
+    report = {}
+    for name, played in by_config.items():
+        games = [result for result in played if "ERROR" not in result]
+        finished = {result["SEED"] for result in games}
+        # Errors from games that were played again without one are left out
+        failed = {result["SEED"]: result["ERROR"] for result in played
+                  if "ERROR" in result and result["SEED"] not in finished}
+        summary = {"GAMES": len(games), "ERRORS": len(failed)}
+        if failed:
+            messages = list(failed.values())
+            summary["ERROR MESSAGES"] = {message: messages.count(message) for message in set(messages)}
+        report[name] = summary
+        if not games:
+            continue
+        summary["DEATH RATE"] = round(sum(game["DIED"] for game in games) / len(games), 3)
+        for key in ["SECONDS SURVIVED", "WAVE", "SCORE", "TICKS PER SECOND"]:
+            values = [game[key] for game in games]
+            summary[key] = {"MEAN": round(statistics.mean(values), 2), "MEDIAN": statistics.median(values),
+                            "MIN": min(values), "MAX": max(values)}
+    return report
+
+
+"""Parses the command line arguments.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+:returns: parsed arguments
+:rtype: argparse.Namespace
+"""
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description="Plays seeded headless games of " + config.game_title +
+                                                 " across every core and reports how each configuration went.")
+    parser.add_argument("--modes", nargs="+", choices=[mode.name for mode in GameModeID],
+                        default=[GameModeID.CLASSIC.name])
+    parser.add_argument("--difficulties", nargs="+", choices=[difficulty.name for difficulty in DifficultyID],
+                        default=[DifficultyID.NORMAL.name])
+    parser.add_argument("--ships", nargs="+", choices=[ship.name for ship in PlayerID],
+                        default=[config.player_ship.name])
+    parser.add_argument("--weapons", nargs="+", choices=[weapon.name for weapon in WeaponID],
+                        default=[config.weapon.name])
+    parser.add_argument("--configs", default=None,
+                        help="JSON file with a list of configurations to play instead of every combination, missing "
+                             "settings are taken from the other arguments")
+    parser.add_argument("--games", type=int, default=100, help="games to play of each configuration")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game, each game after adds one")
+    parser.add_argument("--ticks", type=int, default=config.game_fps * 60 * 10,
+                        help="most ticks to play each game for")
+    parser.add_argument("--script", default=None,
+                        help="JSON file with a list of lists of direction names to hold each tick, "
+                             "random inputs are used if not given")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes, defaults to one per core")
+    parser.add_argument("--output", default="balance.jsonl",
+                        help="JSON lines file to append each game to, games already in it are not played again")
+    parser.add_argument("--report", default=None, help="JSON file to write the report to, printed if not given")
+    return parser.parse_args(args)
+
+
+"""Builds the configurations to play from the arguments.
+
+:param args: parsed arguments
+:type args: argparse.Namespace
+:returns: configurations
+:rtype: [dict]
+"""
+
+
+def make_setups(args):
+    defaults = {"MODE": args.modes[0], "DIFFICULTY": args.difficulties[0], "SHIP": args.ships[0],
+                "WEAPON": args.weapons[0]}
+    if args.configs is not None:
+        with open(args.configs) as f:
+            return [dict(defaults, **setup) for setup in json.load(f)]
+    return [{"MODE": mode, "DIFFICULTY": difficulty, "SHIP": ship, "WEAPON": weapon}
+            for mode, difficulty, ship, weapon in itertools.product(args.modes, args.difficulties, args.ships,
+                                                                    args.weapons)]
+
+
+"""Plays every game missing from the results file and writes out the report.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+"""
+
+
+def main(args=None):
+    args = parse_args(args)
+    script = None
+    if args.script is not None:
+        with open(args.script) as f:
+            script = json.load(f)
+    setups = make_setups(args)
+    results = load_results(args.output)
+    # Games that raised an error are played again
+    played = {get_key(result) for result in results if "ERROR" not in result}
+    jobs = [(setup, seed, args.ticks, script) for setup in setups for seed in range(args.seed, args.seed + args.games)
+            if (get_name(setup), seed, args.ticks) not in played]
+    print(str(len(jobs)) + " games to play, " + str(len(played)) + " already played", file=sys.stderr)
+    if jobs:
+        with multiprocessing.Pool(args.processes) as pool, open(args.output, "a") as f:
+            for count, result in enumerate(pool.imap_unordered(play, jobs), 1):
+                # Written as each game finishes so a stopped sweep loses at most the games still running
+                f.write(json.dumps(result) + "\n")
+                f.flush()
+                results.append(result)
+                if count % 100 == 0 or count == len(jobs):
+                    print(str(count) + "/" + str(len(jobs)) + " games played", file=sys.stderr)
+    names = {get_name(setup) for setup in setups}
+    # Games played with a different tick limit are kept in the file but left out of the report
+    report = summarize([result for result in results
+                        if result["CONFIG"] in names and result.get("MAX TICKS") == args.ticks])
+    for name, summary in report.items():
+        line = name + ": " + str(summary["GAMES"]) + " games"
+        if summary["GAMES"] > 0:
+            line += ", survived " + str(summary["SECONDS SURVIVED"]["MEAN"]) + " s, wave " + \
+                    str(summary["WAVE"]["MEAN"]) + ", score " + str(summary["SCORE"]["MEAN"])
+        if summary["ERRORS"] > 0:
+            line += ", " + str(summary["ERRORS"]) + " errors"
+        print(line, file=sys.stderr)
+    if args.report is None:
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import argparse
+import json
+import sys
+import tracemalloc
+import types
+
+from entities.effects.explosion import Explosion
+from entities.projectiles.bullet import Bullet
+from entities.projectiles.missile import Missile
+from entities.ships.enemies.mandible import Mandible
+from entities.ships.ship import Ship
+from entities.ships.waypoint import Waypoint
+from utils import config
+from utils.ids.effect_id import EffectID
+from utils.ids.projectile_id import ProjectileID
+
+"""Compares the memory used by entities with their __slots__ layout against the dict backed layout they used to have,
+where every attribute lived in a per instance __dict__ and every ship built its own rotation and movement dicts of
+bound methods. Both layouts hold the same attribute values, so only the cost of the layout itself is measured.
+
+Run from the repository root:
+    python -m benchmarks.entity_memory --counts 1000 10000 --output memory.json
+"""
+
+
+"""Makes one entity of each kind measured, with the values they would have in game.
+
+:returns: sample entity by name
+:rtype: {str: object}
+"""
+
+
+def make_samples():
+    target = Waypoint(config.display_width // 2, 0)
+    return {"BULLET": Bullet(10, 100, 100, 90, 10, ProjectileID.FRIENDLY_BULLET),
+            "MISSILE": Missile(10, 100, 100, 90, 10, ProjectileID.FRIENDLY_MISSILE, target),
+            "EXPLOSION": Explosion(100, 100, EffectID.EXPLOSION),
+            "SHIP": Mandible(50, 20, 100, 100, 5, 30),
+            "WAYPOINT": target}
+
+
+"""Returns the names of every slot of an entity, base classes first.
+
+:param entity: entity to get the slots of
+:type entity: object
+:returns: names of the slots
+:rtype: [str]
+"""
+
+
+def get_slots(entity):
+    names = []
+    for cls in reversed(type(entity).__mro__):
+        names.extend(cls.__dict__.get("__slots__", ()))
+    return names
+
+
+"""Makes a class that stores the same attributes as the given entity in a per instance __dict__.
+
+:param entity: entity to mirror
+:type entity: object
+:returns: the dict backed class
+:rtype: type
+"""
+
+
+def make_dict_class(entity):
+    names = get_slots(entity)
+    is_ship = isinstance(entity, Ship)
+    cls = type(entity)
+
+    def __init__(self):
+        for name in names:
+            setattr(self, name, getattr(entity, name))
+        # Ships used to build these for every instance
+        if is_ship:
+            self._wp_rotations = {state: types.MethodType(method, self)
+                                  for state, method in cls._wp_rotations.items()}
+            self._wp_movement = {state: types.MethodType(method, self)
+                                 for state, method in cls._wp_movement.items()}
+
+    return type("Dict" + cls.__name__, (), {"__init__": __init__})
+
+
+"""Makes a copy of an entity with its slotted layout, without running its constructor again.
+
+:param entity: entity to copy
+:type entity: object
+:param names: names of the slots of the entity
+:type names: [str]
+:returns: the copy
+:rtype: object
+"""
+
+
+def copy_slotted(entity, names):
+    copy = object.__new__(type(entity))
+    for name in names:
+        setattr(copy, name, getattr(entity, name))
+    return copy
+
+
+"""Measures the bytes allocated to make the given number of objects.
+
+:param make: makes one object
+:type make: function
+:param count: number of objects to make
+:type count: int
+:returns: bytes allocated while the objects are alive
+:rtype: int
+"""
+
+
+def measure(make, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [make() for _ in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return used
+
+
+"""Compares both layouts of every sample entity at each count.
+
+:param counts: numbers of entities to measure with
+:type counts: [int]
+:returns: results for each entity and count
+:rtype: [dict]
+"""
+
+
+def compare(counts):
+    results = []
+    for name, entity in make_samples().items():
+        names = get_slots(entity)
+        dict_class = make_dict_class(entity)
+        for count in counts:
+            slotted = measure(lambda: copy_slotted(entity, names), count)
+            dict_backed = measure(dict_class, count)
+            results.append({"ENTITY": name,
+                            "COUNT": count,
+                            "SLOTS BYTES": slotted,
+                            "DICT BYTES": dict_backed,
+                            "SLOTS BYTES EACH": round(slotted / count, 1),
+                            "DICT BYTES EACH": round(dict_backed / count, 1),
+                            "SAVED": round(1 - slotted / dict_backed, 3) if dict_backed > 0 else 0})
+    return results
+
+
+"""Parses the command line arguments.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+:returns: parsed arguments
+:rtype: argparse.Namespace
+"""
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description="Compares the memory of slotted and dict backed entities.")
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--output", default=None, help="JSON file to write results to, printed if not given")
+    return parser.parse_args(args)
+
+
+"""Runs the comparison from the command line.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+"""
+
+
+def main(args=None):
+    args = parse_args(args)
+    results = {"PYTHON": sys.version.split()[0], "RESULTS": compare(args.counts)}
+    for result in results["RESULTS"]:
+        print(result["ENTITY"] + " x" + str(result["COUNT"]) + ": " + str(result["SLOTS BYTES EACH"]) +
+              " bytes each with slots, " + str(result["DICT BYTES EACH"]) + " with a dict", file=sys.stderr)
+    if args.output is None:
+        print(json.dumps(results, indent=2))
+    else:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+"""Reports how long importing the game's modules takes, using the interpreter's -X importtime output. Each module is
+imported in a new interpreter run from an empty folder, so nothing is already imported or cached, and any file written
+while importing, such as the save file, shows up in the report.
+
+Run from the repository root:
+    python -m benchmarks.import_time model.model view.view --output imports.json
+"""
+
+# Top level packages and modules that belong to the game, the rest are libraries
+game_packages = ["benchmarks", "controller", "entities", "model", "utils", "view", "headless", "main"]
+# Modules imported when none are given
+default_modules = ["utils.config", "model.model", "view.view", "controller.menu_controller"]
+
+
+"""Reads the -X importtime lines an interpreter wrote.
+
+:param output: text written to standard error
+:type output: str
+:returns: name, own microseconds, and microseconds including its imports of each module imported
+:rtype: [(str, int, int)]
+"""
+
+
+def parse_import_times(output):
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        # Skips the header line
+        if not fields[0].strip().isdigit():
+            continue
+        modules.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return modules
+
+
+"""Imports a module in a new interpreter and reports how long it took.
+
+:param module: name of the module to import
+:type module: str
+:param repeat: number of times to import it, the fastest run is kept
+:type repeat: int
+:param top: number of slowest modules to list
+:type top: int
+:returns: the report
+:rtype: dict
+"""
+
+
+def measure(module, repeat, top):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    best = None
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as folder:
+            result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module], cwd=folder, env=env,
+                                    stderr=subprocess.PIPE, universal_newlines=True)
+            if result.returncode != 0:
+                raise RuntimeError("Importing " + module + " failed:\n" + result.stderr)
+            files = sorted(os.listdir(folder))
+        times = parse_import_times(result.stderr)
+        total = sum(own for _, own, _ in times)
+        if best is None or total < best[0]:
+            best = total, times, files
+    total, times, files = best
+    game_total = sum(own for name, own, _ in times if name.split(".")[0] in game_packages)
+    slowest = sorted(times, key=lambda module_time: -module_time[1])[:top]
+    return {"MODULE": module,
+            "TOTAL MS": round(total / 1000, 2),
+            "GAME MS": round(game_total / 1000, 2),
+            "LIBRARY MS": round((total - game_total) / 1000, 2),
+            "MODULES IMPORTED": len(times),
+            "FILES WRITTEN": files,
+            "SLOWEST MS": {name: round(own / 1000, 2) for name, own, _ in slowest}}
+
+
+"""Parses the command line arguments.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+:returns: parsed arguments
+:rtype: argparse.Namespace
+"""
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description="Reports how long importing the game's modules takes.")
+    parser.add_argument("modules", nargs="*", default=default_modules,
+                        help="modules to import, defaults to " + ", ".join(default_modules))
+    parser.add_argument("--repeat", type=int, default=5, help="times to import each module, the fastest is kept")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest modules to list")
+    parser.add_argument("--output", default=None, help="JSON file to write results to, printed if not given")
+    return parser.parse_args(args)
+
+
+"""Measures the modules and writes out the results.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+"""
+
+
+def main(args=None):
+    args = parse_args(args)
+    results = [measure(module, args.repeat, args.top) for module in args.modules]
+    for result in results:
+        print(result["MODULE"] + ": " + str(result["TOTAL MS"]) + " ms, game " + str(result["GAME MS"]) +
+              " ms, files written " + str(len(result["FILES WRITTEN"])), file=sys.stderr)
+    if args.output is None:
+        print(json.dumps(results, indent=2))
+    else:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+import argparse
+import json
+import random
+import sys
+import time
+
+import pygame
+
+from entities.ships.allies.archer import Archer
+from entities.ships.enemies.mandible import Mandible
+from entities.ships.waypoint import Waypoint
+from utils import config
+
+"""Times how long turning every ship towards its target takes each tick, with the plain math ships use now against
+the pygame Vector2 comparison they used to make. Both turn the same way for every ship, which is checked first.
+
+Run from the repository root:
+    python -m benchmarks.rotation --ships 200 --ticks 2000 --output rotation.json
+"""
+
+
+"""Turns a ship towards an angle the way ships used to, building two vectors to compare their polar angles.
+
+:param ship: ship to turn
+:type ship: Ship
+:param target_angle: angle to face
+:type target_angle: int
+"""
+
+
+def turn_with_vectors(ship, target_angle):
+    if abs(ship.angle - target_angle) > ship.rotation_speed:
+        v1 = pygame.math.Vector2()
+        v1.from_polar((1, ship.angle))
+        v2 = pygame.math.Vector2()
+        v2.from_polar((1, target_angle))
+        angle_change = -ship.rotation_speed if v1.angle_to(v2) < 0 else ship.rotation_speed
+        ship.angle += angle_change
+
+
+"""Makes a copy of a ship class that turns with vectors instead, the way ships used to.
+
+:param cls: ship class to copy
+:type cls: type
+:returns: the class turning with vectors
+:rtype: type
+"""
+
+
+def make_vector_class(cls):
+    return type("Vector" + cls.__name__, (cls,), {"__slots__": (), "_turn_towards": turn_with_vectors})
+
+
+"""Makes an even mix of enemies and allies spread over the screen, each with a target to turn towards.
+
+:param count: number of ships
+:type count: int
+:param seed: seed for their positions, angles, and targets
+:type seed: int
+:param classes: enemy and ally classes to make
+:type classes: (type, type)
+:returns: ships and their targets
+:rtype: [(Ship, Waypoint)]
+"""
+
+
+def make_ships(count, seed, classes):
+    rng = random.Random(seed)
+    ships = []
+    for i in range(count):
+        ship = classes[i % 2](50, 20, rng.randint(0, config.display_width), rng.randint(0, config.display_height), 5,
+                              30)
+        ship.angle = rng.randint(-540, 540)
+        ships.append((ship, Waypoint(rng.randint(0, config.display_width), rng.randint(0, config.display_height))))
+    return ships
+
+
+"""Turns every ship towards its target each tick, moving the targets around so ships keep turning.
+
+:param ships: ships and their targets
+:type ships: [(Ship, Waypoint)]
+:param ticks: number of ticks to turn for
+:type ticks: int
+:param seed: seed for where the targets move to
+:type seed: int
+:returns: seconds spent turning ships each tick, and the angle of every ship after every tick
+:rtype: [float], [[float]]
+"""
+
+
+def run(ships, ticks, seed):
+    rng = random.Random(seed)
+    tick_times = []
+    angles = []
+    for tick in range(ticks):
+        # Targets jump every so often, like a new closest target being picked
+        if tick % 30 == 0:
+            for _, target in ships:
+                target.x = rng.randint(0, config.display_width)
+                target.y = rng.randint(0, config.display_height)
+        start = time.perf_counter()
+        for ship, target in ships:
+            ship._rotate(target)
+        tick_times.append(time.perf_counter() - start)
+        angles.append([ship.angle for ship, _ in ships])
+    return tick_times, angles
+
+
+"""Times both ways of turning the given number of ships, checking they turn the same way.
+
+:param count: number of ships
+:type count: int
+:param ticks: number of ticks to turn for
+:type ticks: int
+:param seed: seed for the ships and their targets
+:type seed: int
+:returns: results
+:rtype: dict
+:raises: AssertionError if the two ways do not turn every ship the same way
+"""
+
+
+def compare(count, ticks, seed):
+    classes = (Mandible, Archer)
+    current_times, current_angles = run(make_ships(count, seed, classes), ticks, seed)
+    vector_classes = tuple(make_vector_class(cls) for cls in classes)
+    vector_times, vector_angles = run(make_ships(count, seed, vector_classes), ticks, seed)
+    assert current_angles == vector_angles, "Ships turned differently with vectors"
+    current_us = min(current_times) * 10 ** 6
+    vector_us = min(vector_times) * 10 ** 6
+    return {"SHIPS": count,
+            "TICKS": ticks,
+            "CURRENT US PER TICK": round(current_us, 1),
+            "VECTOR US PER TICK": round(vector_us, 1),
+            "SAVED US PER TICK": round(vector_us - current_us, 1),
+            "SPEEDUP": round(vector_us / current_us, 2) if current_us > 0 else 0}
+
+
+"""Parses the command line arguments.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+:returns: parsed arguments
+:rtype: argparse.Namespace
+"""
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description="Times turning ships with plain math against pygame vectors.")
+    parser.add_argument("--ships", type=int, nargs="+", default=[200])
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="JSON file to write results to, printed if not given")
+    return parser.parse_args(args)
+
+
+"""Runs the comparison from the command line.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+"""
+
+
+def main(args=None):
+    args = parse_args(args)
+    results = {"PYTHON": sys.version.split()[0], "PYGAME": pygame.version.ver,
+               "RESULTS": [compare(count, args.ticks, args.seed) for count in args.ships]}
+    for result in results["RESULTS"]:
+        print(str(result["SHIPS"]) + " ships: " + str(result["CURRENT US PER TICK"]) + " us per tick, " +
+              str(result["VECTOR US PER TICK"]) + " with vectors", file=sys.stderr)
+    if args.output is None:
+        print(json.dumps(results, indent=2))
+    else:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+from benchmarks.scenarios import scenarios
+from controller.headless_controller import HeadlessController
+from entities import pools
+from controller.input_policy import RandomPolicy
+from model.model import Model
+from utils import config
+from view.view import View
+
+"""Runs the canned stress scenarios headless and reports how fast the game ticks through them. Each scenario is run
+twice with the same seed: once timed, and once under tracemalloc for its peak memory, since tracing slows ticks down.
+With --render, every tick of the timed run is also drawn, without a window unless one is set up, and how often the
+rotated sprite and text caches were hit is reported.
+
+Run from the repository root:
+    python -m benchmarks.run_benchmarks --ticks 3000 --output results.json
+"""
+
+
+"""Makes the model and controller for a scenario, seeding the game's random number stream and spawning the
+scenario's load.
+The player cannot die, so every scenario runs for the full number of ticks.
+
+:param scenario: scenario to set up
+:type scenario: dict
+:param seed: seed for the game and input policy
+:type seed: int
+:returns: the headless controller running the scenario
+:rtype: HeadlessController
+"""
+
+
+def make_scenario(scenario, seed):
+    config.weapon = scenario["WEAPON"]
+    model = Model(scenario["DIFFICULTY"], scenario["MODE"], headless=True, rng=random.Random(seed))
+    model.switch_weapon(scenario["WEAPON"])
+    player = model.get_player()
+    player.hp = player.max_hp = 10 ** 9
+    if scenario["SETUP"] is not None:
+        scenario["SETUP"](model)
+    return HeadlessController(model, RandomPolicy(seed))
+
+
+"""Runs a scenario for the given number of ticks.
+
+:param scenario: scenario to run
+:type scenario: dict
+:param ticks: number of ticks to run
+:type ticks: int
+:param seed: seed for the game and input policy
+:type seed: int
+:param timed: if each tick is timed
+:type timed: bool
+:param view: view to draw each tick with, or None to not draw
+:type view: View or None
+:returns: seconds each tick took, empty if not timed, and the most of each kind of entity at once
+:rtype: [float], {str: int}
+"""
+
+
+def run_scenario(scenario, ticks, seed, timed=True, view=None):
+    controller = make_scenario(scenario, seed)
+    model = controller.get_model()
+    step = scenario["STEP"]
+    tick_times = []
+    peak_counts = {}
+    for _ in range(ticks):
+        start = time.perf_counter()
+        if step is not None:
+            step(model)
+        controller.tick()
+        if view is not None:
+            view.render(*model.get_snapshot())
+        if timed:
+            tick_times.append(time.perf_counter() - start)
+        for name, count in model.get_counts().items():
+            peak_counts[name] = max(peak_counts.get(name, 0), count)
+    # Hands the projectiles and effects back so the pool stats only count what later runs have in use
+    model.clear()
+    return tick_times, peak_counts
+
+
+"""Returns the given percentile of a sorted list.
+
+:param values: sorted values
+:type values: [float]
+:param percentile: percentile between 0 and 100
+:type percentile: float
+:returns: the value at the percentile
+:rtype: float
+"""
+
+
+def percentile(values, percentile):
+    return values[min(len(values) - 1, int(len(values) * percentile / 100))]
+
+
+"""Benchmarks a scenario, timing it then measuring its peak memory.
+
+:param name: name of the scenario
+:type name: str
+:param ticks: number of ticks to run
+:type ticks: int
+:param seed: seed for the game and input policy
+:type seed: int
+:param render: if the timed run draws every tick
+:type render: bool
+:returns: results of the scenario
+:rtype: dict
+"""
+
+
+def benchmark(name, ticks, seed, render=False):
+    scenario = scenarios[name]
+    view = View(scenario["MODE"]) if render else None
+    tick_times, peak_counts = run_scenario(scenario, ticks, seed, view=view)
+    tracemalloc.start()
+    run_scenario(scenario, ticks, seed, timed=False)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    total = sum(tick_times)
+    tick_times.sort()
+    result = {"SCENARIO": name,
+              "TICKS": ticks,
+              "SECONDS": round(total, 4),
+              "TICKS PER SECOND": round(ticks / total, 1) if total > 0 else 0,
+              "TICK MS": {"P50": round(percentile(tick_times, 50) * 1000, 4),
+                          "P95": round(percentile(tick_times, 95) * 1000, 4),
+                          "P99": round(percentile(tick_times, 99) * 1000, 4),
+                          "MAX": round(tick_times[-1] * 1000, 4)},
+              "PEAK MEMORY BYTES": peak_memory,
+              "PEAK COUNTS": peak_counts}
+    if view is not None:
+        result["CACHES"] = view.get_cache_stats()
+    return result
+
+
+"""Parses the command line arguments.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+:returns: parsed arguments
+:rtype: argparse.Namespace
+"""
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description="Benchmarks " + config.game_title + " headless.")
+    parser.add_argument("scenarios", nargs="*", help="scenarios to run, all of them if none are given. Choices: " +
+                                                      ", ".join(scenarios))
+    parser.add_argument("--ticks", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="JSON file to write results to, printed if not given")
+    parser.add_argument("--render", action="store_true",
+                        help="draws every tick of the timed run and reports the rotated sprite and text caches")
+    args = parser.parse_args(args)
+    for name in args.scenarios:
+        if name not in scenarios:
+            parser.error("unknown scenario " + name)
+    return args
+
+
+"""Runs the benchmarks from the command line.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+"""
+
+
+def main(args=None):
+    args = parse_args(args)
+    if args.render:
+        # Draws to a surface in memory when there is no display to open a window on
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+    names = args.scenarios or list(scenarios)
+    results = {"PYTHON": platform.python_version(),
+               "PLATFORM": platform.platform(),
+               "SEED": args.seed,
+               "SCENARIOS": []}
+    for name in names:
+        result = benchmark(name, args.ticks, args.seed, args.render)
+        results["SCENARIOS"].append(result)
+        print(name + ": " + str(result["TICKS PER SECOND"]) + " ticks/s, p99 " + str(result["TICK MS"]["P99"]) +
+              " ms", file=sys.stderr)
+    results["POOLS"] = pools.get_stats()
+    if args.output is None:
+        print(json.dumps(results, indent=2))
+    else:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
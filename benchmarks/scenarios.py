@@ -0,0 +1,91 @@
+from entities import pools
+from utils import config
+from utils.ids.difficulty_id import DifficultyID
+from utils.ids.enemy_id import EnemyID
+from utils.ids.gamemode_id import GameModeID
+from utils.ids.projectile_id import ProjectileID
+from utils.ids.weapon_id import WeaponID
+
+"""Canned stress loads for the benchmark runner. Each scenario names the game mode, difficulty, and weapon to play,
+a setup that spawns its load once the model is made, and a step run before every tick to keep the load up.
+"""
+
+
+"""Spawns Titans spread across the top of the screen, each with its turrets.
+
+:param model: model to spawn in
+:type model: Model
+:param count: number of Titans
+:type count: int
+"""
+
+
+def spawn_titans(model, count):
+    ai = model.get_ai()
+    for i in range(count):
+        start = len(model.enemy_ships)
+        titan = ai.spawn_enemy(EnemyID.TITAN)
+        # Titans only move down, so the Titan and its turrets can be shifted over together
+        shift = (config.display_width - titan.size) * (i + 1) // (count + 1) - titan.x
+        for ship in model.enemy_ships[start:]:
+            ship.x += shift
+
+
+"""Keeps the given number of enemy bullets on screen, firing new ones down from the top of the screen.
+
+:param model: model to fire in
+:type model: Model
+:param count: number of bullets to keep on screen
+:type count: int
+"""
+
+
+def fill_enemy_bullets(model, count):
+    rng = model.get_rng()
+    for _ in range(count - len(model.enemy_projectiles)):
+        x_pos = rng.randint(0, config.display_width - config.ship_size)
+        direction = rng.randint(225, 315)
+        model.enemy_projectiles.append(pools.bullets.acquire(8, x_pos, -config.ship_size // 2, direction, 1,
+                                                             ProjectileID.ENEMY_BULLET))
+
+
+"""Fills the screen with Onslaught allies, trying to spawn allies until there are enough of them.
+
+:param model: model playing Onslaught
+:type model: Model
+:param attempts: most times to try spawning allies
+:type attempts: int
+:param size: number of allies to stop at
+:type size: int
+"""
+
+
+def spawn_ally_fleet(model, attempts, size):
+    ai = model.get_ai()
+    for _ in range(attempts):
+        if len(model.friendly_ships) >= size:
+            return
+        ai.spawn_ally()
+
+
+scenarios = {
+    # Regular waves on the hardest setting
+    "classic_waves": {"MODE": GameModeID.CLASSIC, "DIFFICULTY": DifficultyID.HARD, "WEAPON": WeaponID.AURORA,
+                      "SETUP": None, "STEP": None},
+    # Titans and their turrets firing missiles and flak
+    "titans": {"MODE": GameModeID.CLASSIC, "DIFFICULTY": DifficultyID.HARD, "WEAPON": WeaponID.FLAK_CANNON,
+               "SETUP": lambda model: spawn_titans(model, 3), "STEP": None},
+    # Constant wall of enemy bullets
+    "bullet_storm": {"MODE": GameModeID.CLASSIC, "DIFFICULTY": DifficultyID.EASY, "WEAPON": WeaponID.SHOTGUN,
+                     "SETUP": None, "STEP": lambda model: fill_enemy_bullets(model, 500)},
+    # Onslaught with as many allies as it allows on screen
+    "onslaught_fleet": {"MODE": GameModeID.ONSLAUGHT, "DIFFICULTY": DifficultyID.HARD, "WEAPON": WeaponID.SWARM,
+                        "SETUP": lambda model: spawn_ally_fleet(model, 200, 40),
+                        "STEP": lambda model: spawn_ally_fleet(model, 1, 40)},
+    # Spawning Heaven enemies from above
+    "heaven": {"MODE": GameModeID.HEAVEN, "DIFFICULTY": DifficultyID.HARD, "WEAPON": WeaponID.DIAMOND_DUST,
+               "SETUP": None, "STEP": None},
+    # Challenge waves of Mandibles
+    "mandible_madness": {"MODE": GameModeID.MANDIBLE_MADNESS, "DIFFICULTY": DifficultyID.HARD,
+                         "WEAPON": WeaponID.MULTI_MISSILE, "SETUP": None, "STEP": None}
+}
@@ -1,8 +1,11 @@
 import pygame
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from utils import config
 from utils.direction import Direction
+from utils.profiler import profiler
 
 """Controller that keeps track of time and key inputs to pass onto the _view and _model. Will also handle music
 and different types of menus and screens
@@ -30,22 +33,42 @@ class Controller:
     :type start_menu: StartMenu_view
     :param _fps: frames per second to run the game at
     :type _fps: int
+    :param recorder: recorder to capture the directions held each tick with, or None to not record
+    :type recorder: InputRecorder or None
     """
 
-    def __init__(self, _model, _view):
+    def __init__(self, _model, _view, recorder=None):
         self._model = _model
         self._view = _view
+        self._recorder = recorder
         self._fps = config.game_fps
         # Endurance by Scott Buckley is the music in the background
         self.game_music_path = os.path.join(self.music_path, 'endurance.mp3')
 
-    """Runs the game, setting a clock and looping until game is quit or starts over.
+    """Runs the game, setting a clock and looping until game is quit or starts over. With config.threaded_tick on, each
+    frame's ticks run on a worker thread while the frame before is drawn.
 
     :returns: If the game has to restart
     :rtype: bool
     """
 
     def run_game(self):
+        worker = ThreadPoolExecutor(max_workers=1) if config.threaded_tick else None
+        try:
+            return self._run_frames(worker)
+        finally:
+            if worker is not None:
+                worker.shutdown()
+
+    """Loops over frames until the game is quit or starts over.
+
+    :param worker: thread to tick the model on while frames are drawn, or None to tick and draw in turn
+    :type worker: ThreadPoolExecutor or None
+    :returns: If the game has to restart
+    :rtype: bool
+    """
+
+    def _run_frames(self, worker):
         # In game clock for _fps and time
         clock = pygame.time.Clock()
         # Defines if the game is done
@@ -58,7 +81,14 @@ class Controller:
         ANIMATE = pygame.USEREVENT + 1
         game_over_countdown = self._fps * 5
         pygame.time.set_timer(ANIMATE, 300)
+        # Fixed time step, the model ticks as many times as the time since the last frame calls for
+        tick_length = 1 / self._fps
+        accumulator = tick_length
+        previous_time = time.perf_counter()
+        if config.profiler_csv is not None and not profiler.writing_csv():
+            profiler.open_csv(config.profiler_csv)
         while not done:
+            profiler.start("EVENTS")
             for game_event in pygame.event.get():
                 # Checks if quit
                 if game_event.type == pygame.QUIT:
@@ -67,34 +97,92 @@ class Controller:
                     # Pauses game
                     if game_event.key == pygame.K_ESCAPE:
                         paused = not paused
+                    # Shows or hides the profiler
+                    elif game_event.key == pygame.K_F3:
+                        profiler.toggle_overlay()
                     # Goes back to menu
                     elif game_event.key == pygame.K_BACKSPACE and paused:
                         return True
                 # Animates sprites
                 if game_event.type == ANIMATE:
                     self._view.animate()
+            profiler.stop("EVENTS")
+            current_time = time.perf_counter()
+            accumulator += current_time - previous_time
+            previous_time = current_time
             # Grabs the keys currently pressed down
-            keys = pygame.key.get_pressed()
-            # Moves the player and ticks
+            keys = self._parse_keys(pygame.key.get_pressed())
+            # Number of ticks the time since the last frame calls for
+            ticks = 0
             if not paused:
-                self._model.move_player(self._parse_keys(keys))
-                self._model.tick()
+                while accumulator >= tick_length and ticks < config.max_ticks_per_frame:
+                    accumulator -= tick_length
+                    ticks += 1
+                # Too far behind to catch up, drops the missed time instead of falling further behind
+                if ticks == config.max_ticks_per_frame:
+                    accumulator = min(accumulator, tick_length)
             else:
                 self._model.pause()
-            # Renders the _view and removes lasting effects
-            self._view.render(self._model.get_player(), self._model.get_projectiles(),
-                              self._model.get_ships(), self._model.get_effects())
-            self._model.remove_effects()
-            if self._model.is_game_over():
-                game_over_countdown -= 1
-                if game_over_countdown == 0:
+                accumulator = 0
+            if worker is None:
+                # Moves the player and ticks, then renders the _view
+                game_over_countdown -= self._tick(keys, ticks)
+                if game_over_countdown <= 0:
                     return True
+                self._view.render(*self._model.get_snapshot())
+            else:
+                # Ticks the next frame while this one is drawn from a copy
+                snapshot = self._model.get_snapshot()
+                ticking = worker.submit(self._tick, keys, ticks)
+                self._view.render(*snapshot)
             self._view.render_fps(int(clock.get_fps()))
+            if profiler.show_overlay:
+                self._view.render_profiler()
             # Updates display
-            pygame.display.update()
+            profiler.start("UPDATE")
+            self._view.update_display()
+            profiler.stop("UPDATE")
+            if worker is not None:
+                game_over_countdown -= ticking.result()
+                if game_over_countdown <= 0:
+                    return True
+            profiler.end_frame(self._model.get_counts())
             clock.tick(self._fps)
         return False
 
+    """Advances effects, moves the player with the given keys, and ticks the model, the given number of times. Effects
+    advance once a tick, as they do in headless replays, however many ticks a frame runs.
+
+    :param keys: directions held down
+    :type keys: [Direction]
+    :param ticks: number of ticks to run
+    :type ticks: int
+    :returns: number of the ticks run with the game over
+    :rtype: int
+    """
+
+    def _tick(self, keys, ticks):
+        game_over_ticks = 0
+        for _ in range(ticks):
+            self._advance_effects()
+            profiler.start("INPUT")
+            if self._recorder is not None:
+                self._recorder.record(keys)
+            self._model.move_player(keys)
+            profiler.stop("INPUT")
+            self._model.tick()
+            if self._model.is_game_over():
+                game_over_ticks += 1
+        return game_over_ticks
+
+    """Advances effects by a tick.
+    """
+
+    def _advance_effects(self):
+        profiler.start("EFFECTS")
+        self._model.remove_effects()
+        profiler.stop("EFFECTS")
+
     """Takes in a list of Pygame keys and returns a list of directions for the _model.
 
     :param keys: Keys to parse
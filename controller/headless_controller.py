@@ -0,0 +1,65 @@
+import time
+
+from utils.profiler import profiler
+
+"""Controller that runs the model without a view, display, or audio device. Inputs come from an input policy instead of
+the keyboard and ticks run back to back as fast as possible.
+"""
+
+
+class HeadlessController:
+    """Constructor that takes in the model to run and the policy to get inputs from.
+
+    :param model: the model to tick, made with headless set
+    :type model: Model
+    :param policy: policy that gives the directions to hold each tick
+    :type policy: RandomPolicy or ScriptedPolicy
+    """
+
+    def __init__(self, model, policy):
+        self._model = model
+        self._policy = policy
+        # Ticks run so far
+        self.ticks = 0
+        # Seconds spent running ticks so far
+        self.elapsed = 0
+
+    """Runs the game until it is over or the given number of ticks have passed.
+
+    :param max_ticks: most ticks to run, or None to run until the game is over
+    :type max_ticks: int or None
+    :returns: number of ticks run
+    :rtype: int
+    """
+
+    def run_game(self, max_ticks=None):
+        start = time.perf_counter()
+        ticks = 0
+        while not self._model.is_game_over() and (max_ticks is None or ticks < max_ticks):
+            self.tick()
+            ticks += 1
+        self.elapsed += time.perf_counter() - start
+        return ticks
+
+    """Returns the model being run.
+
+    :returns: the model
+    :rtype: Model
+    """
+
+    def get_model(self):
+        return self._model
+
+    """Runs a single tick, advancing effects and moving the player in the same order the game does each tick.
+    """
+
+    def tick(self):
+        profiler.start("EFFECTS")
+        self._model.remove_effects()
+        profiler.stop("EFFECTS")
+        profiler.start("INPUT")
+        self._model.move_player(self._policy.get_directions(self._model))
+        profiler.stop("INPUT")
+        self._model.tick()
+        profiler.end_frame(self._model.get_counts())
+        self.ticks += 1
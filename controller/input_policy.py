@@ -0,0 +1,95 @@
+import random
+
+from utils.direction import Direction
+
+"""Input policies that stand in for the keyboard when the game runs headless. Each policy is asked once per tick for
+the directions the player is holding down.
+"""
+
+
+class RandomPolicy:
+    # Movement choices, including standing still and diagonals
+    _movements = [[], [Direction.UP], [Direction.DOWN], [Direction.LEFT], [Direction.RIGHT],
+                  [Direction.UP, Direction.LEFT], [Direction.UP, Direction.RIGHT],
+                  [Direction.DOWN, Direction.LEFT], [Direction.DOWN, Direction.RIGHT]]
+
+    """Constructor for a policy that wanders around and fires at random.
+
+    :param seed: seed for the policy's own random generator, kept apart from the game's
+    :type seed: int or None
+    :param hold: number of ticks to hold a movement before picking a new one
+    :type hold: int
+    :param fire_chance: chance of holding the fire key on a tick
+    :type fire_chance: float
+    """
+
+    def __init__(self, seed=None, hold=15, fire_chance=.9):
+        self._random = random.Random(seed)
+        self._hold = hold
+        self._fire_chance = fire_chance
+        self._movement = []
+        self._ticks = 0
+
+    """Returns the directions to give the model this tick.
+
+    :param model: model being played
+    :type model: Model
+    :returns: list of directions
+    :rtype: [Direction]
+    """
+
+    def get_directions(self, model):
+        if self._ticks % self._hold == 0:
+            self._movement = self._random.choice(self._movements)
+        self._ticks += 1
+        result = list(self._movement)
+        if self._random.random() < self._fire_chance:
+            result.append(Direction.FIRE)
+        return result
+
+
+class ScriptedPolicy:
+    """Constructor for a policy that plays back a fixed list of inputs.
+
+    :param script: directions to give on each tick
+    :type script: [[Direction]]
+    :param loop: if the script starts over once it runs out, otherwise no keys are held after it ends
+    :type loop: bool
+    """
+
+    def __init__(self, script, loop=True):
+        self._script = script
+        self._loop = loop
+        self._ticks = 0
+
+    """Returns the directions to give the model this tick.
+
+    :param model: model being played
+    :type model: Model
+    :returns: list of directions
+    :rtype: [Direction]
+    """
+
+    def get_directions(self, model):
+        index = self._ticks
+        self._ticks += 1
+        if self._loop and self._script:
+            index %= len(self._script)
+        elif index >= len(self._script):
+            return []
+        return list(self._script[index])
+
+    """Makes a scripted policy from a list of lists of direction names, such as one loaded from a JSON file.
+
+    :param names: names of the directions to give on each tick
+    :type names: [[str]]
+    :param loop: if the script starts over once it runs out
+    :type loop: bool
+    :returns: the scripted policy
+    :rtype: ScriptedPolicy
+    :raises: KeyError if a name is not a Direction
+    """
+
+    @staticmethod
+    def from_names(names, loop=True):
+        return ScriptedPolicy([[Direction[name] for name in step] for step in names], loop)
@@ -0,0 +1,96 @@
+import json
+
+from controller.input_policy import ScriptedPolicy
+from utils.direction import Direction
+from utils.ids.difficulty_id import DifficultyID
+from utils.ids.game_id import GameID
+from utils.ids.gamemode_id import GameModeID
+from utils.ids.player_id import PlayerID
+from utils.ids.weapon_id import WeaponID
+
+"""Records the directions held on every tick of a game, along with its settings and the seed of its random number
+stream. Playing the recording back headless with the same seed runs the exact same game, so changes can be timed
+against an identical workload.
+"""
+
+
+class InputRecorder:
+    """Constructor to make an empty recording.
+
+    :param game_mode: Game mode played
+    :type game_mode: GameModeID or GameID
+    :param difficulty: Difficulty of the game
+    :type difficulty: DifficultyID
+    :param ship: Ship the player flies
+    :type ship: PlayerID
+    :param weapon: Weapon the player starts with
+    :type weapon: WeaponID
+    :param seed: seed of the game's random number stream
+    :type seed: int
+    """
+
+    def __init__(self, game_mode, difficulty, ship, weapon, seed):
+        self.game_mode = game_mode
+        self.difficulty = difficulty
+        self.ship = ship
+        self.weapon = weapon
+        self.seed = seed
+        # Directions held on each tick
+        self.inputs = []
+        # Final score, known once the recording is saved or loaded
+        self.score = None
+
+    """Records the directions given to the model for a tick.
+
+    :param directions: directions held down
+    :type directions: [Direction]
+    """
+
+    def record(self, directions):
+        self.inputs.append(list(directions))
+
+    """Returns a policy that plays the recorded directions back once.
+
+    :returns: the policy
+    :rtype: ScriptedPolicy
+    """
+
+    def get_policy(self):
+        return ScriptedPolicy(self.inputs, loop=False)
+
+    """Writes the recording to a JSON file.
+
+    :param path: file to write to
+    :type path: str
+    :param score: final score of the game, to check a playback against
+    :type score: int or None
+    """
+
+    def save(self, path, score=None):
+        self.score = score
+        recording = {"MODE": self.game_mode.name, "DIFFICULTY": self.difficulty.name, "SHIP": self.ship.name,
+                     "WEAPON": self.weapon.name, "SEED": self.seed, "SCORE": score,
+                     "INPUTS": [[direction.name for direction in directions] for directions in self.inputs]}
+        with open(path, "w") as f:
+            json.dump(recording, f)
+
+    """Reads a recording from a JSON file.
+
+    :param path: file to read
+    :type path: str
+    :returns: the recording
+    :rtype: InputRecorder
+    :raises: KeyError if the file names a setting or direction that does not exist
+    """
+
+    @staticmethod
+    def load(path):
+        with open(path) as f:
+            recording = json.load(f)
+        mode = recording["MODE"]
+        game_mode = GameModeID[mode] if mode in GameModeID.__members__ else GameID[mode]
+        recorder = InputRecorder(game_mode, DifficultyID[recording["DIFFICULTY"]], PlayerID[recording["SHIP"]],
+                                 WeaponID[recording["WEAPON"]], recording["SEED"])
+        recorder.inputs = [[Direction[name] for name in directions] for directions in recording["INPUTS"]]
+        recorder.score = recording["SCORE"]
+        return recorder
@@ -80,8 +80,9 @@ class MenuController:
     outer_path = os.path.abspath(os.path.join(current_path, os.pardir))  # the View folder
     resource_path = os.path.join(outer_path, 'resources')  # the resource folder path
     music_path = os.path.join(resource_path, 'music')  # the music folder path
-    _tree = construct_tree()
-    _main_menu = _tree
+    # Menu tree shared by every menu controller, built when the first one is made
+    _main_menu = None
+
     """Constructor that takes in a view to run the menus.
 
     :param menus: the menu view
@@ -91,6 +92,9 @@ class MenuController:
     """
 
     def __init__(self, menus, model):
+        if MenuController._main_menu is None:
+            MenuController._main_menu = construct_tree()
+        self._tree = self._main_menu
         self._menus = menus
         self._model = model
         self._fps = config.game_fps
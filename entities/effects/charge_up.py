@@ -8,6 +8,7 @@ class ChargeUp(Effect):
     # Charge delay in frames
     charge_frames = 20
     charge_delay = charge_frames * int(config.game_fps / 30) - 1
+    __slots__ = ()
 
     """Constructor to make the explosion.
 
@@ -3,6 +3,9 @@
 
 
 class Effect:
+    # Fixed set of attributes instead of a per instance __dict__
+    __slots__ = ("x", "y", "entity_id", "curr_frame", "max_frame", "frame_multiplier")
+
     """Constructor to make the Effect.
 
     :param x: x coordinate of effect
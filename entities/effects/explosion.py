@@ -5,6 +5,7 @@ from utils import config
 
 
 class Explosion(Effect):
+    __slots__ = ()
 
     """Constructor to make the explosion.
 
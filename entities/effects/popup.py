@@ -7,6 +7,8 @@ from utils.ids.effect_id import EffectID
 
 
 class PopUp(Effect):
+    __slots__ = ("text", "center_x", "center_y")
+
     """Constructor to make the Effect.
 
     :param text: what text to render
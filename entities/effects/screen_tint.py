@@ -6,6 +6,8 @@ from utils import config
 
 
 class ScreenTint(Effect):
+    __slots__ = ()
+
     """Constructor to make the Effect.
 
     :param x: x coordinate of effect
@@ -0,0 +1,50 @@
+from entities.effects.explosion import Explosion
+from entities.projectiles.bullet import Bullet
+from entities.projectiles.diamond_dust import DiamondDust
+from entities.projectiles.missile import Missile
+from entities.projectiles.pulse import Pulse
+from utils.object_pool import ObjectPool
+
+"""Pools for the projectiles and effects made and thrown away the most often. Acquire from the pool for the class
+and release objects once they are removed from the game.
+"""
+
+bullets = ObjectPool(Bullet)
+missiles = ObjectPool(Missile)
+diamond_dust = ObjectPool(DiamondDust)
+pulses = ObjectPool(Pulse)
+explosions = ObjectPool(Explosion)
+
+_pools = {Bullet: bullets, Missile: missiles, DiamondDust: diamond_dust, Pulse: pulses, Explosion: explosions}
+
+"""Hands an entity back to the pool for its class. Entities without a pool are left to the garbage collector.
+
+:param entity: projectile or effect that was removed from the game
+:type entity: Projectile or Effect
+"""
+
+
+def release(entity):
+    pool = _pools.get(type(entity))
+    if pool is not None:
+        pool.release(entity)
+
+
+"""Forgets the objects in use in every pool, such as when a new model replaces one that was not cleared.
+"""
+
+
+def reset():
+    for pool in _pools.values():
+        pool.reset()
+
+
+"""Returns the stats of every pool.
+
+:returns: stats of each pool by class name
+:rtype: {str: {str: int}}
+"""
+
+
+def get_stats():
+    return {cls.__name__.upper(): pool.get_stats() for cls, pool in _pools.items()}
@@ -7,6 +7,8 @@ from utils.ids.projectile_id import ProjectileID
 
 
 class Bullet(Projectile):
+    __slots__ = ("direction", "x_change", "y_change")
+
     """Constructor that initializes the bullet.
 
     :param direction: angle the bullet should be going
@@ -1,6 +1,5 @@
-import random
-
 from entities.projectiles.projectile import Projectile
+from utils import game_random
 
 """A really bad missile. Is currently the behavior for the weapon Diamond Dust.
 Was the initial buggy missile behavior that I turned into a feature and made more random and bad.
@@ -8,6 +7,8 @@ Was the initial buggy missile behavior that I turned into a feature and made mor
 
 
 class DiamondDust(Projectile):
+    __slots__ = ("direction", "orientation", "target")
+
     """Constructor that initializes the missile.
 
     :param direction: angle the missile should be going
@@ -39,10 +40,10 @@ class DiamondDust(Projectile):
     """
 
     def move(self):
-        random_speed = random.randint(1, 3 * self.speed)
-        random_direction = random.randint(-180, 180)
+        random_speed = game_random.stream.randint(1, 3 * self.speed)
+        random_direction = game_random.stream.randint(-180, 180)
         self.direction = random_direction
-        random_x = random.randint(5 * -self.speed, 5 * self.speed)
+        random_x = game_random.stream.randint(5 * -self.speed, 5 * self.speed)
         self.x += random_x
         self.y += random_speed * self.orientation
         if self.target is not None:
@@ -8,6 +8,8 @@ from utils.ids.projectile_id import ProjectileID
 
 
 class Missile(Projectile):
+    __slots__ = ("direction", "orientation", "target", "ticks", "x_change", "y_change")
+
     """Constructor that initializes the missile.
 
     :param direction: angle the bullet should be going
@@ -4,6 +4,10 @@ from utils import config
 
 
 class Projectile:
+    # Fixed set of attributes instead of a per instance __dict__
+    __slots__ = ("speed", "x", "y", "size", "damage", "entity_id", "has_splash", "air_burst", "target_destroyed",
+                 "remove_if_offscreen")
+
     """Initializes the projectile.
 
     :param speed: speed of the projectile
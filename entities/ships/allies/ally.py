@@ -1,13 +1,8 @@
 import math
-import random
 
-import pygame
-
-from entities.projectiles.bullet import Bullet
-from entities.projectiles.diamond_dust import DiamondDust
-from entities.projectiles.missile import Missile
+from entities import pools
 from entities.ships.ship import Ship
-from utils import config
+from utils import config, game_random
 from utils.ids.player_id import PlayerID
 from utils.ids.projectile_id import ProjectileID
 
@@ -16,6 +11,9 @@ from utils.ids.projectile_id import ProjectileID
 
 
 class Ally(Ship):
+    __slots__ = ("entity_id", "score", "ticks", "ready_to_fire", "fire_rate", "fire_variance", "projectile_type",
+                 "projectile_speed", "projectile_damage")
+
     """Constructs the ally.
     """
 
@@ -59,16 +57,18 @@ class Ally(Ship):
         if self.size > config.ship_size:
             x_pos = self.x + ((self.size - default_size) // 2)
             y_pos = self.y + ((self.size - default_size) // 2)
-        offset = random.randint(-self.fire_variance, self.fire_variance)
+        offset = game_random.stream.randint(-self.fire_variance, self.fire_variance)
         angle = self.angle + 90 + offset
         weapon_type = self.projectile_type
-        projectile = Bullet(self.projectile_speed, x_pos, y_pos, angle + offset, self.projectile_damage, weapon_type)
         if weapon_type == ProjectileID.FRIENDLY_MISSILE:
-            projectile = Missile(self.projectile_speed, x_pos, y_pos, angle, self.projectile_damage, weapon_type,
-                                 target)
+            projectile = pools.missiles.acquire(self.projectile_speed, x_pos, y_pos, angle, self.projectile_damage,
+                                                weapon_type, target)
         elif weapon_type == ProjectileID.DIAMOND_DUST:
-            projectile = DiamondDust(self.projectile_speed, x_pos, y_pos, angle, self.projectile_damage,
-                                     ProjectileID.ENEMY_BULLET, target)
+            projectile = pools.diamond_dust.acquire(self.projectile_speed, x_pos, y_pos, angle,
+                                                    self.projectile_damage, ProjectileID.ENEMY_BULLET, target)
+        else:
+            projectile = pools.bullets.acquire(self.projectile_speed, x_pos, y_pos, angle + offset,
+                                               self.projectile_damage, weapon_type)
 
         projectiles.append(projectile)
 
@@ -90,13 +90,7 @@ class Ally(Ship):
         y_dist = self.y - y
         x_dist = self.x - x
         target_angle = -int(math.degrees(math.atan2(y_dist, x_dist))) + 90
-        if abs(self.angle - target_angle) > self.rotation_speed:
-            v1 = pygame.math.Vector2()
-            v1.from_polar((1, self.angle))
-            v2 = pygame.math.Vector2()
-            v2.from_polar((1, target_angle))
-            angle_change = -self.rotation_speed if v1.angle_to(v2) < 0 else self.rotation_speed
-            self.angle += angle_change
+        self._turn_towards(target_angle)
 
     """Rotates the ship towards its waypoint.
         """
@@ -111,6 +105,6 @@ class Ally(Ship):
         """
 
     def _generate_pos(self):
-        x = random.randint(config.ship_size, config.display_width - (2 * config.ship_size))
-        y = random.randint(config.display_height // 2, config.display_height - config.ship_size)
+        x = game_random.stream.randint(config.ship_size, config.display_width - (2 * config.ship_size))
+        y = game_random.stream.randint(config.display_height // 2, config.display_height - config.ship_size)
         return x, y
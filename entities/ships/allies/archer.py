@@ -10,6 +10,8 @@ from utils.ids.projectile_id import ProjectileID
 
 
 class Archer(Ally):
+    __slots__ = ()
+
     """Constructs the Archer.
     """
 
@@ -1,4 +1,5 @@
 from entities.ships.allies.ally import Ally
+from entities.ships.turret_mount import TurretMount
 from utils import config, enemy_generator
 from utils.ids.ally_id import AllyID
 from utils.ids.projectile_id import ProjectileID
@@ -9,6 +10,8 @@ from utils.ids.projectile_id import ProjectileID
 class Longsword(Ally):
     # Number of ships it spawns
     ships_spawned = 1
+    __slots__ = ("_turrets", "_effects", "_ships_spawned_total")
+
     """Constructor to make the Longsword ship
 
     :param x: starting x coordinate of ship
@@ -39,7 +42,7 @@ class Longsword(Ally):
         self.entity_id = AllyID.LONGSWORD
         self.projectile_type = ProjectileID.FRIENDLY_MISSILE
         self.fire_variance = 60
-        self._turrets = []
+        self._turrets = TurretMount(self)
         self._effects = effects
         self._ships_spawned_total = 0
 
@@ -54,10 +57,9 @@ class Longsword(Ally):
                 archer = enemy_generator.generate_enemy(AllyID.ARCHER, x_pos, y_pos, hp=self.hp + self.shield,
                                                         fire_rate=config.game_fps // 2)
                 archer.projectile_damage = 8
-                archer.remove_if_offscreen = False
-                self._turrets.append(archer)
+                self._turrets.attach(archer)
             x_pos += config.ship_size
-        return self._turrets
+        return self._turrets.turrets
 
     """Doesn't rotate at all.
     """
@@ -69,23 +71,15 @@ class Longsword(Ally):
     """
     def move(self):
         if self.speed > 0:
-            x_change = 0
             if self.x < self.waypoint.x - self.speed:
                 self.x += self.speed
-                x_change += self.speed
             elif self.x > self.waypoint.x + self.speed:
                 self.x -= self.speed
-                x_change -= self.speed
-            y_change = 0
             if self.y < self.waypoint.y - self.speed:
                 self.y += self.speed
-                y_change += self.speed
             elif self.y > self.waypoint.y + self.speed:
                 self.y -= self.speed
-                y_change -= self.speed
-            for turret in self._turrets:
-                turret.x += x_change
-                turret.y += y_change
+            self._turrets.follow()
 
     """Longsword doesn't do anything when firing.
 
@@ -103,12 +97,9 @@ class Longsword(Ally):
 
     def damage(self, damage):
         super().damage(damage)
-        for turret in self._turrets:
-            turret.damage(damage)
+        self._turrets.damage(damage)
 
     """Kills all of its turrets if offscreen.
     """
     def offscreen(self):
-        for turret in self._turrets:
-            turret.is_dead = True
-            turret.hp = 0
+        self._turrets.destroy()
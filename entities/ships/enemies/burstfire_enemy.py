@@ -5,6 +5,8 @@ from utils import config
 
 
 class BurstFireEnemy(Enemy):
+    __slots__ = ("_burst_curr", "_burst_max", "_reload_curr", "_reload_speed")
+
     """Constructor to make the enemy.
 
     :param ship_size: size the ship is
@@ -8,6 +8,8 @@ from utils.ids.projectile_id import ProjectileID
 
 
 class Despoiler(BurstFireEnemy):
+    __slots__ = ()
+
     """Constructor to make the Despoiler ship
 
     :param x: starting x coordinate of ship
@@ -1,13 +1,8 @@
-import random
-
+from entities import pools
 from entities.effects.charge_up import ChargeUp
-from entities.projectiles.bullet import Bullet
-from entities.projectiles.diamond_dust import DiamondDust
-from entities.projectiles.missile import Missile
-from entities.projectiles.pulse import Pulse
 from entities.ships.ship import Ship
 from model.stats import ship_stats
-from utils import config
+from utils import config, game_random
 from utils.ids.effect_id import EffectID
 from utils.ids.projectile_id import ProjectileID
 
@@ -15,7 +10,9 @@ from utils.ids.projectile_id import ProjectileID
 
 
 class Enemy(Ship):
-    random.seed()
+    __slots__ = ("entity_id", "score", "ticks", "ready_to_fire", "fire_rate", "fire_variance", "projectile_type",
+                 "projectile_speed", "projectile_damage")
+
     """Constructor to make the enemy.
 
     :param ship_size: size the ship is
@@ -67,8 +64,8 @@ class Enemy(Ship):
     :rtype: (int, int)
     """
     def _generate_pos(self):
-        x = random.randint(0, config.display_width - self.size)
-        y = random.randint(0, -self.size // 2 + config.display_height // 2)
+        x = game_random.stream.randint(0, config.display_width - self.size)
+        y = game_random.stream.randint(0, -self.size // 2 + config.display_height // 2)
         return x, y
 
     """Fires projectiles from the enemy to the given target, at the given speed, damage, and size.
@@ -93,18 +90,20 @@ class Enemy(Ship):
         if self.size > config.ship_size:
             x_pos = self.x + ((self.size - default_size) // 2)
             y_pos = self.y + ((self.size - default_size) // 2)
-        offset = random.randint(-self.fire_variance, self.fire_variance)
+        offset = game_random.stream.randint(-self.fire_variance, self.fire_variance)
         angle = self.angle - 90 + offset
         weapon_type = self.projectile_type
-        projectile = Bullet(self.projectile_speed, x_pos, y_pos, angle + offset, self.projectile_damage, weapon_type)
         if weapon_type == ProjectileID.ENEMY_MISSILE:
-            projectile = Missile(self.projectile_speed, x_pos, y_pos, angle, self.projectile_damage, weapon_type,
-                                 target)
+            projectile = pools.missiles.acquire(self.projectile_speed, x_pos, y_pos, angle, self.projectile_damage,
+                                                weapon_type, target)
         elif weapon_type == ProjectileID.DIAMOND_DUST:
-            projectile = DiamondDust(self.projectile_speed, x_pos, y_pos, angle, self.projectile_damage,
-                                     ProjectileID.ENEMY_BULLET, target)
+            projectile = pools.diamond_dust.acquire(self.projectile_speed, x_pos, y_pos, angle,
+                                                    self.projectile_damage, ProjectileID.ENEMY_BULLET, target)
         elif weapon_type == ProjectileID.PULSE:
             projectile = self._fire_pulse(target)
+        else:
+            projectile = pools.bullets.acquire(self.projectile_speed, x_pos, y_pos, angle + offset,
+                                               self.projectile_damage, weapon_type)
         projectiles.append(projectile)
         return projectile
 
@@ -118,9 +117,9 @@ class Enemy(Ship):
     def _fire_pulse(self, target):
         radius = config.ship_size * 1.5 // 2
         offset = target.size // 2
-        rand_x = random.randint(-self.fire_variance, self.fire_variance)
-        rand_y = random.randint(-self.fire_variance, self.fire_variance)
-        projectile = Pulse(self.projectile_speed, target.x + rand_x + offset - radius, target.y + rand_y +
+        rand_x = game_random.stream.randint(-self.fire_variance, self.fire_variance)
+        rand_y = game_random.stream.randint(-self.fire_variance, self.fire_variance)
+        projectile = pools.pulses.acquire(self.projectile_speed, target.x + rand_x + offset - radius, target.y + rand_y +
                            offset - radius,
                            self.projectile_damage, radius)
         charge = ChargeUp(projectile.x + projectile.size / 2, projectile.y + projectile.size / 2, EffectID.RED_AOE)
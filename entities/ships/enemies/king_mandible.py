@@ -8,6 +8,8 @@ from utils.ids.projectile_id import ProjectileID
 
 
 class KingMandible(BurstFireEnemy):
+    __slots__ = ("_phase", "_fire_angle")
+
     """Constructor to make the enemy.
 
     :param x: starting x coordinate of ship
@@ -6,6 +6,8 @@ from utils.ids.enemy_id import EnemyID
 
 
 class Mandible(Enemy):
+    __slots__ = ()
+
     """Constructor to make the enemy.
 
     :param ship_size: size the ship is
@@ -7,6 +7,8 @@ from utils.ids.projectile_id import ProjectileID
 
 
 class Mosquito(Enemy):
+    __slots__ = ()
+
     """Constructor to make the enemy.
 
     :param x: starting x coordinate of ship
@@ -9,6 +9,8 @@ from utils.ids.projectile_id import ProjectileID
 class Mothership(Enemy):
     # How many ships it spawns:
     ships_spawned = 2
+    __slots__ = ("_ai", "max_spawns", "total_spawned")
+
     """Constructor to make the Mothership
 
     :param x: starting x coordinate of ship
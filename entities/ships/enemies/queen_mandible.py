@@ -8,6 +8,8 @@ from utils.ids.projectile_id import ProjectileID
 
 
 class QueenMandible(Enemy):
+    __slots__ = ("_ai", "_phase", "ships_spawned")
+
     """Constructor to make the Queen Mandible.
 
     :param x: starting x coordinate of ship
@@ -11,6 +11,8 @@ from utils.ids.projectile_id import ProjectileID
 
 
 class Terminus(Enemy):
+    __slots__ = ("effects",)
+
     """Constructor to make the Terminus ship
 
     :param x: starting x coordinate of ship
@@ -1,4 +1,5 @@
 from entities.ships.enemies.enemy import Enemy
+from entities.ships.turret_mount import TurretMount
 from utils import config, enemy_generator
 from utils.ids.enemy_id import EnemyID
 from utils.ids.projectile_id import ProjectileID
@@ -7,6 +8,8 @@ from utils.ids.projectile_id import ProjectileID
 
 
 class Titan(Enemy):
+    __slots__ = ("_ai", "_turrets", "_effects")
+
     """Constructor to make the Titan ship
 
     :param x: starting x coordinate of ship
@@ -38,7 +41,7 @@ class Titan(Enemy):
         self.projectile_type = ProjectileID.ENEMY_MISSILE
         self.fire_variance = 45
         self._ai = ai
-        self._turrets = []
+        self._turrets = TurretMount(self)
         self._effects = effects
 
     """Spawns turrets for itself.
@@ -82,10 +85,9 @@ class Titan(Enemy):
                                                   hp=self.max_hp, shield=self.max_shield, fire_rate=self.fire_rate // 4,
                                                   effects=self._effects)
         terminus.projectile_damage = 20
-        self._turrets = [mantis1, mantis2, mantis3, mantis4, mantis5, mantis6, mantis7, terminus]
-        for turret in self._turrets:
-            turret.remove_if_offscreen = False
-        return self._turrets
+        for turret in [mantis1, mantis2, mantis3, mantis4, mantis5, mantis6, mantis7, terminus]:
+            self._turrets.attach(turret)
+        return self._turrets.turrets
 
     """Doesn't rotate at all.
     """
@@ -100,8 +102,7 @@ class Titan(Enemy):
         # Just moves down:
         if self.y != -self.size // 4:
             self.y += self.speed
-            for turret in self._turrets:
-                turret.y += self.speed
+            self._turrets.follow()
 
     """Despoiler fires multiple missiles at the target.
 
@@ -130,5 +131,4 @@ class Titan(Enemy):
 
     def damage(self, damage):
         super().damage(damage)
-        for turret in self._turrets:
-            turret.damage(damage)
+        self._turrets.damage(damage)
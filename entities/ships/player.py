@@ -6,6 +6,8 @@ from entities.ships.ship import Ship
 
 
 class Player(Ship):
+    __slots__ = ("entity_id", "score", "hits_taken", "damage_taken")
+
     """Constructor to make the player ship
 
     :param x: starting x coordinate of player
@@ -1,9 +1,6 @@
 import math
-import random
 
-import pygame
-
-from utils import config
+from utils import config, game_random
 
 # Constants for state of movement and rotations
 NO_WAYPOINT = 1
@@ -16,7 +13,38 @@ MOVE_AND_FIRE_WAYPOINT = 4
 
 
 class Ship:
-    random.seed()
+    # Fixed set of attributes instead of a per instance __dict__
+    __slots__ = ("speed", "x", "y", "end_x", "end_y", "size", "angle", "hp", "max_hp", "shield", "max_shield",
+                 "shield_recharge_rate", "shield_delay", "shield_recharge", "is_damaged", "is_dead", "waypoint",
+                 "_wp_state", "wp_done", "remove_if_offscreen", "stealth", "rotation_speed", "ship_effects")
+    # Rotation states, names of the methods so subclasses overriding them are still used
+    _wp_rotation_names = {NO_WAYPOINT: "_rotate",
+                          MOVE_WAYPOINT: "_rotate",
+                          FIRE_WAYPOINT: "_rotate_to_wp",
+                          MOVE_AND_FIRE_WAYPOINT: "_rotate_to_wp"
+                          }
+    # Movement states
+    _wp_movement_names = {NO_WAYPOINT: "_move",
+                          MOVE_WAYPOINT: "_move_to_wp",
+                          FIRE_WAYPOINT: "_move",
+                          MOVE_AND_FIRE_WAYPOINT: "_move_to_wp"
+                          }
+
+    """Looks up the methods of each waypoint state for a subclass, so ticks call them without looking up names.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._set_wp_tables()
+
+    """Fills in the methods the class rotates and moves with in each waypoint state, including ones it overrides.
+    """
+
+    @classmethod
+    def _set_wp_tables(cls):
+        cls._wp_rotations = {state: getattr(cls, name) for state, name in cls._wp_rotation_names.items()}
+        cls._wp_movement = {state: getattr(cls, name) for state, name in cls._wp_movement_names.items()}
+
     """Constructor to make the ship.
 
     :param x: starting x coordinate of ship
@@ -67,19 +95,6 @@ class Ship:
         # Current waypoint
         self.waypoint = None
         self._wp_state = NO_WAYPOINT
-
-        # Rotation states
-        self._wp_rotations = {NO_WAYPOINT: self._rotate,
-                              MOVE_WAYPOINT: self._rotate,
-                              FIRE_WAYPOINT: self._rotate_to_wp,
-                              MOVE_AND_FIRE_WAYPOINT: self._rotate_to_wp
-                              }
-        # Movement states
-        self._wp_movement = {NO_WAYPOINT: self._move,
-                             MOVE_WAYPOINT: self._move_to_wp,
-                             FIRE_WAYPOINT: self._move,
-                             MOVE_AND_FIRE_WAYPOINT: self._move_to_wp
-                             }
         # If done moving to the waypoint, True by default
         self.wp_done = True
         # If it should be removed when offscreen
@@ -109,13 +124,24 @@ class Ship:
         y_dist = self.y - y
         x_dist = self.x - x
         target_angle = -int(math.degrees(math.atan2(y_dist, x_dist))) - 90
+        self._turn_towards(target_angle)
+
+    """Turns the ship by its rotation speed towards the given angle, unless it is already within a turn of it. The
+    way to turn is decided by comparing the polar angles of both directions the same way pygame's Vector2.angle_to
+    does, without wrapping the difference around, but with plain math instead of building two vectors every tick.
+
+    :param target_angle: angle to face
+    :type target_angle: int
+    """
+
+    def _turn_towards(self, target_angle):
         if abs(self.angle - target_angle) > self.rotation_speed:
-            v1 = pygame.math.Vector2()
-            v1.from_polar((1, self.angle))
-            v2 = pygame.math.Vector2()
-            v2.from_polar((1, target_angle))
-            angle_change = -self.rotation_speed if v1.angle_to(v2) < 0 else self.rotation_speed
-            self.angle += angle_change
+            angle = self.angle * math.pi / 180
+            target = target_angle * math.pi / 180
+            if math.atan2(math.sin(target), math.cos(target)) < math.atan2(math.sin(angle), math.cos(angle)):
+                self.angle -= self.rotation_speed
+            else:
+                self.angle += self.rotation_speed
 
     """Rotates the ship depending on its current state.
     
@@ -125,7 +151,7 @@ class Ship:
 
     def rotate(self, target):
         if target is not None:
-            self._wp_rotations[self._wp_state](target)
+            self._wp_rotations[self._wp_state](self, target)
 
     """Rotates the ship towards its waypoint.
     """
@@ -165,7 +191,8 @@ class Ship:
             # Makes sure it caps to account for rounding errors
             if self.shield > self.max_shield:
                 self.shield = self.max_shield
-        self.ship_effects[:] = [effect for effect in self.ship_effects if effect.animate()]
+        if self.ship_effects:
+            self.ship_effects[:] = [effect for effect in self.ship_effects if effect.animate()]
 
     """Sets the ship's waypoint.
     
@@ -195,7 +222,7 @@ class Ship:
     """
 
     def move(self):
-        self._wp_movement[self._wp_state]()
+        self._wp_movement[self._wp_state](self)
 
     """Moves the ship randomly to a generated position on the screen.
     """
@@ -258,8 +285,8 @@ class Ship:
     """
 
     def _generate_pos(self):
-        x = random.randint(config.ship_size, config.display_width - (2 * config.ship_size))
-        y = random.randint(0, config.display_height - config.ship_size)
+        x = game_random.stream.randint(config.ship_size, config.display_width - (2 * config.ship_size))
+        y = game_random.stream.randint(0, config.display_height - config.ship_size)
         return x, y
 
     """Spins the ship in circles.
@@ -275,3 +302,7 @@ class Ship:
 
     def offscreen(self):
         pass
+
+
+# Subclasses fill in their own tables as they are made
+Ship._set_wp_tables()
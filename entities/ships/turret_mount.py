@@ -0,0 +1,64 @@
+"""Turrets mounted on a larger ship, such as a Titan or Longsword. Each turret is kept at a fixed offset from the ship
+it is mounted on, so moving the ship moves every turret with it in one pass. Damage taken by the ship is passed on to
+its turrets, and they are destroyed along with it. Turrets are still ships of their own that aim, fire, and can be hit
+separately.
+"""
+
+
+class TurretMount:
+    # Fixed set of attributes instead of a per instance __dict__
+    __slots__ = ("_parent", "_offsets", "turrets")
+
+    """Constructor to make a mount with no turrets.
+
+    :param parent: ship the turrets are mounted on
+    :type parent: Ship
+    """
+
+    def __init__(self, parent):
+        self._parent = parent
+        # Offset of each turret from the top left corner of the parent
+        self._offsets = []
+        self.turrets = []
+
+    """Mounts a turret where it currently is relative to the parent. The turret stays on screen for as long as the
+    parent does.
+
+    :param turret: turret to mount
+    :type turret: Ship
+    """
+
+    def attach(self, turret):
+        turret.remove_if_offscreen = False
+        self._offsets.append((turret.x - self._parent.x, turret.y - self._parent.y))
+        self.turrets.append(turret)
+
+    """Moves every turret to its place on the parent.
+    """
+
+    def follow(self):
+        x = self._parent.x
+        y = self._parent.y
+        for turret, (offset_x, offset_y) in zip(self.turrets, self._offsets):
+            turret.x = x + offset_x
+            turret.y = y + offset_y
+
+    """Passes damage the parent took on to every turret, destroying them all if the parent died.
+
+    :param damage: damage the parent took
+    :type damage: int
+    """
+
+    def damage(self, damage):
+        for turret in self.turrets:
+            turret.damage(damage)
+        if self._parent.is_dead:
+            self.destroy()
+
+    """Destroys every turret, such as when the parent dies or leaves the screen.
+    """
+
+    def destroy(self):
+        for turret in self.turrets:
+            turret.is_dead = True
+            turret.hp = 0
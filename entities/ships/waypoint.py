@@ -4,6 +4,9 @@ from utils import config
 
 
 class Waypoint:
+    # Fixed set of attributes instead of a per instance __dict__
+    __slots__ = ("x", "y", "size", "is_dead")
+
     """Constructs the waypoint.
 
     :param x: x pos
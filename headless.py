@@ -0,0 +1,120 @@
+import argparse
+import json
+import random
+
+from controller.headless_controller import HeadlessController
+from controller.input_recorder import InputRecorder
+from controller.input_policy import RandomPolicy, ScriptedPolicy
+from model.model import Model
+from utils import config
+from utils.ids.difficulty_id import DifficultyID
+from utils.ids.gamemode_id import GameModeID
+from utils.ids.player_id import PlayerID
+from utils.ids.weapon_id import WeaponID
+from utils.profiler import profiler
+
+"""Runs the game without a window or sound, for balancing runs and benchmarks on machines without a display.
+
+Example:
+    python headless.py --mode CLASSIC --difficulty HARD --ship STORM --weapon FLAK_GUN --ticks 10000
+    python headless.py --replay recording.json
+"""
+
+
+"""Parses the command line arguments.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+:returns: parsed arguments
+:rtype: argparse.Namespace
+"""
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description="Runs " + config.game_title + " without a display or audio device.")
+    parser.add_argument("--mode", choices=[mode.name for mode in GameModeID], default=GameModeID.CLASSIC.name)
+    parser.add_argument("--difficulty", choices=[difficulty.name for difficulty in DifficultyID],
+                        default=DifficultyID.NORMAL.name)
+    parser.add_argument("--ship", choices=[ship.name for ship in PlayerID], default=config.player_ship.name)
+    parser.add_argument("--weapon", choices=[weapon.name for weapon in WeaponID], default=config.weapon.name)
+    parser.add_argument("--ticks", type=int, default=None, help="most ticks to run, runs until game over if not given")
+    parser.add_argument("--script", default=None,
+                        help="JSON file with a list of lists of direction names to hold each tick, "
+                             "random inputs are used if not given")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the game and the random input policy")
+    parser.add_argument("--replay", default=None,
+                        help="JSON file recorded with config.record_inputs to play back, its settings and seed are "
+                             "used instead of the other arguments")
+    parser.add_argument("--profile-csv", default=None, help="CSV file to write every tick's timings to")
+    return parser.parse_args(args)
+
+
+"""Builds a headless controller for the given settings.
+
+:param game_mode: Game mode to play
+:type game_mode: GameModeID
+:param difficulty: Difficulty of the game
+:type difficulty: DifficultyID
+:param ship: Ship the player flies
+:type ship: PlayerID
+:param weapon: Weapon the player uses
+:type weapon: WeaponID
+:param policy: policy that gives the player's inputs
+:type policy: RandomPolicy or ScriptedPolicy
+:param seed: seed for the game's random number stream, or None for an unseeded one
+:type seed: int or None
+:returns: the headless controller
+:rtype: HeadlessController
+"""
+
+
+def make_game(game_mode, difficulty, ship, weapon, policy, seed=None):
+    config.player_ship = ship
+    config.weapon = weapon
+    model = Model(difficulty, game_mode, headless=True, rng=random.Random(seed))
+    model.switch_weapon(weapon)
+    return HeadlessController(model, policy)
+
+
+"""Runs a headless game from the command line and prints how it went.
+
+:param args: arguments to parse, or None to use the ones the script was run with
+:type args: [str] or None
+"""
+
+
+def main(args=None):
+    args = parse_args(args)
+    recorder = None
+    if args.replay is not None:
+        recorder = InputRecorder.load(args.replay)
+        controller = make_game(recorder.game_mode, recorder.difficulty, recorder.ship, recorder.weapon,
+                               recorder.get_policy(), recorder.seed)
+        max_ticks = len(recorder.inputs)
+    else:
+        if args.script is None:
+            policy = RandomPolicy(args.seed)
+        else:
+            with open(args.script) as f:
+                policy = ScriptedPolicy.from_names(json.load(f))
+        controller = make_game(GameModeID[args.mode], DifficultyID[args.difficulty], PlayerID[args.ship],
+                               WeaponID[args.weapon], policy, args.seed)
+        max_ticks = args.ticks
+    if args.profile_csv is not None:
+        profiler.open_csv(args.profile_csv)
+    ticks = controller.run_game(max_ticks)
+    profiler.close_csv()
+    model = controller.get_model()
+    rate = ticks / controller.elapsed if controller.elapsed > 0 else 0
+    print("Ticks: " + str(ticks))
+    print("Seconds: " + str(round(controller.elapsed, 3)))
+    print("Ticks per second: " + str(int(rate)))
+    print("Score: " + str(model.get_player().score))
+    print("Game over: " + str(model.is_game_over()))
+    if recorder is not None and recorder.score is not None:
+        print("Matches recording: " + str(model.get_player().score == recorder.score))
+    print("Sounds: " + ", ".join(name.lower() + " " + str(count) for name, count in model.get_sound_stats().items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
+import random
+
 import pygame
 from model.menu_model import MenuModel
 from utils import config, score_storage
 from controller.menu_controller import MenuController
 from controller.controller import Controller
+from controller.input_recorder import InputRecorder
 from model.model import Model
 from view.menu_view import MenuView
 from view.view import View
@@ -24,10 +27,18 @@ def start_game():
             score_storage.save_data()
             break
         view = View(game_mode)
-        model = Model(difficulty, game_mode)
+        # Seed of the game's random number stream, kept so the game can be recorded
+        seed = random.randrange(2 ** 32)
+        recorder = None
+        if config.record_inputs is not None:
+            Model.friendly_ships[:] = []
+            recorder = InputRecorder(game_mode, difficulty, config.player_ship, config.weapon, seed)
+        model = Model(difficulty, game_mode, rng=random.Random(seed))
         model.switch_weapon(config.weapon)
-        controller = Controller(model, view)
+        controller = Controller(model, view, recorder)
         finished = not controller.run_game()
+        if recorder is not None:
+            recorder.save(config.record_inputs, model.get_player().score)
         if not finished:
             finished = menu_controller.display_score(model.get_score())
         else:
@@ -66,5 +66,6 @@ class ChallengeAI(EnemyWaveAI):
         if len(self._enemies) == 1:
             self._model.popup_text(self._final_wave_text, 3)
         enemies_to_spawn = self._enemies.pop(0)
+        self._wave += 1
         for enemy in enemies_to_spawn:
             self.spawn_enemy(enemy)
@@ -1,6 +1,5 @@
-import random
 from model.ai.enemy_ai_waves import EnemyWaveAI
-from utils import config
+from utils import config, game_random
 from utils.ids.difficulty_id import DifficultyID
 from utils.ids.enemy_id import EnemyID
 
@@ -82,7 +81,7 @@ class EnemyHeavenAI(EnemyWaveAI):
                 available_enemies.append(enemy)
         while len(available_enemies) > 0:
             # Chooses an EntityID of an enemy to spawn
-            chosen = random.randint(0, len(available_enemies) - 1)
+            chosen = game_random.stream.randint(0, len(available_enemies) - 1)
             # Subtracts their score from the current combat rating
             enemy = available_enemies[chosen]
             combat_value = self._combat_ratings.get(available_enemies[chosen])
@@ -90,7 +89,7 @@ class EnemyHeavenAI(EnemyWaveAI):
                 rating -= combat_value
                 if enemy == EnemyID.TITAN:
                     # 20% of spawning a Titan
-                    if random.randint(1, 5) != 5:
+                    if game_random.stream.randint(1, 5) != 5:
                         available_enemies.remove(enemy)
                         continue
                     self._model.popup_text("WARNING: DEATH IMMINENT", 3)
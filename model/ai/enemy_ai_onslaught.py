@@ -1,8 +1,6 @@
-import random
-
 from entities.ships.waypoint import Waypoint
 from model.ai.enemy_ai_waves import EnemyWaveAI
-from utils import config, enemy_generator
+from utils import config, enemy_generator, game_random
 from utils.ids.ally_id import AllyID
 from utils.ids.difficulty_id import DifficultyID
 from utils.ids.enemy_id import EnemyID
@@ -24,7 +22,6 @@ class EnemyOnslaughtAI(EnemyWaveAI):
 
     def __init__(self, model, difficulty):
         super().__init__(model, difficulty)
-        random.seed()
         # Additional enemies not in Classic
         self._combat_ratings[EnemyID.SPECTRE] = 100
         self._combat_ratings[EnemyID.PHANTOM] = 400
@@ -61,7 +58,7 @@ class EnemyOnslaughtAI(EnemyWaveAI):
 
     def _spawn_enemies(self):
         if self._wave == 0:
-            cluster_name = str(random.randint(10, 99))
+            cluster_name = str(game_random.stream.randint(10, 99))
             self._model.popup_text("APPROACHING ENEMY SUPERCLUSTER-" + cluster_name, 3)
         rating = self._max_combat_rating
         # List of entity IDs of available enemies to grab from
@@ -71,14 +68,14 @@ class EnemyOnslaughtAI(EnemyWaveAI):
                 available_enemies.append(enemy)
         while len(available_enemies) > 0:
             # Chooses an EnemyID of an enemy to spawn
-            chosen = random.randint(0, len(available_enemies) - 1)
+            chosen = game_random.stream.randint(0, len(available_enemies) - 1)
             # Subtracts their score from the current combat rating
             enemy = available_enemies[chosen]
             combat_value = self._combat_ratings.get(available_enemies[chosen])
             if combat_value <= rating:
                 if enemy == EnemyID.TITAN:
                     # 20% of spawning a Titan
-                    if random.randint(1, 5) != 5:
+                    if game_random.stream.randint(1, 5) != 5:
                         available_enemies.remove(enemy)
                         continue
                     self._model.popup_text("WARNING: DEATH IMMINENT", 3)
@@ -115,15 +112,15 @@ class EnemyOnslaughtAI(EnemyWaveAI):
 
     def spawn_ally(self):
         # 20% chance of spawning small ships randomly
-        if random.randint(1, 5) == 5:
-            random_ship_quantity = random.randint(1, 4)
+        if game_random.stream.randint(1, 5) == 5:
+            random_ship_quantity = game_random.stream.randint(1, 4)
             x_posns = []
             for _ in range(random_ship_quantity):
-                random_speed = random.randint(5, 10)
+                random_speed = game_random.stream.randint(5, 10)
                 rand_x = 0
                 good_x = False
                 while not good_x:
-                    rand_x = random.randint(0, config.display_width - config.ship_size)
+                    rand_x = game_random.stream.randint(0, config.display_width - config.ship_size)
                     try:
                         for posn in x_posns:
                             if posn - config.ship_size < rand_x < posn + config.ship_size:
@@ -132,7 +129,7 @@ class EnemyOnslaughtAI(EnemyWaveAI):
                         continue
                     good_x = True
                 ship_id = PlayerID.CITADEL
-                if random.randint(1, 4) == 4:
+                if game_random.stream.randint(1, 4) == 4:
                     ship_id = PlayerID.AEGIS
                 ship = enemy_generator.generate_enemy(ship_id,
                                                       rand_x,
@@ -145,12 +142,12 @@ class EnemyOnslaughtAI(EnemyWaveAI):
                 ship.set_waypoint(wp=Waypoint(rand_x, -config.display_height))
                 self._model.friendly_ships.append(ship)
         # 5% chance of spawning a Longsword
-        if random.randint(1, 20) == 20:
+        if game_random.stream.randint(1, 20) == 20:
             # Only allows 1 on screen at once
             for ship in self._model.friendly_ships:
                 if ship.entity_id == AllyID.LONGSWORD:
                     return
-            rand_x = random.randint(-config.display_width // 2, config.display_width // 2)
+            rand_x = game_random.stream.randint(-config.display_width // 2, config.display_width // 2)
             ship = enemy_generator.generate_enemy(AllyID.LONGSWORD,
                                                   rand_x,
                                                   config.display_height,
@@ -161,11 +158,11 @@ class EnemyOnslaughtAI(EnemyWaveAI):
             self._model.friendly_ships.append(ship)
             self._model.friendly_ships.extend(ship.spawn_turrets())
         # 10% chance of spawning a persistent ally
-        if random.randint(1, 10) == 10 and len(self._model.friendly_ships) < 12:
+        if game_random.stream.randint(1, 10) == 10 and len(self._model.friendly_ships) < 12:
             hp = 50
-            rand_x = random.randint(0, config.display_width - config.ship_size)
+            rand_x = game_random.stream.randint(0, config.display_width - config.ship_size)
             ship_id = PlayerID.CITADEL
-            if random.randint(1, 4) == 4:
+            if game_random.stream.randint(1, 4) == 4:
                 ship_id = PlayerID.AEGIS
                 hp *= 2
             ship = enemy_generator.generate_enemy(ship_id,
@@ -177,9 +174,9 @@ class EnemyOnslaughtAI(EnemyWaveAI):
                                                   fire_rate=config.game_fps // 2)
             self._model.friendly_ships.append(ship)
         # 10% chance of spawning an Archer turret
-        if random.randint(1, 10) == 10 and len(self._model.friendly_ships) < 12:
+        if game_random.stream.randint(1, 10) == 10 and len(self._model.friendly_ships) < 12:
             hp = 50
-            rand_x = random.randint(0, config.display_width - config.ship_size)
+            rand_x = game_random.stream.randint(0, config.display_width - config.ship_size)
             ship_id = AllyID.ARCHER
             ship = enemy_generator.generate_enemy(ship_id,
                                                   rand_x,
@@ -1,7 +1,5 @@
-import random
-
 from model.stats import ship_stats
-from utils import config, enemy_generator
+from utils import config, enemy_generator, game_random
 from utils.ids.difficulty_id import DifficultyID
 from utils.ids.enemy_id import EnemyID
 
@@ -47,7 +45,6 @@ class EnemyWaveAI:
         # Model to work with
         self._model = model
         self._ticks = 0
-        random.seed()
         fps = config.game_fps
         # Range in fire rate for enemies, chosen randomly
         self._fire_rate_range = (int(fps * .75), int(fps * 2))
@@ -89,6 +86,15 @@ class EnemyWaveAI:
                 self._spawn_enemies()
                 self._wave += 1
 
+    """Returns the number of waves spawned so far.
+
+    :returns: number of waves
+    :rtype: int
+    """
+
+    def get_wave(self):
+        return self._wave
+
     """Waits for the next wave. Returns true if ready.
 
     :returns: true if next wave is ready
@@ -123,12 +129,12 @@ class EnemyWaveAI:
             if value <= rating:
                 available_enemies.append(enemy)
         # 10% chance of hidden enemies
-        if self._max_combat_rating >= 400 and random.randint(1, 10) == 10:
+        if self._max_combat_rating >= 400 and game_random.stream.randint(1, 10) == 10:
             available_enemies = [EnemyID.SPECTRE, EnemyID.PHANTOM]
             self._model.popup_text("UNKNOWN SIGNATURES DETECTED", 3)
         while len(available_enemies) > 0:
             # Chooses an EnemyID of an enemy to spawn
-            chosen = random.randint(0, len(available_enemies) - 1)
+            chosen = game_random.stream.randint(0, len(available_enemies) - 1)
             # Subtracts their score from the current combat rating
             enemy = available_enemies[chosen]
             combat_value = self._combat_ratings.get(available_enemies[chosen])
@@ -137,7 +143,7 @@ class EnemyWaveAI:
             if combat_value <= rating:
                 # 20% of spawning a Titan
                 if enemy == EnemyID.TITAN:
-                    if random.randint(1, 5) != 5:
+                    if game_random.stream.randint(1, 5) != 5:
                         available_enemies.remove(enemy)
                         continue
                     self._model.popup_text("WARNING: DEATH IMMINENT", 3)
@@ -172,9 +178,9 @@ class EnemyWaveAI:
     def spawn_enemy(self, entity_id):
         enemy_stats = self._stats.get(entity_id)
         # Creates a random starting position
-        x_pos = random.randint(config.ship_size, config.display_width - config.ship_size)
+        x_pos = game_random.stream.randint(config.ship_size, config.display_width - config.ship_size)
         # Sets their fire rate randomly, from .75 seconds to 2 seconds
-        fire_rate = random.randint(self._fire_rate_range[0], self._fire_rate_range[1])
+        fire_rate = game_random.stream.randint(self._fire_rate_range[0], self._fire_rate_range[1])
         y_pos = -config.ship_size
         if entity_id == EnemyID.TITAN:
             y_pos = -config.ship_size * 8
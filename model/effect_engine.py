@@ -0,0 +1,51 @@
+from entities import pools
+
+"""Runs the timelines of explosions, charge ups, screen tints, and popups. Every effect is advanced by one frame in a
+single pass once per tick, with finished ones handed back to their pool, so image containers only read an effect's
+frame and never change it. The view is handed the images and positions to draw, which it blits in one batch.
+"""
+
+
+class EffectEngine:
+    """Constructor to make the engine.
+    """
+
+    def __init__(self):
+        # Effects advanced and finished so far
+        self.advanced = 0
+        self.finished = 0
+
+    """Advances every effect by a frame, removing the finished ones from the list in place.
+
+    :param effects: effects to advance
+    :type effects: [Effect]
+    """
+
+    def advance(self, effects):
+        live = []
+        append = live.append
+        for effect in effects:
+            frame = effect.curr_frame + 1
+            effect.curr_frame = frame
+            if frame <= effect.max_frame:
+                append(effect)
+            else:
+                pools.release(effect)
+        self.advanced += len(effects)
+        self.finished += len(effects) - len(live)
+        effects[:] = live
+
+    """Returns the image and position to draw each effect at on its current frame. Each image is looked up as it is
+    drawn rather than all up front, since popups with the same text share one image with its transparency set per draw.
+
+    :param effects: effects to draw
+    :type effects: [Effect]
+    :param images: image container of each effect ID, each with a get_draw(effect) method
+    :type images: {EffectID: ExplosionImages or ScreenTintImages or PopUpImage}
+    :returns: images and the top left corners to draw them at, in the order of the effects
+    :rtype: generator of (pygame.Surface, (float, float))
+    """
+
+    @staticmethod
+    def get_draws(effects, images):
+        return (images[effect.entity_id].get_draw(effect) for effect in effects)
@@ -0,0 +1,89 @@
+import itertools
+
+"""Live collections of the model's ships and projectiles grouped by team. Each collection is a view over the model's
+own lists that reads them every time it is used, so it stays current as entities are added and removed without a new
+list being built each tick or frame. The lists must only ever be changed in place, such as with append or a slice
+assignment, never replaced. Views go through their lists in the order given, the same order the lists used to be
+joined in.
+"""
+
+
+class ChainView:
+    # Fixed set of attributes instead of a per instance __dict__
+    __slots__ = ("_lists",)
+
+    """Constructor to make a view over the given lists, one after the other.
+
+    :param lists: lists to view
+    :type lists: list
+    """
+
+    def __init__(self, *lists):
+        self._lists = lists
+
+    """Goes through every item of every list, in order.
+
+    :returns: iterator over the items
+    :rtype: iterator
+    """
+
+    def __iter__(self):
+        return itertools.chain(*self._lists)
+
+    """Returns the number of items in all the lists.
+
+    :returns: number of items
+    :rtype: int
+    """
+
+    def __len__(self):
+        length = 0
+        for items in self._lists:
+            length += len(items)
+        return length
+
+    """Returns the item at the given position, as if the lists were joined.
+
+    :param index: position of the item, negative positions count from the end
+    :type index: int
+    :returns: the item
+    :rtype: object
+    :raises: IndexError if there is no item at the position
+    """
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError("view index out of range")
+        for items in self._lists:
+            if index < len(items):
+                return items[index]
+            index -= len(items)
+        raise IndexError("view index out of range")
+
+
+class EntityRegistry:
+    """Constructor to make the collections over the model's lists.
+
+    :param enemy_ships: enemy ships
+    :type enemy_ships: [Ship]
+    :param friendly_ships: friendly ships other than the player
+    :type friendly_ships: [Ship]
+    :param enemy_projectiles: projectiles fired by enemies
+    :type enemy_projectiles: [Projectile]
+    :param friendly_projectiles: projectiles fired by the player and friendly ships
+    :type friendly_projectiles: [Projectile]
+    :param player: the player's ship
+    :type player: Player
+    """
+
+    def __init__(self, enemy_ships, friendly_ships, enemy_projectiles, friendly_projectiles, player):
+        # Ships that friendly projectiles can hit
+        self.hostiles = enemy_ships
+        # Friendly ships followed by the player, which enemy projectiles can hit
+        self.friendlies = ChainView(friendly_ships, [player])
+        # Every ship other than the player, enemies first
+        self.ships = ChainView(enemy_ships, friendly_ships)
+        # Every projectile, enemy ones first
+        self.projectiles = ChainView(enemy_projectiles, friendly_projectiles)
@@ -1,11 +1,10 @@
-import random
-
 from entities.projectiles.bullet import Bullet
 from entities.projectiles.diamond_dust import DiamondDust
 from entities.projectiles.missile import Missile
 from entities.ships.waypoint import Waypoint
+from model.entity_registry import ChainView
 from model.model import Model
-from utils import config, enemy_generator
+from utils import config, enemy_generator, game_random
 from utils.direction import Direction
 from utils.ids.ally_id import AllyID
 from utils.ids.difficulty_id import DifficultyID
@@ -26,12 +25,15 @@ class MenuModel(Model):
 
     def __init__(self):
         super().__init__(DifficultyID.EASY, GameModeID.CLASSIC)
-        random.seed()
         self._player_ship.x = config.display_width
         self._play = False
         # If a weapon or enemy is being showcased
         self._showcase_weapon = False
         self._props = []
+        # Live views of every ship and prop, of what the player can hit, and of every projectile
+        self._menu_ships = ChainView(self.enemy_ships, self.friendly_ships, self._props)
+        self._targets = ChainView(self.enemy_ships, self._props)
+        self._menu_projectiles = ChainView(self.friendly_projectiles, self.enemy_projectiles)
 
     """Prepares another showcase.
     
@@ -60,7 +62,7 @@ class MenuModel(Model):
         self._props[:] = []
         self._player_ship.x = config.display_width / 2 - config.ship_size / 2
         self._player_ship.y = config.display_height / 2
-        for projectile in self.friendly_projectiles + self.enemy_projectiles:
+        for projectile in self._menu_projectiles:
             projectile.y -= 2 * config.display_height
 
     """Represents a tick in the game. Handles reloads and moves all projectiles and updates the AI module to
@@ -68,12 +70,13 @@ class MenuModel(Model):
     """
 
     def tick(self):
+        game_random.use(self._rng)
         # Moves all projectiles
-        for projectile in self.friendly_projectiles + self.enemy_projectiles:
+        for projectile in self._menu_projectiles:
             projectile.move()
-        self._queue = [action for action in self._queue if self._process_action(action)]
+        self._timers.advance()
         # Has enemies immediately fire when ready
-        for ship in self.enemy_ships + self.friendly_ships + self._props:
+        for ship in self._menu_ships:
             ship.move()
             ship.ticks += 1
             if ship.ticks == ship.fire_rate:
@@ -92,10 +95,13 @@ class MenuModel(Model):
                 self.move_player([Direction.FIRE])
         # Checks collisions between projectiles and ships
         self._remove_off_screen_objects()
-        for ship in self.enemy_ships + self.friendly_ships + self._props:
+        for ship in self._menu_ships:
             ship.is_damaged = False
         self._player_ship.is_damaged = False
+        # Missiles that lost their target pick a new one from the enemies left this tick
+        self._enemy_index.rebuild(self.enemy_ships)
         self._check_collisions()
+        self._sound_scheduler.flush()
 
     """Switches the player's weapon to the given type.
 
@@ -160,11 +166,11 @@ class MenuModel(Model):
     def _check_collisions(self):
         # Checks friendly projectiles vs. enemy ships
         self.friendly_projectiles[:] = [projectile for projectile in self.friendly_projectiles
-                                        if not self._check_if_hit(projectile, self.enemy_ships + self._props,
+                                        if not self._check_if_hit(projectile, self._targets,
                                                                   EffectID.BLUE_EXPLOSION)]
         # Checks enemy projectiles vs. friendly ships
         self.enemy_projectiles[:] = [projectile for projectile in self.enemy_projectiles
-                                     if not self._check_if_hit(projectile, self.friendly_ships + [self._player_ship],
+                                     if not self._check_if_hit(projectile, self._entities.friendlies,
                                                                EffectID.RED_EXPLOSION)]
 
     """Removes all off screen objects such as projectiles or ships.
@@ -199,15 +205,15 @@ class MenuModel(Model):
 
     def spawn_ships(self):
         # ~18% chance of spawning small ships randomly
-        if random.randint(1, 6) == 6:
-            random_ship_quantity = random.randint(1, 4)
+        if self._rng.randint(1, 6) == 6:
+            random_ship_quantity = self._rng.randint(1, 4)
             x_posns = []
             for _ in range(random_ship_quantity):
-                random_speed = random.randint(5, 15)
+                random_speed = self._rng.randint(5, 15)
                 rand_x = 0
                 good_x = False
                 while not good_x:
-                    rand_x = random.randint(0, config.display_width - config.ship_size)
+                    rand_x = self._rng.randint(0, config.display_width - config.ship_size)
                     try:
                         for posn in x_posns:
                             if posn - config.ship_size < rand_x < posn + config.ship_size:
@@ -216,7 +222,7 @@ class MenuModel(Model):
                         continue
                     good_x = True
                 ship_id = PlayerID.CITADEL
-                if random.randint(1, 4) == 4:
+                if self._rng.randint(1, 4) == 4:
                     ship_id = PlayerID.AEGIS
                 ship = enemy_generator.generate_enemy(ship_id,
                                                       rand_x,
@@ -231,14 +237,14 @@ class MenuModel(Model):
                 ship.ready_to_fire = False
                 self.friendly_ships.append(ship)
         # 4% chance of spawning a Longsword
-        if random.randint(1, 25) == 25:
+        if self._rng.randint(1, 25) == 25:
             count = 0
             for ship in self.friendly_ships:
                 if ship.entity_id == AllyID.LONGSWORD:
                     count += 1
                     if count == 2:
                         return
-            rand_x = random.randint(-config.display_width // 2, config.display_width // 2)
+            rand_x = self._rng.randint(-config.display_width // 2, config.display_width // 2)
             ship = enemy_generator.generate_enemy(AllyID.LONGSWORD,
                                                   rand_x,
                                                   config.display_height,
@@ -254,20 +260,20 @@ class MenuModel(Model):
     """
 
     def get_ships(self):
-        return self.enemy_ships + self.friendly_ships + self._props
+        return self._menu_ships
 
     def _generate_projectile(self, speed, x, y, angle, damage, entity_id):
         self.play_sound(entity_id)
         if entity_id == ProjectileID.FRIENDLY_BULLET or entity_id == ProjectileID.FRIENDLY_FLAK:
             return Bullet(speed, x, y, angle, 0, entity_id)
         elif entity_id == ProjectileID.FRIENDLY_MISSILE:
-            closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships + self._props)
+            closest_enemy = self.find_closest_target(self._player_ship, self._targets)
             return Missile(speed, x, y, angle, 0, entity_id, closest_enemy)
         elif entity_id == ProjectileID.DIAMOND_DUST:
-            closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships + self._props)
+            closest_enemy = self.find_closest_target(self._player_ship, self._targets)
             return DiamondDust(speed, x, y, angle, 0, ProjectileID.FRIENDLY_BULLET, closest_enemy)
         elif entity_id == ProjectileID.HOMING_BULLET:
-            closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships + self._props)
+            closest_enemy = self.find_closest_target(self._player_ship, self._targets)
             return Missile(speed, x, y, angle, 0, ProjectileID.FRIENDLY_BULLET, closest_enemy)
         elif entity_id == ProjectileID.RAILGUN_BLAST:
             return Bullet(speed, x, y, angle, 0, ProjectileID.RAILGUN_BLAST)
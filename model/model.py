@@ -5,13 +5,12 @@ import random
 import pygame
 
 from entities.effects.charge_up import ChargeUp
-from entities.effects.explosion import Explosion
+from entities import pools
 from entities.effects.popup import PopUp
 from entities.effects.screen_tint import ScreenTint
-from entities.projectiles.bullet import Bullet
-from entities.projectiles.diamond_dust import DiamondDust
-from entities.projectiles.missile import Missile
 from entities.ships.player import Player
+from model.effect_engine import EffectEngine
+from model.entity_registry import EntityRegistry
 from model.ai.enemy_ai_fate import EnemyFateAI
 from model.ai.enemy_ai_heaven import EnemyHeavenAI
 from model.ai.enemy_ai_mandible_madness import EnemyMandibleMadnessAI
@@ -20,8 +19,15 @@ from model.ai.enemy_ai_spectral import EnemySpectralAI
 from model.ai.enemy_ai_titan_slayer import EnemyTitanSlayerAI
 from model.ai.enemy_ai_tutorial import EnemyTutorialAI
 from model.ai.enemy_ai_waves import EnemyWaveAI
+from model.null_sound import NullMixer, NullSound
+from model.render_snapshot import take_snapshot
+from model.sound_scheduler import SoundScheduler
+from model.spatial_grid import SpatialGrid
+from model.target_index import TargetIndex
 from model.stats import ship_stats, weapon_stats
-from utils import config, score_storage
+from utils import config, game_random, score_storage
+from utils.profiler import profiler
+from utils.timer_wheel import TimerWheel
 from utils.direction import Direction
 from utils.ids.ally_id import AllyID
 from utils.ids.effect_id import EffectID
@@ -52,9 +58,18 @@ class Model:
     :type difficulty: DifficultyID
     :param game_mode: Game mode to play
     :type game_mode: GameModeID or GameID
-    """
-
-    def __init__(self, difficulty, game_mode):
+    :param headless: if the game runs without an audio device, replacing all sounds with ones that do nothing
+    :type headless: bool
+    :param rng: random number stream for the game to draw from, a new unseeded one if None
+    :type rng: random.Random or None
+    """
+
+    def __init__(self, difficulty, game_mode, headless=False, rng=None):
+        # Random number stream for this game, current whenever the model runs
+        self._rng = rng if rng is not None else random.Random()
+        game_random.use(self._rng)
+        # The pools are shared by every model, a model thrown away without being cleared still counts as using them
+        pools.reset()
         # Friendly ships
         # Enemy ships
         self.enemy_ships = []
@@ -64,6 +79,14 @@ class Model:
         self.friendly_projectiles = []
         # Effects
         self.effects = []
+        # Collision grids for projectiles hitting enemies and friendlies
+        self._enemy_grid = SpatialGrid()
+        self._friendly_grid = SpatialGrid()
+        # Nearest target lookups for enemies and friendlies
+        self._enemy_index = TargetIndex()
+        self._friendly_index = TargetIndex()
+        # Advances every effect's animation once a tick
+        self._effect_engine = EffectEngine()
         """
         Player statistics:
         Speed: projectile movement speed
@@ -81,6 +104,9 @@ class Model:
         self._game_over = False
         # Initializing the player and its bonuses from ship choice
         self._reload_bonus, self._damage_bonus, self._player_ship = self._init_player(config.player_ship)
+        # Live views of the ships and projectiles by team
+        self._entities = EntityRegistry(self.enemy_ships, self.friendly_ships, self.enemy_projectiles,
+                                        self.friendly_projectiles, self._player_ship)
         # The current enemy AI module
         self._AI = self._init_enemy_ai(game_mode, difficulty)
         self._game_mode = game_mode
@@ -94,13 +120,18 @@ class Model:
         # Sounds
         self.sounds = {}
         for file_name, volume in {"bullet": .05, "missile": .05, "explosion": .3, "railgun": .5}.items():
-            path = os.path.join(self.sound_path, file_name + '_sound.ogg')
-            sound = pygame.mixer.Sound(file=path)
+            if headless:
+                sound = NullSound()
+            else:
+                path = os.path.join(self.sound_path, file_name + '_sound.ogg')
+                sound = pygame.mixer.Sound(file=path)
             sound.set_volume(volume)
             self.sounds[file_name.upper()] = sound
+        # Merges and limits the sounds played each tick
+        self._sound_scheduler = SoundScheduler(self.sounds, NullMixer() if headless else pygame.mixer)
 
-        # Action queue
-        self._queue = []
+        # Delayed actions, such as the rest of a burst or a charged shot, counted in ticks
+        self._timers = TimerWheel()
         # For ships from the menu
         for ship in self.friendly_ships:
             ship.ready_to_fire = True
@@ -151,21 +182,37 @@ class Model:
     """
 
     def tick(self):
+        game_random.use(self._rng)
         if not self._game_over:
-            # Action queue
-            self._queue[:] = [action for action in self._queue if self._process_action(action)]
+            profiler.start("SHIPS")
+            # Delayed actions
+            self._timers.advance()
             # Rotates enemies, recharges their shields, and checks if they're dead
+            self._friendly_index.rebuild(self._entities.friendlies)
             self.enemy_ships[:] = [enemy for enemy in self.enemy_ships
-                                   if not self._process_ship(enemy, self.get_friendlies(), self.enemy_projectiles)]
+                                   if not self._process_ship(enemy, self._friendly_index, self.enemy_projectiles)]
+            # Enemies are done moving, indexes them for friendlies, missiles, and the player to target
+            self._enemy_index.rebuild(self.enemy_ships)
             self.friendly_ships[:] = [ship for ship in self.friendly_ships
-                                      if not self._process_ship(ship, self.enemy_ships, self.friendly_projectiles)]
-
+                                      if not self._process_ship(ship, self._enemy_index, self.friendly_projectiles)]
+            profiler.stop("SHIPS")
+            profiler.start("AI")
+            spawned = len(self.enemy_ships)
             self._process_player()
-            # Moves all projectiles and filters them if they're offscreen
+            # Adds any enemies the AI spawned
+            self._enemy_index.extend(self.enemy_ships[spawned:])
+            profiler.stop("AI")
+        profiler.start("PROJECTILES")
+        # Buckets ships for collision checks now that they are done moving
+        self._enemy_grid.rebuild(self.enemy_ships)
+        self._friendly_grid.rebuild(self._entities.friendlies)
+        # Moves all projectiles and filters them if they're offscreen
         self.friendly_projectiles[:] = [projectile for projectile in self.friendly_projectiles
                                         if not self._process_friendly_projectile(projectile)]
         self.enemy_projectiles[:] = [projectile for projectile in self.enemy_projectiles
                                      if not self._process_enemy_projectile(projectile)]
+        profiler.stop("PROJECTILES")
+        self._sound_scheduler.flush()
 
     """Processes the player, checking its health, making the AI tick, and deciding when to end the game.
     """
@@ -184,8 +231,8 @@ class Model:
             self._player_ship.is_damaged = False
         elif not self._game_over:
             size = self._player_ship.size // 2
-            self.effects.append(Explosion(self._player_ship.x + size, self._player_ship.y + size,
-                                          EffectID.BLUE_EXPLOSION))
+            self.effects.append(pools.explosions.acquire(self._player_ship.x + size, self._player_ship.y + size,
+                                                         EffectID.BLUE_EXPLOSION))
             self._game_over = True
             self.popup_text("Game Over", 4)
 
@@ -194,7 +241,7 @@ class Model:
     :param ship: Friendly ship
     :type ship: Ally
     :param targets: Possible targets for the ship
-    :type targets: [Ship]
+    :type targets: TargetIndex
     :param projectiles: Projectile list to append onto
     :type projectiles: [Projectile]
     :returns: if the ship should be removed or not
@@ -211,25 +258,25 @@ class Model:
             if ship.ticks == ship.fire_rate:
                 ship.ticks = 0
                 if ship.ready_to_fire:
-                    ship.fire(self.find_closest_target(ship, targets), projectiles)
+                    ship.fire(targets.find_closest(ship), projectiles)
                     self.play_sound(ship.projectile_type)
             return False
 
-    """Processes commands in the queue.
-    
-    :param action:
-    :type action: {str : Direction, str : int}
+    """Schedules a function to be called at the start of a later tick, before ships are processed.
+
+    :param delay: ticks to wait, at least one
+    :type delay: int
+    :param callback: function to call
+    :type callback: callable
+    :param args: arguments to call the function with
+    :returns: the timer, which can be cancelled
+    :rtype: Timer
     """
 
-    def _process_action(self, action):
-        commands = {Direction.FIRE: self._projectile_generator}
-        action["FRAME"] -= 1
-        if action["FRAME"] == 0:
-            commands[action["COMMAND"]]()
-            return False
-        return True
+    def schedule(self, delay, callback, *args):
+        return self._timers.schedule(delay, callback, *args)
 
-    """Plays the corresponding sound effect for the projectile fired.
+    """Plays the corresponding sound effect for the projectile fired once the tick is over.
 
     :param entity_id: ID of the projectile
     :type entity_id: ProjectileID
@@ -239,25 +286,24 @@ class Model:
         if entity_id in [ProjectileID.FRIENDLY_FLAK, ProjectileID.FRIENDLY_BULLET,
                          ProjectileID.ENEMY_FLAK, ProjectileID.ENEMY_BULLET, ProjectileID.HOMING_BULLET,
                          ProjectileID.DIAMOND_DUST]:
-            self.sounds["BULLET"].play()
+            self._sound_scheduler.request("BULLET")
         elif entity_id in [ProjectileID.ENEMY_MISSILE, ProjectileID.FRIENDLY_MISSILE]:
-            self.sounds["MISSILE"].play()
+            self._sound_scheduler.request("MISSILE")
         elif entity_id in [ProjectileID.RAILGUN_BLAST]:
-            self.sounds["RAILGUN"].play()
+            self._sound_scheduler.request("RAILGUN")
 
-    """Removes effects that are over.
+    """Advances every effect by a frame, and removes effects that are over. The game calls this once a tick.
     """
 
     def remove_effects(self):
-        # Filters the effects for objects to offload
-        self.effects[:] = [effect for effect in self.effects if effect.animate()]
+        self._effect_engine.advance(self.effects)
 
     """Determines if the given enemy ship is dead, and adds to the player score if true.
 
     :param ship: Ship to check if dead
     :type ship: Ship
-    :param targets: List of possible targets for the ship
-    :type targets: [Ship]
+    :param targets: Possible targets for the ship
+    :type targets: TargetIndex
     :returns: if ship is dead
     :rtype: bool
     """
@@ -268,22 +314,22 @@ class Model:
             if ship.entity_id in EnemyID:
                 self._player_ship.score += ship.score
                 self._final_stats["ENEMIES SLAIN"] += 1
-            self.sounds["EXPLOSION"].play()
+            self._sound_scheduler.request("EXPLOSION")
             center_x = ship.x + ship.size // 2
             center_y = ship.y + ship.size // 2
-            self.effects.append(Explosion(center_x, center_y,
-                                          EffectID.EXPLOSION))
+            self.effects.append(pools.explosions.acquire(center_x, center_y,
+                                                         EffectID.EXPLOSION))
             # Clears all if a Titan is killed
             if ship.entity_id == EnemyID.TITAN:
                 self.popup_text("TITAN SLAIN", 3)
-                self.effects.append(Explosion(ship.x, ship.y, EffectID.TITAN_EXPLOSION))
+                self.effects.append(pools.explosions.acquire(ship.x, ship.y, EffectID.TITAN_EXPLOSION))
                 self._final_stats["TITANS SLAIN"] += 1
             elif ship.entity_id == AllyID.LONGSWORD:
-                self.effects.append(Explosion(ship.x, ship.y, EffectID.TITAN_EXPLOSION))
+                self.effects.append(pools.explosions.acquire(ship.x, ship.y, EffectID.TITAN_EXPLOSION))
 
         else:
             ship.move()
-            closest_target = self.find_closest_target(ship, targets)
+            closest_target = targets.find_closest(ship)
             ship.rotate(closest_target)
             ship.recharge_shield()
             ship.is_damaged = False
@@ -296,6 +342,7 @@ class Model:
     """
 
     def move_player(self, keys):
+        game_random.use(self._rng)
         # Player
         # Firing
         if Direction.FIRE in keys:
@@ -303,15 +350,16 @@ class Model:
                 if self._reload == self._reload_time:
                     self._reload = 0
                     if self._player_stats["TYPE"] == ProjectileID.RAILGUN_BLAST:
-                        self._queue.append({"COMMAND": Direction.FIRE, "FRAME": ChargeUp.charge_delay})
+                        self._timers.schedule(ChargeUp.charge_delay, self._projectile_generator)
                         charge_effect = ChargeUp(self._player_ship.x + self._player_ship.size // 2,
                                                  self._player_ship.y + self._player_ship.size // 5,
                                                  EffectID.BLUE_CHARGE)
                         self._player_ship.ship_effects.append(charge_effect)
                         self.effects.append(charge_effect)
                     else:
-                        for i in range(self._player_stats["BURSTS"]):
-                            self._queue.append({"COMMAND": Direction.FIRE, "FRAME": i * 2})
+                        # The first shot of the burst is fired now, the rest every other tick after
+                        for i in range(1, self._player_stats["BURSTS"]):
+                            self._timers.schedule(i * 2, self._projectile_generator)
                         self._projectile_generator()
         # Up and down
         size = config.ship_size
@@ -344,19 +392,25 @@ class Model:
     
     :param projectile: Projectile to move
     :type projectile: Projectile
-    :returns: True if the projectile is off screen
+    :returns: True if the projectile is off screen, in which case it is handed back to its pool
     :rtype: bool
     """
 
     def _process_friendly_projectile(self, projectile):
         projectile.move()
-        return self._is_off_screen(projectile) or self._check_if_hit(projectile, self.enemy_ships,
-                                                                     EffectID.BLUE_EXPLOSION)
+        removed = self._is_off_screen(projectile) or self._check_if_hit(projectile, self.enemy_ships,
+                                                                        EffectID.BLUE_EXPLOSION, self._enemy_grid)
+        if removed:
+            pools.release(projectile)
+        return removed
 
     def _process_enemy_projectile(self, projectile):
         projectile.move()
-        return self._is_off_screen(projectile) or self._check_if_hit(projectile, self.get_friendlies(),
-                                                                     EffectID.RED_EXPLOSION)
+        removed = self._is_off_screen(projectile) or self._check_if_hit(projectile, self._entities.friendlies,
+                                                                        EffectID.RED_EXPLOSION, self._friendly_grid)
+        if removed:
+            pools.release(projectile)
+        return removed
 
     """Checks if the given entity is off screen.
 
@@ -382,31 +436,36 @@ class Model:
     :type ships: List of Ship
     :param splash_color: color explosion for projectiles to use, also adjusts score of player if blue
     :type splash_color: EntityID
+    :param grid: grid the ships are bucketed in, if given only ships near the projectile are checked
+    :type grid: SpatialGrid
     :returns: True if projectile is to be removed, false otherwise
     :rtype: bool
     """
 
-    def _check_if_hit(self, projectile, ships, splash_color):
+    def _check_if_hit(self, projectile, ships, splash_color, grid=None):
         weapon_type = projectile.entity_id
         ship_size = config.ship_size
         radius = projectile.size // 2
         proj_center = (projectile.x + radius, projectile.y + radius)
         if weapon_type == ProjectileID.RAILGUN_BLAST:
-            self.effects.append(Explosion(proj_center[0],
-                                          proj_center[1],
-                                          splash_color))
+            self.effects.append(pools.explosions.acquire(proj_center[0],
+                                                         proj_center[1],
+                                                         splash_color))
         elif weapon_type == ProjectileID.FRIENDLY_MISSILE or weapon_type == ProjectileID.ENEMY_MISSILE:
             # Projectile is missile and its target has been destroyed, gives it a new target
             if projectile.target_destroyed:
-                projectile.acquire_target(self.find_closest_target(projectile, self.enemy_ships))
+                projectile.acquire_target(self._enemy_index.find_closest(projectile))
         elif weapon_type == ProjectileID.PULSE:
             if projectile.curr_charge != projectile.charge_time:
                 return False
             else:
-                self.effects.append(Explosion(proj_center[0],
-                                              proj_center[1],
-                                              splash_color))
-                self.sounds["EXPLOSION"].play()
+                self.effects.append(pools.explosions.acquire(proj_center[0],
+                                                             proj_center[1],
+                                                             splash_color))
+                self._sound_scheduler.request("EXPLOSION")
+        # Only ships sharing the projectile's cell can be close enough to be hit or splashed
+        if grid is not None:
+            ships = grid.query(projectile)
         for ship in ships:
             # Hit box
             ship_bounding_box = ship.size / 4
@@ -420,10 +479,10 @@ class Model:
                 if projectile.has_splash:
                     # Calculates what ships receive splash damage
                     self._check_splash_damage(projectile, ship, ships)
-                    self.effects.append(Explosion(proj_center[0],
-                                                  proj_center[1],
-                                                  splash_color))
-                    self.sounds["EXPLOSION"].play()
+                    self.effects.append(pools.explosions.acquire(proj_center[0],
+                                                                 proj_center[1],
+                                                                 splash_color))
+                    self._sound_scheduler.request("EXPLOSION")
                 # Removes projectile if it is not a railgun shot
                 if projectile.entity_id not in [ProjectileID.RAILGUN_BLAST, ProjectileID.PULSE]:
                     return True
@@ -531,7 +590,7 @@ class Model:
                 offset += partition
                 self.friendly_projectiles.append(projectile)
         else:
-            offset = random.randint(-stats["SPREAD"], stats["SPREAD"])
+            offset = self._rng.randint(-stats["SPREAD"], stats["SPREAD"])
             self.friendly_projectiles.append(
                 self._generate_projectile(stats["SPEED"], self._player_ship.x, firing_position, offset + player_angle,
                                           stats["DAMAGE"], stats["TYPE"]))
@@ -557,22 +616,23 @@ class Model:
         self._final_stats["SHOTS FIRED"] += 1
         self.play_sound(entity_id)
         if entity_id == ProjectileID.FRIENDLY_BULLET or entity_id == ProjectileID.FRIENDLY_FLAK:
-            return Bullet(speed, x, y, angle, damage, entity_id)
+            return pools.bullets.acquire(speed, x, y, angle, damage, entity_id)
         elif entity_id == ProjectileID.FRIENDLY_MISSILE:
-            closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships)
-            return Missile(speed, x, y, angle, damage, entity_id, closest_enemy)
+            closest_enemy = self._enemy_index.find_closest(self._player_ship)
+            return pools.missiles.acquire(speed, x, y, angle, damage, entity_id, closest_enemy)
         elif entity_id == ProjectileID.DIAMOND_DUST:
-            closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships)
-            return DiamondDust(speed, x, y, angle, damage, ProjectileID.FRIENDLY_BULLET, closest_enemy)
+            closest_enemy = self._enemy_index.find_closest(self._player_ship)
+            return pools.diamond_dust.acquire(speed, x, y, angle, damage, ProjectileID.FRIENDLY_BULLET, closest_enemy)
         elif entity_id == ProjectileID.HOMING_BULLET:
-            closest_enemy = self.find_closest_target(self._player_ship, self.enemy_ships)
-            return Missile(speed, x, y, angle, damage, ProjectileID.FRIENDLY_BULLET, closest_enemy)
+            closest_enemy = self._enemy_index.find_closest(self._player_ship)
+            return pools.missiles.acquire(speed, x, y, angle, damage, ProjectileID.FRIENDLY_BULLET, closest_enemy)
         elif entity_id == ProjectileID.RAILGUN_BLAST:
-            return Bullet(speed, x, y, angle, damage, ProjectileID.RAILGUN_BLAST)
+            return pools.bullets.acquire(speed, x, y, angle, damage, ProjectileID.RAILGUN_BLAST)
         else:
             raise ValueError("Invalid projectile type:", entity_id)
 
-    """Finds the closest ship to the given entity. Used primarily for missile tracking.
+    """Finds the closest ship to the given entity with a linear scan. The game loop uses the per tick TargetIndex
+    instead, this is kept for ship lists that are not indexed.
 
     :param source: Source ship or projectile to use as origin
     :type source: Ship or Projectile
@@ -659,22 +719,22 @@ class Model:
                     y += config.ship_size
         self.effects.append(PopUp(text, seconds, x, y))
 
-    """Returns all the projectiles in play.
+    """Returns all the projectiles in play, a live view that is not copied.
 
-    :returns: list of projectiles in game
-    :rtype: list of Projectile
+    :returns: projectiles in game, enemy ones first
+    :rtype: ChainView of Projectile
     """
 
     def get_projectiles(self):
-        return self.enemy_projectiles + self.friendly_projectiles
+        return self._entities.projectiles
 
-    """Returns all ships excluding the player.
-    :returns: list of enemy ships
-    :rtype: list of Ship
+    """Returns all ships excluding the player, a live view that is not copied.
+    :returns: ships in game, enemies first
+    :rtype: ChainView of Ship
     """
 
     def get_ships(self):
-        return self.enemy_ships + self.friendly_ships
+        return self._entities.ships
 
     """Returns all effects.
     :returns: list of effects
@@ -684,6 +744,53 @@ class Model:
     def get_effects(self):
         return self.effects
 
+    """Copies what is drawn this frame, so the model can go on ticking while the frame is drawn.
+
+    :returns: the player, projectiles, ships, and effects to draw
+    :rtype: RenderSnapshot
+    """
+
+    def get_snapshot(self):
+        return take_snapshot(self._player_ship, self.get_projectiles(), self.get_ships(), self.effects)
+
+    """Returns the number of each kind of entity in the game.
+
+    :returns: number of ships, enemy projectiles, friendly projectiles, and effects
+    :rtype: {str: int}
+    """
+
+    def get_counts(self):
+        return {"SHIPS": len(self.enemy_ships) + len(self.friendly_ships),
+                "ENEMY PROJECTILES": len(self.enemy_projectiles),
+                "FRIENDLY PROJECTILES": len(self.friendly_projectiles), "EFFECTS": len(self.effects)}
+
+    """Returns how many sound effects were asked for and what happened to them.
+
+    :returns: counts of sounds requested, played, merged, and dropped
+    :rtype: {str: int}
+    """
+
+    def get_sound_stats(self):
+        return self._sound_scheduler.get_stats()
+
+    """Returns the random number stream the game draws from.
+
+    :returns: the random number stream
+    :rtype: random.Random
+    """
+
+    def get_rng(self):
+        return self._rng
+
+    """Returns the enemy AI running the game mode.
+
+    :returns: the enemy AI
+    :rtype: EnemyAI
+    """
+
+    def get_ai(self):
+        return self._AI
+
     """Returns the player ship.
     
     :returns: Player
@@ -693,10 +800,20 @@ class Model:
     def get_player(self):
         return self._player_ship
 
-    """Resets the model, emptying all lists of entities other than the player.
+    """Resets the model, emptying all lists of entities other than the player and cancelling delayed actions.
     """
 
     def clear(self):
+        # Hands pooled projectiles and explosions back so the pools can reuse them next game
+        for entities in [self.enemy_projectiles, self.friendly_projectiles, self.effects]:
+            for entity in entities:
+                pools.release(entity)
+        self._timers.clear()
+        # Drops the ships indexed last tick so none of them are kept or targeted after the game ends
+        self._enemy_index.rebuild([])
+        self._friendly_index.rebuild([])
+        self._enemy_grid.rebuild([])
+        self._friendly_grid.rebuild([])
         del self.enemy_ships[:]
         del self.enemy_projectiles[:]
         del self.friendly_projectiles[:]
@@ -765,11 +882,11 @@ class Model:
             score_storage.save_data()
         return self._final_stats
 
-    """Returns all friendly targets.
+    """Returns all friendly targets, a live view that is not copied.
     
-    :returns: List of friendly targets
-    :rtype: [Ship]
+    :returns: friendly ships followed by the player
+    :rtype: ChainView of Ship
     """
 
     def get_friendlies(self):
-        return self.friendly_ships + [self._player_ship]
+        return self._entities.friendlies
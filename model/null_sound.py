@@ -0,0 +1,61 @@
+"""Sound, channel, and mixer that do nothing, used in place of pygame's when the game runs without an audio device.
+"""
+
+
+class NullSound:
+    """Ignores the request to play the sound.
+    """
+
+    def play(self, *args, **kwargs):
+        pass
+
+    """Ignores the request to stop the sound.
+    """
+
+    def stop(self):
+        pass
+
+    """Ignores the new volume.
+
+    :param volume: volume of the sound
+    :type volume: float
+    """
+
+    def set_volume(self, volume):
+        pass
+
+    """Returns how many channels the sound is playing on, which is always none.
+
+    :returns: 0
+    :rtype: int
+    """
+
+    def get_num_channels(self):
+        return 0
+
+
+class NullChannel:
+    """Ignores the request to play a sound on the channel.
+
+    :param sound: sound to play
+    :type sound: NullSound
+    """
+
+    def play(self, sound, *args, **kwargs):
+        pass
+
+
+class NullMixer:
+    # Every channel is always free
+    _channel = NullChannel()
+
+    """Returns a free channel, there is always one.
+
+    :param force: if a busy channel can be taken
+    :type force: bool
+    :returns: a channel that does nothing
+    :rtype: NullChannel
+    """
+
+    def find_channel(self, force=False):
+        return self._channel
@@ -0,0 +1,78 @@
+from collections import namedtuple
+
+from utils.ids.effect_id import EffectID
+
+"""Copies of what the view draws each frame, taken from the model once its ticks for the frame are done. Each copy is
+a named tuple holding only what is needed to draw the entity, with the same names as the entity's own attributes, so
+the view draws them the same way it would draw the entities. Nothing in a snapshot changes once it is taken, so the
+model can go on ticking while the frame is drawn from it.
+"""
+
+# Position, size, angle, and damage of a ship
+ShipSnapshot = namedtuple("ShipSnapshot", ["entity_id", "x", "y", "size", "angle", "is_damaged", "shield"])
+# The player also has its health, shield, and score shown on the HUD
+PlayerSnapshot = namedtuple("PlayerSnapshot", ["entity_id", "x", "y", "size", "is_damaged", "is_dead", "hp", "max_hp",
+                                               "shield", "max_shield", "score"])
+# Pulses have no direction or sprite of their own, so they are given a direction of 0
+ProjectileSnapshot = namedtuple("ProjectileSnapshot", ["entity_id", "x", "y", "direction"])
+# Frame of an effect, popups also have their text and center
+EffectSnapshot = namedtuple("EffectSnapshot", ["entity_id", "x", "y", "curr_frame", "max_frame", "frame_multiplier",
+                                               "text", "center_x", "center_y"])
+# Everything drawn in a frame, in the order View.render takes them
+RenderSnapshot = namedtuple("RenderSnapshot", ["player", "projectiles", "ships", "effects"])
+
+
+"""Copies a ship.
+
+:param ship: ship to copy
+:type ship: Ship
+:returns: the copy
+:rtype: ShipSnapshot
+"""
+
+
+def snapshot_ship(ship):
+    return ShipSnapshot(ship.entity_id, ship.x, ship.y, ship.size, ship.angle, ship.is_damaged, ship.shield)
+
+
+"""Copies an effect.
+
+:param effect: effect to copy
+:type effect: Effect
+:returns: the copy
+:rtype: EffectSnapshot
+"""
+
+
+def snapshot_effect(effect):
+    if effect.entity_id == EffectID.POPUP:
+        return EffectSnapshot(effect.entity_id, effect.x, effect.y, effect.curr_frame, effect.max_frame,
+                              effect.frame_multiplier, effect.text, effect.center_x, effect.center_y)
+    return EffectSnapshot(effect.entity_id, effect.x, effect.y, effect.curr_frame, effect.max_frame,
+                          effect.frame_multiplier, None, None, None)
+
+
+"""Copies everything drawn in a frame.
+
+:param player: the player's ship
+:type player: Player
+:param projectiles: every projectile
+:type projectiles: iterable of Projectile
+:param ships: every ship other than the player
+:type ships: iterable of Ship
+:param effects: every effect
+:type effects: [Effect]
+:returns: the snapshot
+:rtype: RenderSnapshot
+"""
+
+
+def take_snapshot(player, projectiles, ships, effects):
+    return RenderSnapshot(PlayerSnapshot(player.entity_id, player.x, player.y, player.size, player.is_damaged,
+                                         player.is_dead, player.hp, player.max_hp, player.shield, player.max_shield,
+                                         player.score),
+                          tuple(ProjectileSnapshot(projectile.entity_id, projectile.x, projectile.y,
+                                                   getattr(projectile, "direction", 0))
+                                for projectile in projectiles),
+                          tuple(snapshot_ship(ship) for ship in ships),
+                          tuple(snapshot_effect(effect) for effect in effects))
@@ -0,0 +1,76 @@
+from utils import config
+
+"""Schedules the game's sound effects. Sounds asked for during a tick are merged so each one plays at most once per
+tick, then played in order of priority once the tick is over. A sound already playing on as many channels as its voice
+limit is dropped, and only sounds with a priority above zero may cut off the oldest playing sound when every channel
+is busy.
+"""
+
+
+class SoundScheduler:
+    """Constructor to make the scheduler.
+
+    :param sounds: sounds by name
+    :type sounds: {str: pygame.mixer.Sound}
+    :param mixer: mixer to find channels with, the pygame mixer or a NullMixer
+    :type mixer: module or NullMixer
+    :param voice_limits: most channels each sound can play on at once, by name
+    :type voice_limits: {str: int}
+    :param priorities: priority of each sound by name, higher ones are played first
+    :type priorities: {str: int}
+    """
+
+    def __init__(self, sounds, mixer, voice_limits=config.sound_voice_limits, priorities=config.sound_priorities):
+        self._sounds = sounds
+        self._mixer = mixer
+        self._voice_limits = voice_limits
+        self._priorities = priorities
+        # Sound names asked for this tick to how many times they were asked for
+        self._requests = {}
+        # Sounds asked for, played, merged into another request of the same tick, and dropped
+        self.requested = 0
+        self.played = 0
+        self.merged = 0
+        self.dropped = 0
+
+    """Asks for a sound to be played at the end of the tick.
+
+    :param name: name of the sound
+    :type name: str
+    """
+
+    def request(self, name):
+        self.requested += 1
+        if name in self._requests:
+            self._requests[name] += 1
+            self.merged += 1
+        else:
+            self._requests[name] = 1
+
+    """Plays the sounds asked for this tick, highest priority first.
+    """
+
+    def flush(self):
+        if not self._requests:
+            return
+        for name in sorted(self._requests, key=lambda sound_name: -self._priorities.get(sound_name, 0)):
+            sound = self._sounds[name]
+            if sound.get_num_channels() >= self._voice_limits.get(name, 1):
+                self.dropped += 1
+                continue
+            channel = self._mixer.find_channel(self._priorities.get(name, 0) > 0)
+            if channel is None:
+                self.dropped += 1
+                continue
+            channel.play(sound)
+            self.played += 1
+        self._requests = {}
+
+    """Returns how many sounds were asked for and what happened to them.
+
+    :returns: counts of sounds requested, played, merged, and dropped
+    :rtype: {str: int}
+    """
+
+    def get_stats(self):
+        return {"REQUESTED": self.requested, "PLAYED": self.played, "MERGED": self.merged, "DROPPED": self.dropped}
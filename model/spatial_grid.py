@@ -0,0 +1,66 @@
+import math
+
+from utils import config
+
+"""Uniform grid used as a broadphase for projectile and ship collisions. Every ship is bucketed into all the cells its
+hit radius can reach, so a projectile only has to be tested against the ships sharing its cell.
+"""
+
+
+class SpatialGrid:
+    # Largest distance other than the ship's own hit box that a projectile can interact with a ship from:
+    # air bursts in Model._check_if_hit and splash damage in Model._check_splash_damage
+    _interaction_range = max(int(config.ship_size * .7), config.ship_size * .75)
+
+    """Constructor to make an empty grid.
+
+    :param cell_size: width and height of each cell in pixels
+    :type cell_size: int
+    """
+
+    def __init__(self, cell_size=config.ship_size):
+        self._cell_size = cell_size
+        # Maps (column, row) to the ships whose reach overlaps that cell
+        self._cells = {}
+
+    """Clears the grid and buckets the given ships. Ships keep the order they have in the list inside every cell.
+
+    :param ships: ships to bucket
+    :type ships: [Ship]
+    """
+
+    def rebuild(self, ships):
+        self._cells = {}
+        cells = self._cells
+        cell_size = self._cell_size
+        for ship in ships:
+            half_size = ship.size / 2
+            center_x = ship.x + half_size
+            center_y = ship.y + half_size
+            # Distances are truncated before comparison, so anything up to 1 pixel past the range can still count
+            reach = max(ship.size / 4, self._interaction_range) + 1
+            left = math.floor((center_x - reach) / cell_size)
+            right = math.floor((center_x + reach) / cell_size)
+            top = math.floor((center_y - reach) / cell_size)
+            bottom = math.floor((center_y + reach) / cell_size)
+            for column in range(left, right + 1):
+                for row in range(top, bottom + 1):
+                    cell = cells.get((column, row))
+                    if cell is None:
+                        cells[(column, row)] = [ship]
+                    else:
+                        cell.append(ship)
+
+    """Returns the ships that could be hit by the given projectile, in the order they were bucketed.
+
+    :param projectile: projectile to find nearby ships for
+    :type projectile: Projectile
+    :returns: ships near the projectile
+    :rtype: [Ship]
+    """
+
+    def query(self, projectile):
+        half_size = projectile.size / 2
+        column = math.floor((projectile.x + half_size) / self._cell_size)
+        row = math.floor((projectile.y + half_size) / self._cell_size)
+        return self._cells.get((column, row), ())
@@ -0,0 +1,133 @@
+import math
+
+from utils import config
+
+"""Nearest neighbour index over a group of ships. Ships are bucketed by their position and searched ring by ring
+outwards from the source, giving the same target Model.find_closest_target would find with a linear scan.
+"""
+
+
+class TargetIndex:
+    """Constructor to make an empty index.
+
+    :param cell_size: width and height of each cell in pixels
+    :type cell_size: int
+    """
+
+    def __init__(self, cell_size=config.ship_size * 2):
+        self._cell_size = cell_size
+        # Maps (column, row) to a list of (order, ship)
+        self._cells = {}
+        # Position of the next ship in the original list, used to break ties the same way the linear scan does
+        self._order = 0
+        # Bounds of the occupied cells: left column, right column, top row, bottom row
+        self._bounds = None
+
+    """Clears the index and adds the given ships.
+
+    :param ships: ships that can be targeted
+    :type ships: [Ship]
+    """
+
+    def rebuild(self, ships):
+        self._cells = {}
+        self._order = 0
+        self._bounds = None
+        self.extend(ships)
+
+    """Adds ships to the end of the index. Ships in stealth cannot be targeted and are skipped.
+
+    :param ships: ships that can be targeted
+    :type ships: [Ship]
+    """
+
+    def extend(self, ships):
+        cells = self._cells
+        cell_size = self._cell_size
+        for ship in ships:
+            order = self._order
+            self._order += 1
+            if ship.stealth:
+                continue
+            column = math.floor(ship.x / cell_size)
+            row = math.floor(ship.y / cell_size)
+            cell = cells.get((column, row))
+            if cell is None:
+                cells[(column, row)] = [(order, ship)]
+            else:
+                cell.append((order, ship))
+            if self._bounds is None:
+                self._bounds = [column, column, row, row]
+            else:
+                bounds = self._bounds
+                bounds[0] = min(bounds[0], column)
+                bounds[1] = max(bounds[1], column)
+                bounds[2] = min(bounds[2], row)
+                bounds[3] = max(bounds[3], row)
+
+    """Finds the closest ship to the given entity. Matches Model.find_closest_target, including its distance
+    truncation, maximum range, and picking the later ship when two are the same distance away.
+
+    :param source: Source ship or projectile to use as origin
+    :type source: Ship or Projectile
+    :returns: closest ship to the source, or none
+    :rtype: Ship or None
+    """
+
+    def find_closest(self, source):
+        if self._bounds is None:
+            return None
+        x = source.x
+        y = source.y
+        cell_size = self._cell_size
+        column = math.floor(x / cell_size)
+        row = math.floor(y / cell_size)
+        left, right, top, bottom = self._bounds
+        last_ring = max(column - left, right - column, row - top, bottom - row)
+        minimum = config.display_width * 3
+        closest_ship = None
+        closest_order = -1
+        ring = 0
+        while ring <= last_ring:
+            # Every ship in this ring or further out is more than (ring - 1) cells away
+            if (ring - 1) * cell_size > minimum + 1:
+                break
+            for cell in self._ring(column, row, ring):
+                for order, ship in cell:
+                    distance = int(abs(math.sqrt((x - ship.x) ** 2 + (y - ship.y) ** 2)))
+                    if distance < minimum or (distance == minimum and order > closest_order):
+                        minimum = distance
+                        closest_ship = ship
+                        closest_order = order
+            ring += 1
+        return closest_ship
+
+    """Returns the occupied cells that are exactly the given number of cells away from a cell.
+
+    :param column: column of the center cell
+    :type column: int
+    :param row: row of the center cell
+    :type row: int
+    :param ring: number of cells away from the center
+    :type ring: int
+    :returns: occupied cells in the ring
+    :rtype: [[(int, Ship)]]
+    """
+
+    def _ring(self, column, row, ring):
+        cells = self._cells
+        if ring == 0:
+            cell = cells.get((column, row))
+            return [] if cell is None else [cell]
+        result = []
+        for x in range(column - ring, column + ring + 1):
+            for y in (row - ring, row + ring):
+                cell = cells.get((x, y))
+                if cell is not None:
+                    result.append(cell)
+        for y in range(row - ring + 1, row + ring):
+            for x in (column - ring, column + ring):
+                cell = cells.get((x, y))
+                if cell is not None:
+                    result.append(cell)
+        return result
@@ -0,0 +1,64 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# Imported first to avoid a circular import between the models and entities
+import model.model
+from model.menu_model import MenuModel
+from entities.projectiles.missile import Missile
+from utils import enemy_generator
+from utils.ids.enemy_id import EnemyID
+from utils.ids.projectile_id import ProjectileID
+
+"""Tests for the menu model, which ticks without going through Model.tick.
+Run from the repository root:
+    py -m unittest discover tests
+"""
+
+
+class MenuModelTest(unittest.TestCase):
+    """Starts pygame for the sounds the model loads.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    """Makes a menu model with one enemy ship to target.
+    """
+
+    def setUp(self):
+        self.model = MenuModel()
+        self.enemy = enemy_generator.generate_enemy(EnemyID.MANDIBLE, 100, 100)
+        self.model.enemy_ships.append(self.enemy)
+
+    """Fires a missile that has lost its target and checks it picks the enemy on screen.
+    """
+
+    def test_missile_retargets(self):
+        missile = Missile(10, 300, 500, 90, 0, ProjectileID.FRIENDLY_MISSILE, None)
+        missile.target_destroyed = True
+        self.model.friendly_projectiles.append(missile)
+        self.model.tick()
+        self.assertIs(missile.target, self.enemy)
+        self.assertIs(missile.target, self.model.find_closest_target(missile, self.model.enemy_ships))
+
+    """Checks a missile does not retarget to a ship removed by clearing the model.
+    """
+
+    def test_missile_ignores_cleared_ships(self):
+        self.model.tick()
+        self.model.clear()
+        missile = Missile(10, 300, 500, 90, 0, ProjectileID.FRIENDLY_MISSILE, None)
+        missile.target_destroyed = True
+        self.model.friendly_projectiles.append(missile)
+        self.model.tick()
+        self.assertIsNone(missile.target)
+
+
+if __name__ == "__main__":
+    unittest.main()
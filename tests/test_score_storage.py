@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+from utils import score_storage
+from utils.ids.difficulty_id import DifficultyID
+from utils.ids.gamemode_id import GameModeID
+
+"""Tests for reading, migrating, and writing the saved scores and pilot.
+Run from the repository root:
+    py -m unittest discover tests
+"""
+
+
+class MigrateTest(unittest.TestCase):
+    """Makes a folder to write save files to.
+    """
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.folder.name, "data.json")
+
+    """Removes the folder and the files written to it.
+    """
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    """Checks a key the migration does not know about is kept through migrating, writing, and reading back.
+    """
+
+    def test_unknown_key_survives_round_trip(self):
+        saved = {"PILOT": {"NAME": "Pilot-a123", "SHIP": None, "WEAPON": None, "COLOR": "RED"},
+                 "SCORES": {},
+                 "SETTINGS": {"VOLUME": 0.5}}
+        data = score_storage.migrate(saved)
+        self.assertEqual(data["SETTINGS"], {"VOLUME": 0.5})
+        self.assertEqual(data["PILOT"]["COLOR"], "RED")
+        writer = score_storage.ScoreWriter(self.file_path)
+        writer.save(data)
+        writer.flush()
+        self.assertIsNone(writer.error)
+        loaded = score_storage.load_data(self.file_path)
+        self.assertEqual(loaded, data)
+        self.assertEqual(loaded["SETTINGS"], {"VOLUME": 0.5})
+
+    """Checks broken scores are replaced and integer keys are turned into strings, without changing the saved data.
+    """
+
+    def test_scores_are_filled_in(self):
+        game_mode = GameModeID.CLASSIC.value
+        difficulty = DifficultyID.HARD.value
+        saved = {"SCORES": {game_mode: {difficulty: {"SHIP": 1, "WEAPON": 1, "SCORE": 50}}, "99": {"KEPT": True}}}
+        data = score_storage.migrate(saved)
+        self.assertEqual(data["SCORES"][str(game_mode)][str(difficulty)]["SCORE"], 50)
+        self.assertEqual(data["SCORES"]["99"], {"KEPT": True})
+        for mode in GameModeID:
+            for level in DifficultyID:
+                self.assertIsInstance(data["SCORES"][str(mode.value)][str(level.value)]["SCORE"], int)
+        self.assertNotIn("PILOT", saved)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,15 +10,57 @@ display_width = 1024
 display_height = 720
 ship_size = 90
 game_fps = 60
+# Most ticks the game runs in one frame to catch up when rendering falls behind
+max_ticks_per_frame = 5
+# Runs each frame's ticks on a worker thread while the frame before is drawn from a snapshot of the model, so what is
+# shown and the keys read are a frame behind
+threaded_tick = False
 game_title = 'Toh'
+# Memory budget in megabytes for rotated sprites, and the degrees their angles are rounded to
+rotation_cache_size = 64
+rotation_angle_step = 2
+# Most rendered strings to keep for each font
+text_cache_size = 64
+# Only redraws and updates the parts of the game screen that changed, the background stops scrolling when on
+dirty_rects = False
+# Folder to save scaled sprites to so later starts skip scaling them, or None to scale them on every start
+sprite_cache_dir = None
+# Scales the sprites the game mode does not need right away on a background thread, readying them for drawing between
+# frames. Off by default since it ends up holding every sprite of every game mode in memory
+prefetch_assets = False
+# Most channels each sound effect can play on at once, and their priorities. Sounds with a higher priority play
+# first, and ones above zero can cut off the oldest playing sound when every channel is busy
+sound_voice_limits = {"BULLET": 4, "MISSILE": 4, "EXPLOSION": 6, "RAILGUN": 2}
+sound_priorities = {"BULLET": 0, "MISSILE": 1, "EXPLOSION": 2, "RAILGUN": 3}
+# JSON file to record each game's seed and inputs to, for playing back with headless.py --replay, or None. Ships
+# left over from the menu do not carry over into a recorded game, so it can be played back exactly
+record_inputs = None
+# Most free projectiles or explosions of each kind kept for reuse
+pool_size = 2000
+# Number of frames the profiler keeps timings of, and a CSV file to write every frame's timings to or None
+profiler_window = 300
+profiler_csv = None
 
-# Player ship and weapon chosen:
-try:
-    player_ship = PlayerID(score_storage.data["PILOT"]["SHIP"])
-    weapon = WeaponID(score_storage.data["PILOT"]["WEAPON"])
-    player_name = score_storage.data["PILOT"]["NAME"]
-except KeyError:
-    score_storage.construct_data()
-    player_ship = PlayerID(score_storage.data["PILOT"]["SHIP"])
-    weapon = WeaponID(score_storage.data["PILOT"]["WEAPON"])
-    player_name = score_storage.data["PILOT"]["NAME"]
+# Player ship, weapon, and name chosen are read from the saved pilot the first time they are used
+pilot_settings = ["player_ship", "weapon", "player_name"]
+
+"""Reads the player's ship, weapon, and name from the saved pilot when one of them is first used, so importing the
+config does not read the save file. Any of them already set are kept.
+
+:param name: name of the setting
+:type name: str
+:returns: the setting
+:rtype: PlayerID or WeaponID or str
+:raises: AttributeError if the setting does not exist
+"""
+
+
+def __getattr__(name):
+    if name not in pilot_settings:
+        raise AttributeError("module " + __name__ + " has no attribute " + name)
+    pilot = score_storage.data["PILOT"]
+    settings = globals()
+    settings.setdefault("player_ship", PlayerID(pilot["SHIP"]))
+    settings.setdefault("weapon", WeaponID(pilot["WEAPON"]))
+    settings.setdefault("player_name", pilot["NAME"])
+    return settings[name]
@@ -0,0 +1,20 @@
+import random
+
+"""Random number stream the game draws from. Every Model has its own stream and makes it the current one while it runs,
+so the entities and enemy AI of a model draw from its stream, and a model made with a seeded stream plays out the same
+way every time it is given the same inputs.
+"""
+
+# Stream of the model that is running
+stream = random.Random()
+
+"""Makes the given stream the one the game draws from.
+
+:param new_stream: stream to draw from
+:type new_stream: random.Random
+"""
+
+
+def use(new_stream):
+    global stream
+    stream = new_stream
@@ -0,0 +1,73 @@
+from utils import config
+
+"""Pool of reusable objects of one class. Objects handed back to the pool are reset by calling their constructor
+again on the next acquire, instead of allocating a new object and leaving the old one to the garbage collector.
+"""
+
+
+class ObjectPool:
+    """Constructor to make an empty pool.
+
+    :param cls: class of the objects in the pool
+    :type cls: type
+    :param max_size: most free objects kept, any more released are left to the garbage collector
+    :type max_size: int
+    """
+
+    def __init__(self, cls, max_size=config.pool_size):
+        self._cls = cls
+        self._max_size = max_size
+        self._free = []
+        # Objects made new, reused from the pool, handed back, and dropped with the pool full
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.dropped = 0
+        self.in_use = 0
+
+    """Returns an object made with the given constructor arguments, reusing a free one if there is one.
+
+    :returns: the object
+    :rtype: object
+    """
+
+    def acquire(self, *args, **kwargs):
+        self.in_use += 1
+        if self._free:
+            obj = self._free.pop()
+            obj.__init__(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self._cls(*args, **kwargs)
+
+    """Hands an object back to the pool. It must not be used again until it is acquired.
+
+    :param obj: object to hand back
+    :type obj: object
+    """
+
+    def release(self, obj):
+        self.in_use = max(0, self.in_use - 1)
+        if len(self._free) < self._max_size:
+            self._free.append(obj)
+            self.released += 1
+        else:
+            self.dropped += 1
+
+    """Forgets the objects in use, such as when the model holding them is thrown away without handing them back. Free
+    objects are kept for reuse.
+    """
+
+    def reset(self):
+        self.in_use = 0
+
+    """Returns how full the pool is and how often it has been reused.
+
+    :returns: counts of objects in use, free, created, reused, released, and dropped
+    :rtype: {str: int}
+    """
+
+    def get_stats(self):
+        return {"IN USE": self.in_use, "FREE": len(self._free), "CREATED": self.created, "REUSED": self.reused,
+                "RELEASED": self.released, "DROPPED": self.dropped}
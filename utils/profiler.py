@@ -0,0 +1,152 @@
+import atexit
+import csv
+import time
+from collections import deque
+
+from utils import config
+
+"""Times each stage of a frame so frame drops can be traced back to the part of the game causing them. Stages are
+timed between start and stop calls, added up over the frame, and kept for a rolling window of frames. Does nothing
+while disabled.
+"""
+
+
+class Profiler:
+    # Stages in the order they happen in a frame
+    sections = ["EVENTS", "INPUT", "SHIPS", "AI", "PROJECTILES", "EFFECTS", "BACKGROUND", "RENDER SHIPS",
+                "RENDER PROJECTILES", "RENDER EFFECTS", "HUD", "UPDATE"]
+    # Entities counted every frame
+    counts = ["SHIPS", "ENEMY PROJECTILES", "FRIENDLY PROJECTILES", "EFFECTS"]
+
+    """Constructor to make a disabled profiler.
+
+    :param window: number of frames to keep timings for
+    :type window: int
+    """
+
+    def __init__(self, window=config.profiler_window):
+        self.enabled = False
+        # If the overlay is drawn in game
+        self.show_overlay = False
+        # Seconds spent in each section over the last frames
+        self._history = {section: deque(maxlen=window) for section in self.sections}
+        # Seconds spent in each section so far this frame
+        self._frame = dict.fromkeys(self.sections, 0)
+        # When each running section started
+        self._starts = {}
+        self._frame_number = 0
+        self._csv_file = None
+        self._csv_writer = None
+
+    """Starts timing a section.
+
+    :param section: name of the section
+    :type section: str
+    """
+
+    def start(self, section):
+        if self.enabled:
+            self._starts[section] = time.perf_counter()
+
+    """Stops timing a section, adding the time since it started to this frame.
+
+    :param section: name of the section
+    :type section: str
+    """
+
+    def stop(self, section):
+        start = self._starts.pop(section, None)
+        # The profiler may have been turned on partway through the section
+        if self.enabled and start is not None:
+            self._frame[section] += time.perf_counter() - start
+
+    """Ends the frame, storing its timings and writing them to the CSV file if one is open.
+
+    :param counts: number of each kind of entity this frame
+    :type counts: {str: int}
+    """
+
+    def end_frame(self, counts):
+        if not self.enabled:
+            return
+        for section, seconds in self._frame.items():
+            self._history[section].append(seconds)
+        if self._csv_writer is not None:
+            self._csv_writer.writerow([self._frame_number] +
+                                      [round(self._frame[section] * 1000, 4) for section in self.sections] +
+                                      [counts.get(name, 0) for name in self.counts])
+        self._frame = dict.fromkeys(self.sections, 0)
+        self._frame_number += 1
+
+    """Returns the given percentile of a section's frame times.
+
+    :param section: name of the section
+    :type section: str
+    :param percentile: percentile between 0 and 100
+    :type percentile: float
+    :returns: time in milliseconds, 0 if nothing was timed yet
+    :rtype: float
+    """
+
+    def percentile(self, section, percentile):
+        times = sorted(self._history[section])
+        if not times:
+            return 0
+        index = min(len(times) - 1, int(len(times) * percentile / 100))
+        return times[index] * 1000
+
+    """Returns the 50th, 95th, and 99th percentile times of every section.
+
+    :returns: list of section name and its percentiles in milliseconds
+    :rtype: [(str, float, float, float)]
+    """
+
+    def summary(self):
+        return [(section, self.percentile(section, 50), self.percentile(section, 95), self.percentile(section, 99))
+                for section in self.sections]
+
+    """Starts writing every frame's timings and entity counts to a CSV file, enabling the profiler.
+
+    :param path: path of the CSV file
+    :type path: str
+    """
+
+    def open_csv(self, path):
+        self.close_csv()
+        self._csv_file = open(path, "w", newline="")
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(["FRAME"] + [section + " MS" for section in self.sections] + self.counts)
+        self.enabled = True
+        # Closes the file on exit if it is still open, only one handler is kept however often files are opened
+        atexit.register(self.close_csv)
+
+    """Finishes writing the CSV file if one is open.
+    """
+
+    def close_csv(self):
+        if self._csv_file is not None:
+            atexit.unregister(self.close_csv)
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+            self.enabled = self.show_overlay
+
+    """Returns if frames are being written to a CSV file.
+
+    :returns: if a CSV file is open
+    :rtype: bool
+    """
+
+    def writing_csv(self):
+        return self._csv_file is not None
+
+    """Shows or hides the in game overlay. Profiling stays on while a CSV file is open.
+    """
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self.enabled = self.show_overlay or self._csv_file is not None
+
+
+# Profiler shared by the controller, model, and view
+profiler = Profiler()
@@ -1,62 +1,234 @@
+import atexit
 import json
+import os
 import random
 import string
+import threading
 
 from utils.ids.difficulty_id import DifficultyID
 from utils.ids.gamemode_id import GameModeID
 from utils.ids.player_id import PlayerID
 from utils.ids.weapon_id import WeaponID
 
-data = {}
+"""Writes and reads scores and the pilot name from a file. The file is read the first time the data is used, not on
+import. Saves are written on a background thread through a
+temporary file that is renamed over the old one, so a crash partway through a save leaves the last saved file whole.
+Saves made while another is waiting to be written are merged into it, and anything not yet written is written on exit.
+"""
+
+# File the scores and pilot are kept in
+path = "data.json"
+
+
+"""Makes a random name for a new pilot.
+
+:returns: the name
+:rtype: str
+"""
+
+
+def make_pilot_name():
+    return "Pilot-" + random.choice(string.ascii_letters) + str(random.randint(100, 999))
+
+
+"""Makes the score of a game mode and difficulty that has not been attempted.
+
+:returns: the score
+:rtype: {str: int}
+"""
+
+
+def make_score():
+    return {"SHIP": PlayerID.CITADEL.value, "WEAPON": WeaponID.GUN.value, "SCORE": 0}
 
 
-def construct_data():
-    letters = string.ascii_letters
-    random.seed()
-    random_letter = random.choice(letters)
-    random_number = str(random.randint(100, 999))
-    data["PILOT"] = {"NAME": "Pilot-" + random_letter + random_number,
-                     "WEAPON": WeaponID.GUN.value,
-                     "SHIP": PlayerID.CITADEL.value}
-    scores = {}
+"""Brings saved data up to date, keeping everything in it that is still valid. Fills in a missing or broken pilot,
+adds game modes and difficulties added since the data was saved, and turns integer keys into the string keys JSON
+reads them back as. Anything else in the data, such as keys added by a newer version, is kept as it was.
+
+:param saved: data read from the file, or None if there was none
+:type saved: dict or None
+:returns: the updated data
+:rtype: dict
+"""
+
+
+def migrate(saved):
+    if not isinstance(saved, dict):
+        saved = {}
+    migrated = dict(saved)
+    pilot = saved.get("PILOT")
+    pilot = dict(pilot) if isinstance(pilot, dict) else {}
+    if not isinstance(pilot.get("NAME"), str):
+        pilot["NAME"] = make_pilot_name()
+    if pilot.get("WEAPON") not in [weapon.value for weapon in WeaponID]:
+        pilot["WEAPON"] = WeaponID.GUN.value
+    if pilot.get("SHIP") not in [ship.value for ship in PlayerID]:
+        pilot["SHIP"] = PlayerID.CITADEL.value
+    saved_scores = saved.get("SCORES")
+    scores = {str(key): value for key, value in saved_scores.items()} if isinstance(saved_scores, dict) else {}
     for game_mode in GameModeID:
-        not_attempted = {"SHIP": PlayerID.CITADEL.value, "WEAPON": WeaponID.GUN.value, "SCORE": 0}
-        results = {}
+        saved_results = scores.get(str(game_mode.value))
+        results = {str(key): value for key, value in saved_results.items()} if isinstance(saved_results, dict) else {}
         for difficulty in DifficultyID:
-            results[difficulty.value] = not_attempted.copy()
-        scores[int(game_mode.value)] = results
-    data["SCORES"] = scores
-    with open("data.json", "w") as outfile:
-        json.dump(data, outfile)
+            result = results.get(str(difficulty.value))
+            # Older saves could hold a single score for the whole game mode instead of one per difficulty
+            if not isinstance(result, dict) or not isinstance(result.get("SCORE"), int):
+                results[str(difficulty.value)] = make_score()
+        scores[str(game_mode.value)] = results
+    migrated["PILOT"] = pilot
+    migrated["SCORES"] = scores
+    return migrated
 
 
-read = False
-while not read:
+"""Reads the saved data, updating it to the current format. A file that cannot be read as JSON is kept next to it
+with .corrupt added to its name, and new data is made in its place.
+
+:param file_path: file to read
+:type file_path: str
+:returns: the saved data
+:rtype: dict
+"""
+
+
+def load_data(file_path=path):
     try:
-        with open('data.json') as f:
-            data = json.load(f)
-            read = True
-            f.close()
+        with open(file_path) as f:
+            saved = json.load(f)
     except FileNotFoundError:
-        construct_data()
+        saved = None
+    except ValueError:
+        saved = None
+        try:
+            os.replace(file_path, file_path + ".corrupt")
+        except OSError:
+            pass
+    return migrate(saved)
 
-"""Writes and reads scores and the pilot name from a file."""
 
+"""Writes text to a file by writing a temporary file next to it and renaming it over the file.
 
-def save_data():
-    with open('data.json', 'w') as file:
-        json.dump(data, file)
-        f.close()
+:param file_path: file to write
+:type file_path: str
+:param text: text to write
+:type text: str
+"""
+
+
+def write_atomic(file_path, text):
+    temp_path = file_path + ".tmp"
+    with open(temp_path, "w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, file_path)
 
 
-"""Checks all the existing gamemodes and adds them if they do not exist.
+class ScoreWriter:
+    """Constructor to make the writer, its thread is started on the first save.
+
+    :param file_path: file to write to
+    :type file_path: str
+    """
+
+    def __init__(self, file_path=path):
+        self._file_path = file_path
+        self._condition = threading.Condition()
+        # JSON text of the newest save not written yet, or None
+        self._pending = None
+        self._writing = False
+        self._thread = None
+        # Saves asked for, saves merged into one waiting to be written, and files written
+        self.saves = 0
+        self.merged = 0
+        self.writes = 0
+        # Error from the last write that failed, or None
+        self.error = None
+
+    """Queues the data to be written. The data is turned into JSON right away, so it can keep changing while it waits.
+
+    :param data: data to write
+    :type data: dict
+    """
+
+    def save(self, data):
+        text = json.dumps(data)
+        with self._condition:
+            self.saves += 1
+            if self._pending is not None:
+                self.merged += 1
+            self._pending = text
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ScoreWriter", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    """Waits until every queued save is written.
+    """
+
+    def flush(self):
+        with self._condition:
+            while self._pending is not None or self._writing:
+                self._condition.wait()
+
+    """Writes queued saves until the program ends.
+    """
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                text = self._pending
+                self._pending = None
+                self._writing = True
+            try:
+                write_atomic(self._file_path, text)
+                self.error = None
+            except OSError as e:
+                self.error = e
+            with self._condition:
+                self._writing = False
+                self.writes += 1
+                self._condition.notify_all()
+
+
+writer = ScoreWriter()
+atexit.register(writer.flush)
+
+"""Returns the scores and pilot, reading them from the file the first time.
+
+:returns: the saved data
+:rtype: dict
 """
 
 
-def update_gamemodes():
-    for gamemode in GameModeID:
-        try:
-            test = data["SCORES"][gamemode.value]["SHIP"]
-        except KeyError:
-            data["SCORES"][int(gamemode.value)] = {"SHIP": PlayerID.CITADEL.value, "WEAPON": WeaponID.GUN.value, "SCORE": 0}
-    save_data()
+def get_data():
+    global data
+    if "data" not in globals():
+        data = load_data()
+    return data
+
+
+"""Reads the data from the file the first time score_storage.data is used.
+
+:param name: name of the attribute
+:type name: str
+:returns: the saved data
+:rtype: dict
+:raises: AttributeError if the attribute is not the data
+"""
+
+
+def __getattr__(name):
+    if name == "data":
+        return get_data()
+    raise AttributeError("module " + __name__ + " has no attribute " + name)
+
+
+"""Queues the scores and pilot to be written to the file.
+"""
+
+
+def save_data():
+    writer.save(get_data())
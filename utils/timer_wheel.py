@@ -0,0 +1,115 @@
+"""Schedules calls to be made a number of frames from now. Timers are kept in a ring of slots, one slot per frame, so
+scheduling or cancelling one takes the same time however many are waiting, and each frame only looks at the timers in
+its own slot. Timers due further out than the ring is long wait in their slot for as many turns as they need. Timers
+due on the same frame are called in the order they were scheduled.
+"""
+
+
+class Timer:
+    # Fixed set of attributes instead of a per instance __dict__
+    __slots__ = ("frame", "callback", "args", "cancelled")
+
+    """Constructor to make a timer.
+
+    :param frame: frame of the wheel the timer is due on
+    :type frame: int
+    :param callback: function to call when the timer is due
+    :type callback: callable
+    :param args: arguments to call the function with
+    :type args: tuple
+    """
+
+    def __init__(self, frame, callback, args):
+        self.frame = frame
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    """Stops the timer from being called. Does nothing if it was already called or cancelled.
+    """
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerWheel:
+    """Constructor to make an empty wheel.
+
+    :param slots: number of frames in one turn of the wheel
+    :type slots: int
+    """
+
+    def __init__(self, slots=64):
+        self._slots = [[] for _ in range(slots)]
+        # Frames advanced so far
+        self.frame = 0
+        # Timers scheduled, called, and cancelled so far
+        self.scheduled = 0
+        self.called = 0
+        self.cancelled = 0
+
+    """Schedules a function to be called after the given number of frames.
+
+    :param delay: frames to wait, the function is called on that many calls to advance from now
+    :type delay: int
+    :param callback: function to call
+    :type callback: callable
+    :param args: arguments to call the function with
+    :returns: the timer, which can be cancelled
+    :rtype: Timer
+    :raises: ValueError if the delay is less than one frame
+    """
+
+    def schedule(self, delay, callback, *args):
+        if delay < 1:
+            raise ValueError("Timer delay must be at least one frame:", delay)
+        timer = Timer(self.frame + delay, callback, args)
+        self._slots[timer.frame % len(self._slots)].append(timer)
+        self.scheduled += 1
+        return timer
+
+    """Moves the wheel on by a frame, calling every timer due on it that was not cancelled. Timers scheduled by the
+    functions called are due on later frames.
+    """
+
+    def advance(self):
+        self.frame += 1
+        index = self.frame % len(self._slots)
+        slot = self._slots[index]
+        if not slot:
+            return
+        frame = self.frame
+        due = []
+        waiting = []
+        for timer in slot:
+            if timer.frame == frame:
+                due.append(timer)
+            else:
+                waiting.append(timer)
+        # Waiting timers go back first so any scheduled by the calls below stay after them
+        self._slots[index] = waiting
+        for timer in due:
+            if timer.cancelled:
+                self.cancelled += 1
+            else:
+                self.called += 1
+                timer.callback(*timer.args)
+
+    """Cancels every waiting timer.
+    """
+
+    def clear(self):
+        for slot in self._slots:
+            for timer in slot:
+                timer.cancel()
+            self.cancelled += len(slot)
+            del slot[:]
+
+    """Returns the number of timers waiting, including cancelled ones not yet reached.
+
+    :returns: number of timers
+    :rtype: int
+    """
+
+    def __len__(self):
+        return sum(len(slot) for slot in self._slots)
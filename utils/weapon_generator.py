@@ -1,6 +1,4 @@
-import random
-
-from utils import config
+from utils import config, game_random
 from utils.ids.projectile_id import ProjectileID
 
 projectile_types = [ProjectileID.FRIENDLY_MISSILE, ProjectileID.FRIENDLY_BULLET, ProjectileID.FRIENDLY_FLAK,
@@ -14,34 +12,33 @@ SPREADER = 3  # Fires at a spread
 
 
 def generate_weapon():
-    random.seed()
-    result = {"PROJECTILE SPEED": random.randint(10, 25)}
-    weapon_type = [BURST_FIRE, REGULAR, SPREADER][random.randint(0, 2)]
-    random_fire_rate = random.randint(3, config.game_fps // 2)
+    result = {"PROJECTILE SPEED": game_random.stream.randint(10, 25)}
+    weapon_type = [BURST_FIRE, REGULAR, SPREADER][game_random.stream.randint(0, 2)]
+    random_fire_rate = game_random.stream.randint(3, config.game_fps // 2)
     result["RELOAD"] = random_fire_rate
     if weapon_type == BURST_FIRE:
-        bursts = random.randint(0, 12)
+        bursts = game_random.stream.randint(0, 12)
         result["BURSTS"] = bursts
-        multiple_or_single = random.randint(0, 1)
+        multiple_or_single = game_random.stream.randint(0, 1)
         if multiple_or_single == 0:
             result["PROJECTILE COUNT"] = 1
-            result["SPREAD"] = random.randint(0, 30)
+            result["SPREAD"] = game_random.stream.randint(0, 30)
         else:
-            projectile_count = random.randint(2, 6)
+            projectile_count = game_random.stream.randint(2, 6)
             result["PROJECTILE COUNT"] = projectile_count
-            result["SPREAD"] = random.randint(1, 6) * (projectile_count + 1)
+            result["SPREAD"] = game_random.stream.randint(1, 6) * (projectile_count + 1)
     elif weapon_type == REGULAR:
         result["BURSTS"] = 0
         result["PROJECTILE COUNT"] = 1
-        result["SPREAD"] = random.randint(0, 30)
+        result["SPREAD"] = game_random.stream.randint(0, 30)
     else:
         result["BURSTS"] = 0
-        projectile_count = random.randint(2, 8)
+        projectile_count = game_random.stream.randint(2, 8)
         result["PROJECTILE COUNT"] = projectile_count
-        result["SPREAD"] = random.randint(1, 6) * (projectile_count + 1)
+        result["SPREAD"] = game_random.stream.randint(1, 6) * (projectile_count + 1)
 
-    result["PROJECTILE TYPE"] = projectile_types[random.randint(0, len(projectile_types) - 1)]
-    dps = random.randint(150, 300)
+    result["PROJECTILE TYPE"] = projectile_types[game_random.stream.randint(0, len(projectile_types) - 1)]
+    dps = game_random.stream.randint(150, 300)
     bursts_modifier = result["BURSTS"] if result["BURSTS"] > 0 else 1
     result["DAMAGE"] = dps / ((config.game_fps / random_fire_rate) * (bursts_modifier * result["PROJECTILE COUNT"]))
     if result["DAMAGE"] == 0:
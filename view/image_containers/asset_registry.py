@@ -0,0 +1,248 @@
+import os
+import threading
+
+import pygame
+
+from utils import config
+
+"""Loads and scales every sprite once per process, so the menu and every game view share the same surfaces instead of
+loading and scaling them again on each start. Scaled sprites can also be saved to a cache folder, kept apart by screen
+resolution and ship size, to skip scaling the full size sheets on later starts. Sheets can be loaded and scaled ahead
+of time on another thread, the scaled frames are then converted for drawing on the main thread.
+"""
+
+
+class AssetRegistry:
+    """Constructor to make an empty registry.
+
+    :param cache_dir: folder to save scaled sprites to and load them from, or None to not use one
+    :type cache_dir: str or None
+    """
+
+    def __init__(self, cache_dir=config.sprite_cache_dir):
+        self._cache_dir = cache_dir
+        # Maps (path, frames, width, height, alpha) to the scaled frames
+        self._frames = {}
+        # Frames scaled ahead of time that are not converted for drawing yet, by the same keys
+        self._prepared = {}
+        self._lock = threading.Lock()
+        # Counters for sprites built from their sheets, shared, and loaded from the cache folder
+        self.built = 0
+        self.reused = 0
+        self.cached = 0
+
+    """Returns the frames of a sprite sheet laid out left to right, each scaled to the given size. A sheet with one
+    frame is scaled whole, otherwise each frame is a square as tall as the sheet is wide divided by the frame count.
+
+    :param path: path of the sprite sheet
+    :type path: str
+    :param count: number of frames in the sheet
+    :type count: int
+    :param size: width and height to scale each frame to
+    :type size: (int, int)
+    :param alpha: if the frames keep their transparency
+    :type alpha: bool
+    :returns: new list of the scaled frames, the surfaces are shared and must not be drawn on
+    :rtype: [pygame.Surface]
+    """
+
+    def get_frames(self, path, count, size, alpha=True):
+        key = (path, count, int(size[0]), int(size[1]), alpha)
+        frames = self._frames.get(key)
+        if frames is None:
+            with self._lock:
+                frames = self._prepared.pop(key, None)
+            if frames is not None:
+                frames = self._convert(frames, alpha)
+                self._save_cached(key, frames)
+            else:
+                frames = self._load_cached(key)
+                if frames is None:
+                    frames = self._build(key)
+                    self._save_cached(key, frames)
+            with self._lock:
+                self._frames[key] = frames
+        else:
+            self.reused += 1
+        return list(frames)
+
+    """Returns a whole image scaled to the given size.
+
+    :param path: path of the image
+    :type path: str
+    :param size: width and height to scale to
+    :type size: (int, int)
+    :param alpha: if the image keeps its transparency
+    :type alpha: bool
+    :returns: the scaled image, shared and must not be drawn on
+    :rtype: pygame.Surface
+    """
+
+    def get_image(self, path, size, alpha=True):
+        return self.get_frames(path, 1, size, alpha)[0]
+
+    """Forgets every scaled sprite, such as after the resolution or ship size changes. The cache folder is kept, its
+    sprites are already kept apart by resolution and ship size.
+    """
+
+    def clear(self):
+        with self._lock:
+            self._frames = {}
+            self._prepared = {}
+
+    """Loads and scales the frames of a sprite sheet without converting them, so it can be done on a background
+    thread. Does nothing if the frames are already loaded or scaled.
+
+    :param path: path of the sprite sheet
+    :type path: str
+    :param count: number of frames in the sheet
+    :type count: int
+    :param size: width and height to scale each frame to
+    :type size: (int, int)
+    :param alpha: if the frames keep their transparency
+    :type alpha: bool
+    """
+
+    def prepare(self, path, count, size, alpha=True):
+        key = (path, count, int(size[0]), int(size[1]), alpha)
+        with self._lock:
+            if key in self._frames or key in self._prepared:
+                return
+        frames = self._scale(pygame.image.load(path), count, key[2], key[3])
+        with self._lock:
+            if key not in self._frames:
+                self._prepared[key] = frames
+
+    """Converts frames scaled ahead of time for drawing. Has to be called on the main thread, converting only the
+    scaled frames of a few sprites is quick enough to be done between frames.
+
+    :param limit: most sprites to convert, or None for all of them
+    :type limit: int or None
+    :returns: number of sprites converted
+    :rtype: int
+    """
+
+    def finish_prepared(self, limit=None):
+        with self._lock:
+            keys = list(self._prepared)[:limit]
+            prepared = {key: self._prepared.pop(key) for key in keys}
+        for key, frames in prepared.items():
+            if key not in self._frames:
+                frames = self._convert(frames, key[4])
+                self._save_cached(key, frames)
+                with self._lock:
+                    self._frames[key] = frames
+        return len(prepared)
+
+    """Loads a sprite sheet and scales its frames.
+
+    :param key: path, frame count, width, height, and transparency of the sprites
+    :type key: (str, int, int, int, bool)
+    :returns: the scaled frames
+    :rtype: [pygame.Surface]
+    """
+
+    def _build(self, key):
+        path, count, width, height, alpha = key
+        sheet = pygame.image.load(path)
+        sheet = sheet.convert_alpha() if alpha else sheet.convert()
+        return self._scale(sheet, count, width, height)
+
+    """Cuts a sprite sheet into its frames and scales each one.
+
+    :param sheet: the sprite sheet
+    :type sheet: pygame.Surface
+    :param count: number of frames in the sheet
+    :type count: int
+    :param width: width to scale each frame to
+    :type width: int
+    :param height: height to scale each frame to
+    :type height: int
+    :returns: the scaled frames
+    :rtype: [pygame.Surface]
+    """
+
+    def _scale(self, sheet, count, width, height):
+        self.built += 1
+        if count == 1:
+            return [pygame.transform.scale(sheet, (width, height))]
+        sprite_size = sheet.get_width() // count
+        frames = []
+        for i in range(count):
+            frame = sheet.subsurface(pygame.Rect((sprite_size * i, 0), (sprite_size, sprite_size)))
+            frames.append(pygame.transform.scale(frame, (width, height)))
+        return frames
+
+    """Converts scaled frames for drawing.
+
+    :param frames: frames straight from their file
+    :type frames: [pygame.Surface]
+    :param alpha: if the frames keep their transparency
+    :type alpha: bool
+    :returns: the converted frames
+    :rtype: [pygame.Surface]
+    """
+
+    def _convert(self, frames, alpha):
+        return [frame.convert_alpha() if alpha else frame.convert() for frame in frames]
+
+    """Returns the paths of the saved sprites for the given key.
+
+    :param key: path, frame count, width, height, and transparency of the sprites
+    :type key: (str, int, int, int, bool)
+    :returns: path of each frame inside the cache folder
+    :rtype: [str]
+    """
+
+    def _get_cache_paths(self, key):
+        path, count, width, height, alpha = key
+        folder = os.path.join(self._cache_dir, "{}x{}_{}".format(config.display_width, config.display_height,
+                                                                  config.ship_size))
+        name = os.path.splitext(os.path.basename(path))[0]
+        return [os.path.join(folder, "{}_{}_{}x{}_{}.png".format(name, count, width, height, i))
+                for i in range(count)]
+
+    """Loads the saved frames for the given key, if every frame is saved and newer than its sprite sheet.
+
+    :param key: path, frame count, width, height, and transparency of the sprites
+    :type key: (str, int, int, int, bool)
+    :returns: the saved frames, or None if they have to be built
+    :rtype: [pygame.Surface] or None
+    """
+
+    def _load_cached(self, key):
+        if self._cache_dir is None:
+            return None
+        cache_paths = self._get_cache_paths(key)
+        try:
+            source_time = os.path.getmtime(key[0])
+            if any(os.path.getmtime(cache_path) < source_time for cache_path in cache_paths):
+                return None
+            frames = [pygame.image.load(cache_path) for cache_path in cache_paths]
+        except (OSError, pygame.error):
+            return None
+        self.cached += 1
+        return self._convert(frames, key[4])
+
+    """Saves scaled frames to the cache folder. Saving is given up on for good if the folder cannot be written to.
+
+    :param key: path, frame count, width, height, and transparency of the sprites
+    :type key: (str, int, int, int, bool)
+    :param frames: the scaled frames
+    :type frames: [pygame.Surface]
+    """
+
+    def _save_cached(self, key, frames):
+        if self._cache_dir is None:
+            return
+        cache_paths = self._get_cache_paths(key)
+        try:
+            os.makedirs(os.path.dirname(cache_paths[0]), exist_ok=True)
+            for frame, cache_path in zip(frames, cache_paths):
+                pygame.image.save(frame, cache_path)
+        except (OSError, pygame.error):
+            self._cache_dir = None
+
+
+# Sprites shared by the menu and game views
+assets = AssetRegistry()
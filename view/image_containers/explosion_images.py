@@ -1,6 +1,5 @@
-import pygame
-
 from utils import config
+from view.image_containers.asset_registry import assets
 
 """Container to hold images for an explosion.
 """
@@ -16,17 +15,8 @@ class ExplosionImages:
     """
 
     def __init__(self, images, size):
-        self.frames = []
-        spritesheet = pygame.image.load(images).convert_alpha()
-        width = spritesheet.get_width()
         # 5 sprites
-        sprite_size = width // 5
-        image_size = (sprite_size, sprite_size)
-        self.frames = []
-        for i in range(5):
-            offset = sprite_size * i
-            self.frames.append(
-                pygame.transform.scale(spritesheet.subsurface(pygame.Rect((offset, 0), image_size)), (size, size)))
+        self.frames = assets.get_frames(images, 5, (size, size))
         self.frame_offset = int(config.game_fps / 30)
 
     """Returns the given frame of the explosion.
@@ -37,6 +27,15 @@ class ExplosionImages:
     :rtype: pygame image
     """
     def get_frame(self, effect):
-        result = self.frames[int(effect.curr_frame / (self.frame_offset * effect.frame_multiplier))]
-        effect.curr_frame += 1
-        return result
+        return self.frames[int(effect.curr_frame / (self.frame_offset * effect.frame_multiplier))]
+
+    """Returns the frame of the explosion and where to draw it.
+
+    :param effect: Effect to grab frame and position from
+    :type effect: Effect
+    :returns: Frame to show and its top left corner
+    :rtype: (pygame image, (float, float))
+    """
+
+    def get_draw(self, effect):
+        return self.get_frame(effect), (effect.x, effect.y)
@@ -1,4 +1,4 @@
-import pygame
+from view.image_containers.asset_registry import assets
 
 """Container to hold images for ships and projectiles
 """
@@ -15,17 +15,11 @@ class ImageHolder:
 
     def __init__(self, images, size):
         # Sprite sheet consists of 4 sprites by default
-        spritesheet = pygame.image.load(images).convert_alpha()
-        width = spritesheet.get_width()
-        # 4 sprites
-        sprite_size = width // 4
-        image_size = (sprite_size, sprite_size)
-        sprites = []
-        for i in range(4):
-            offset = sprite_size * i
-            sprites.append(
-                pygame.transform.scale(spritesheet.subsurface(pygame.Rect((offset, 0), image_size)), (size, size)))
+        sprites = assets.get_frames(images, 4, (size, size))
         self.base_image = sprites[0]
         self.animated_image = sprites[1]
         self.damaged_image = sprites[2]
         self.shield_damage_image = sprites[3]
+        # Each sprite by name, for caching rotations of them
+        self.variants = {"BASE": self.base_image, "ANIMATED": self.animated_image, "DAMAGED": self.damaged_image,
+                         "SHIELD_DAMAGE": self.shield_damage_image}
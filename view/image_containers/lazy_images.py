@@ -0,0 +1,93 @@
+import threading
+
+"""Dictionary of images that loads each one the first time it is asked for. Each key has its own lock, so loading one
+image never waits on a different image being loaded by another thread. The sprite sheet each image is made from can
+be given, so the sheets can be scaled ahead of time without loading the images themselves.
+"""
+
+
+class LazyImages(dict):
+    """Constructor to make the dictionary with nothing loaded yet.
+
+    :param loaders: maps each key to a function with no arguments that loads its image
+    :type loaders: {EntityID: function}
+    :param sheets: maps keys to the path, frame count, frame size, and transparency of the sheet their image is made
+        from, as AssetRegistry.prepare takes them
+    :type sheets: {EntityID: (str, int, (int, int), bool)} or None
+    """
+
+    def __init__(self, loaders, sheets=None):
+        super().__init__()
+        self._loaders = loaders
+        self._sheets = sheets or {}
+        # Only held long enough to get the lock of a key
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    """Loads an image that was asked for before it was loaded.
+
+    :param key: key of the image
+    :type key: EntityID
+    :returns: the image
+    :rtype: ImageHolder or pygame.Surface
+    """
+
+    def __missing__(self, key):
+        return self.load(key)
+
+    """Returns an image, loading it if needed, or the default if nothing can load it.
+
+    :param key: key of the image
+    :type key: EntityID
+    :param default: returned if nothing can load the key
+    :type default: object
+    :returns: the image or the default
+    :rtype: ImageHolder or pygame.Surface
+    """
+
+    def get(self, key, default=None):
+        image = dict.get(self, key)
+        if image is None:
+            if key not in self._loaders:
+                return default
+            image = self.load(key)
+        return image
+
+    """Loads an image if it is not loaded yet.
+
+    :param key: key of the image
+    :type key: EntityID
+    :returns: the image
+    :rtype: ImageHolder or pygame.Surface
+    """
+
+    def load(self, key):
+        image = dict.get(self, key)
+        if image is not None:
+            return image
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            image = dict.get(self, key)
+            if image is None:
+                image = self._loaders[key]()
+                self[key] = image
+            return image
+
+    """Returns the keys that can be loaded but are not yet.
+
+    :returns: keys not loaded yet
+    :rtype: [EntityID]
+    """
+
+    def get_unloaded(self):
+        return [key for key in self._loaders if key not in self]
+
+    """Returns the sprite sheets of the images not loaded yet.
+
+    :returns: path, frame count, frame size, and transparency of each sheet
+    :rtype: [(str, int, (int, int), bool)]
+    """
+
+    def get_unloaded_sheets(self):
+        return [self._sheets[key] for key in self.get_unloaded() if key in self._sheets]
@@ -1,6 +1,5 @@
-import pygame
-
 from utils import config
+from view.image_containers.text_cache import TextCache
 
 """Container to hold and render text.
 """
@@ -16,6 +15,8 @@ class PopUpImage:
     def __init__(self, font):
         self.current_text = ''
         self.font = font
+        # Rendered popup texts, faded with their surface alpha
+        self.text_cache = TextCache(font)
         # How much the text fades
         self.alpha_decrease = 0
         # Maximum transparency
@@ -39,12 +40,21 @@ class PopUpImage:
             self.current_text = effect.text
             # Places text image on center of screen
             self.alpha_decrease = self.max_alpha // effect.max_frame
-        image = self.font.render(effect.text, 1, (255, 255, 255)).convert_alpha()
-        rect = image.get_rect(center=(effect.center_x, effect.center_y))
-        effect.x, effect.y = rect.topleft
-        effect.curr_frame += 1
+        image = self.text_cache.render(effect.text)
         self.current_alpha -= self.alpha_decrease
         if self.current_alpha <= 0:
             self.current_alpha = self.max_alpha
-        image.fill((255, 255, 255, self.current_alpha), None, pygame.BLEND_RGBA_MULT)
+        image.set_alpha(self.current_alpha)
         return image
+
+    """Returns the given frame of the image and where to draw it, centered on the popup.
+
+    :param effect: Effect to grab frame and other information from
+    :type effect: PopUp
+    :returns: Frame to show and its top left corner
+    :rtype: (pygame image, (int, int))
+    """
+
+    def get_draw(self, effect):
+        image = self.get_frame(effect)
+        return image, image.get_rect(center=(effect.center_x, effect.center_y)).topleft
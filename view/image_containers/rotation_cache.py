@@ -0,0 +1,122 @@
+from collections import OrderedDict
+
+import pygame
+
+from utils import config
+
+"""Cache of rotated sprites so a Surface is not rotated and allocated for every ship and projectile every frame. Angles
+are rounded to a fixed step and the least recently used rotations are dropped once the cache goes over its memory
+budget.
+"""
+
+
+class RotationCache:
+    """Constructor to make an empty cache.
+
+    :param max_bytes: most pixel memory the cached surfaces can take up
+    :type max_bytes: int
+    :param angle_step: degrees to round angles to
+    :type angle_step: int
+    """
+
+    def __init__(self, max_bytes=config.rotation_cache_size * 1024 * 1024, angle_step=config.rotation_angle_step):
+        self._max_bytes = max_bytes
+        self._angle_step = angle_step
+        # Maps (entity ID, image variant, angle) to (rotated surface, blit offset), oldest first
+        self._entries = OrderedDict()
+        self._bytes = 0
+        # Lookups served from the cache and ones that had to rotate
+        self.hits = 0
+        self.misses = 0
+
+    """Returns the image rotated to the given angle and the offset from the image center to its top left corner.
+
+    :param entity_id: ID of the entity the image belongs to
+    :type entity_id: EntityID
+    :param variant: which of the entity's images it is, such as "BASE" or "DAMAGED"
+    :type variant: str or None
+    :param image: unrotated image
+    :type image: pygame.Surface
+    :param angle: angle to rotate the image to
+    :type angle: float
+    :returns: rotated image and the offset to add to the center to place it
+    :rtype: (pygame.Surface, (int, int))
+    """
+
+    def get(self, entity_id, variant, image, angle):
+        key = (entity_id, variant, self._quantize(angle))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return self._add(key, image)
+
+    """Rotates and caches the image at each of the given angles ahead of time.
+
+    :param entity_id: ID of the entity the image belongs to
+    :type entity_id: EntityID
+    :param variant: which of the entity's images it is
+    :type variant: str or None
+    :param image: unrotated image
+    :type image: pygame.Surface
+    :param angles: angles to rotate the image to
+    :type angles: [float]
+    """
+
+    def prewarm(self, entity_id, variant, image, angles):
+        for angle in angles:
+            key = (entity_id, variant, self._quantize(angle))
+            if key not in self._entries:
+                self._add(key, image)
+
+    """Returns how full the cache is and how often it was used.
+
+    :returns: counts of hits, misses, surfaces kept, and the bytes they take up
+    :rtype: {str: int}
+    """
+
+    def get_stats(self):
+        return {"HITS": self.hits, "MISSES": self.misses, "ENTRIES": len(self._entries), "BYTES": self._bytes}
+
+    """Empties the cache.
+    """
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    """Rounds an angle to the nearest step, between 0 and 360.
+
+    :param angle: angle in degrees
+    :type angle: float
+    :returns: rounded angle
+    :rtype: int
+    """
+
+    def _quantize(self, angle):
+        step = self._angle_step
+        return int(round(angle / step)) * step % 360
+
+    """Rotates an image and adds it to the cache under the given key, dropping the oldest entries if over budget.
+
+    :param key: (entity ID, image variant, rounded angle)
+    :type key: tuple
+    :param image: unrotated image
+    :type image: pygame.Surface
+    :returns: rotated image and its blit offset
+    :rtype: (pygame.Surface, (int, int))
+    """
+
+    def _add(self, key, image):
+        rotated = pygame.transform.rotate(image, key[2])
+        width, height = rotated.get_size()
+        entry = (rotated, (-(width // 2), -(height // 2)))
+        self._entries[key] = entry
+        self._bytes += rotated.get_pitch() * height
+        # Always keeps the newest entry, even if it alone is over budget
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            old_image = self._entries.popitem(last=False)[1][0]
+            self._bytes -= old_image.get_pitch() * old_image.get_height()
+        return entry
@@ -1,6 +1,5 @@
-import pygame
-
 from utils import config
+from view.image_containers.asset_registry import assets
 
 """Container to hold images for an explosion.
 """
@@ -14,9 +13,7 @@ class ScreenTintImages:
     """
 
     def __init__(self, image):
-        frame1 = pygame.image.load(image).convert_alpha()
-        frame1 = pygame.transform.scale(frame1, (config.display_width, config.display_height))
-        self.frame = frame1
+        self.frame = assets.get_image(image, (config.display_width, config.display_height))
 
     """Returns the given frame. Always returns a single frame.
 
@@ -26,5 +23,15 @@ class ScreenTintImages:
     :rtype: pygame image"""
 
     def get_frame(self, effect):
-        effect.curr_frame += 1
         return self.frame
+
+    """Returns the frame and where to draw it.
+
+    :param effect: Effect to grab the position from
+    :type effect: Effect
+    :returns: Frame to show and its top left corner
+    :rtype: (pygame image, (float, float))
+    """
+
+    def get_draw(self, effect):
+        return self.frame, (effect.x, effect.y)
@@ -0,0 +1,86 @@
+from collections import OrderedDict
+
+from utils import config
+
+"""Cache of rendered text so the same string is not rendered again every frame. Whole strings are kept with the least
+recently used ones dropped past a set count, and numbers are drawn from a set of single character glyphs.
+"""
+
+
+class TextCache:
+    """Constructor to make an empty cache for a font.
+
+    :param font: Font object to use to render text
+    :type font: pygame Font
+    :param color: color of the text
+    :type color: (int, int, int)
+    :param max_entries: most strings to keep rendered
+    :type max_entries: int
+    """
+
+    def __init__(self, font, color=(255, 255, 255), max_entries=config.text_cache_size):
+        self._font = font
+        self._color = color
+        self._max_entries = max_entries
+        # Maps text to its rendered surface, oldest first
+        self._entries = OrderedDict()
+        # Maps a single character to its rendered surface and how far it moves the next character over
+        self._glyphs = {}
+        # Lookups served from the cache and ones that had to render
+        self.hits = 0
+        self.misses = 0
+
+    """Returns the rendered surface for the given text. The surface is shared, so any alpha set on it stays until
+    it is set again.
+
+    :param text: text to render
+    :type text: str
+    :returns: rendered text
+    :rtype: pygame.Surface
+    """
+
+    def render(self, text):
+        surface = self._entries.get(text)
+        if surface is not None:
+            self._entries.move_to_end(text)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self._font.render(text, 1, self._color).convert_alpha()
+        self._entries[text] = surface
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    """Draws a number one glyph at a time, for numbers that change too often to cache whole.
+
+    :param display: surface to draw on
+    :type display: pygame.Surface
+    :param number: number to draw
+    :type number: int
+    :param position: top left position to draw the number at
+    :type position: (float, float)
+    """
+
+    def blit_number(self, display, number, position):
+        x, y = position
+        for character in str(number):
+            glyph = self._glyphs.get(character)
+            if glyph is None:
+                self.misses += 1
+                glyph = (self._font.render(character, 1, self._color).convert_alpha(),
+                         self._font.size(character)[0])
+                self._glyphs[character] = glyph
+            else:
+                self.hits += 1
+            display.blit(glyph[0], (x, y))
+            x += glyph[1]
+
+    """Returns how full the cache is and how often it was used.
+
+    :returns: counts of hits, misses, and strings and glyphs kept
+    :rtype: {str: int}
+    """
+
+    def get_stats(self):
+        return {"HITS": self.hits, "MISSES": self.misses, "ENTRIES": len(self._entries) + len(self._glyphs)}
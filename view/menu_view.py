@@ -28,7 +28,7 @@ class MenuView(View):
 
     def __init__(self, model):
         # Sets up the game window surface
-        super().__init__(GameID.MENU)
+        super().__init__(GameID.MENU, dirty_rects=False)
         self._font_size = config.display_height // 24
         # Title font size
         self._title_font_size = config.display_height / 10
@@ -272,7 +272,6 @@ class MenuView(View):
    """
 
     def render(self, player, projectiles, ships, effects):
-        self._model.remove_effects()
         # Renders enemies to face the player
         for ship in ships:
             self._render_ship(ship, ship.angle)
@@ -284,8 +283,8 @@ class MenuView(View):
         if player is not None:
             self._render_ship(player, 0)
         # Renders effects
-        for effect in effects:
-            self._render_effect(effect)
+        self._render_effects(effects)
+        self._model.remove_effects()
 
     """Renders the loadout selection screen.
     
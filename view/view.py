@@ -1,7 +1,13 @@
+import functools
+import math
 import os
+import threading
+
 import pygame
 
+from model.effect_engine import EffectEngine
 from utils import config
+from utils.profiler import profiler
 from utils.ids.ally_id import AllyID
 from utils.ids.effect_id import EffectID
 from utils.ids.enemy_id import EnemyID
@@ -10,11 +16,15 @@ from utils.ids.gamemode_id import GameModeID
 from utils.ids.player_id import PlayerID
 from utils.ids.projectile_id import ProjectileID
 from utils.ids.weapon_id import WeaponID
+from view.image_containers.asset_registry import assets
 from view.image_containers.charge_up_images import ChargeUpImages
 from view.image_containers.explosion_images import ExplosionImages
 from view.image_containers.image_holder import ImageHolder
+from view.image_containers.lazy_images import LazyImages
 from view.image_containers.popup_image import PopUpImage
+from view.image_containers.rotation_cache import RotationCache
 from view.image_containers.screen_tint_images import ScreenTintImages
+from view.image_containers.text_cache import TextCache
 
 """View to render the game, uses pygame to render images. Add ships, projectiles, and effects images to render
 inside their respective fields ships_to_init, projectiles_to_init, and effects_to_init inside init_images().
@@ -32,8 +42,7 @@ class View:
     _font_path = os.path.join(_resource_path, 'fonts')
     _font_path = os.path.join(_font_path, 'insane_hours_2.ttf')
     # Backgrounds
-    _backgrounds = {"INITIALIZED": False,
-                    GameModeID.TITAN_SLAYER: os.path.join(_image_path, 'titan_background.png'),
+    _backgrounds = {GameModeID.TITAN_SLAYER: os.path.join(_image_path, 'titan_background.png'),
                     GameModeID.MANDIBLE_MADNESS: os.path.join(_image_path, 'mandible_background.png'),
                     GameModeID.CLASSIC: os.path.join(_image_path, 'survival_background.png'),
                     GameModeID.HEAVEN: os.path.join(_image_path, 'heaven_background.png'),
@@ -43,6 +52,8 @@ class View:
                     GameID.TUTORIAL: os.path.join(_image_path, 'background.png'),
                     GameModeID.SPECTRAL: os.path.join(_image_path, 'spectral_background.png')
                     }
+    # Scaled backgrounds shared by every view, loaded when first shown
+    _background_images = None
     # Ship scaling (what the default ship size should be multiplied by in their rendering)
     _ship_scaling = {
         EnemyID.MANDIBLE: 1, EnemyID.MANTIS: 1, EnemyID.CRUCIBLE: 1, EnemyID.MOSQUITO: 1, AllyID.ARCHER: 1,
@@ -63,6 +74,30 @@ class View:
     # Projectiles that do not have a unique sprite
     _projectiles_with_no_sprite = [ProjectileID.RAILGUN_BLAST, ProjectileID.DIAMOND_DUST, ProjectileID.HOMING_BULLET,
                                    ProjectileID.PULSE]
+    # Ships and large effects each game mode can spawn, loaded before the first frame. Everything else is loaded by a
+    # background thread or when it is first drawn
+    _wave_assets = [enemy for enemy in EnemyID if enemy not in [EnemyID.KING_MANDIBLE, EnemyID.QUEEN_MANDIBLE]] + \
+                   [EffectID.TITAN_EXPLOSION]
+    _mode_assets = {
+        GameModeID.CLASSIC: _wave_assets,
+        GameModeID.FATE: _wave_assets,
+        GameModeID.ONSLAUGHT: list(EnemyID) + list(AllyID) + [PlayerID.CITADEL, PlayerID.AEGIS,
+                                                              EffectID.TITAN_EXPLOSION],
+        GameModeID.HEAVEN: [EnemyID.ARBITRATOR, EnemyID.CRUCIBLE, EnemyID.DESPOILER, EnemyID.JUDICATOR,
+                            EnemyID.KING_MANDIBLE, EnemyID.MANDIBLE, EnemyID.MANTIS, EnemyID.MOTHERSHIP,
+                            EnemyID.PHANTOM, EnemyID.QUEEN_MANDIBLE, EnemyID.SPECTRE, EnemyID.SUBJUGATOR,
+                            EnemyID.TERMINUS, EnemyID.TITAN, EffectID.TITAN_EXPLOSION],
+        GameModeID.TITAN_SLAYER: [EnemyID.TITAN, EnemyID.MANTIS, EnemyID.SUBJUGATOR, EnemyID.TERMINUS,
+                                  EffectID.TITAN_EXPLOSION],
+        GameModeID.SPECTRAL: [EnemyID.SPECTRE, EnemyID.PHANTOM],
+        GameModeID.MANDIBLE_MADNESS: [EnemyID.MANDIBLE, EnemyID.MOTHERSHIP, EnemyID.KING_MANDIBLE,
+                                      EnemyID.QUEEN_MANDIBLE],
+        GameID.TUTORIAL: [EnemyID.MANDIBLE],
+        GameID.MENU: [EnemyID.MANDIBLE]
+    }
+    # Angles to rotate sprites to ahead of time, the player faces up and most projectiles fly straight up or down
+    _prewarmed_ship_angles = [0, 90, 180, 270]
+    _prewarmed_projectile_angles = [0, 45, 90, 135, 180, 225, 270, 315]
 
     """Constructor to initialize the game display.
 
@@ -78,9 +113,11 @@ class View:
     :type game_mode: EntityID
     :param fps: Frames per second to set effect length
     :type fps: int
+    :param dirty_rects: if only the parts of the screen that changed are redrawn and updated
+    :type dirty_rects: bool
     """
 
-    def __init__(self, game_mode):
+    def __init__(self, game_mode, dirty_rects=config.dirty_rects):
         self._width = config.display_width
         self._height = config.display_height
         #######################################################
@@ -98,6 +135,23 @@ class View:
         #######################################################
         # Grabs the image dictionary
         self._image_dict = self._init_images()
+        for key in self._get_startup_assets():
+            self._image_dict.load(key)
+        # Rotated ship and projectile sprites
+        self._rotation_cache = RotationCache()
+        self._prewarm_rotations()
+        #######################################################
+        # Dirty rectangle rendering, the background stays still so only what is drawn over it has to be restored
+        self._dirty_rects = dirty_rects
+        self._screen_rect = self._game_display.get_rect()
+        # Rects drawn over in the current and last frame
+        self._drawn_rects = []
+        self._previous_rects = []
+        # The whole screen has to be drawn and updated on the first frame
+        self._full_update = True
+        # Scales the rest of the images and backgrounds while the game runs
+        if config.prefetch_assets:
+            threading.Thread(target=self._prefetch_assets, daemon=True).start()
 
     """Initializes the HUD elements.
     """
@@ -106,6 +160,8 @@ class View:
         # Display parameters
         self._font_size = self._height / 24
         self._text_font = pygame.font.Font(self._font_path, int(self._font_size))
+        # Rendered score and FPS digits
+        self._hud_text = TextCache(self._text_font)
         self._hp_text = self._text_font.render("HP", 1, self.WHITE).convert_alpha()
         hp_width, hp_height = pygame.font.Font.size(self._text_font, "HP")
         #######################################################
@@ -124,20 +180,22 @@ class View:
         #######################################################
         # FPS ticker
         self._fps_text = self._text_font.render("FPS:", 1, self.WHITE).convert_alpha()
+        # Profiler overlay
+        self._profiler_text = TextCache(pygame.font.Font(self._font_path, int(self._font_size / 2)))
+        self._profiler_line_height = int(self._font_size / 2)
+        # Strip along the bottom of the screen the HUD is drawn in
+        self._hud_rect = pygame.rect.Rect(0, self._height - self._font_size, self._width, self._font_size)
 
     """Initializes the backgrounds in the game.
     """
 
     def _init_backgrounds(self):
-        if not self._backgrounds["INITIALIZED"]:
-            for key, value in self._backgrounds.items():
-                if key != "INITIALIZED":
-                    temp_background = pygame.image.load(value).convert()
-                    temp_background = pygame.transform.scale(temp_background,
-                                                             (config.display_width, config.display_height))
-                    self._backgrounds[key] = temp_background
-            self._backgrounds["INITIALIZED"] = True
-        self._background = self._backgrounds[self._curr_game_mode]
+        if View._background_images is None:
+            size = (config.display_width, config.display_height)
+            View._background_images = LazyImages({key: functools.partial(assets.get_image, path, size, alpha=False)
+                                                  for key, path in self._backgrounds.items()},
+                                                 {key: (path, 1, size, False) for key, path in self._backgrounds.items()})
+        self._background = self._background_images[self._curr_game_mode]
         self._target_background_id = None
         # How much the background scrolls
         self._scrolling_background_change = 2 * (30 / config.game_fps)
@@ -145,15 +203,16 @@ class View:
         self._background_alpha = 255
         self._new_background = None
 
-    """Initializes all the images used in the game.
+    """Initializes how to load all the images used in the game. Images are loaded when first used.
 
     :returns: dictionary of entity ID to images
-    :rtype: {EntityID : ImageHolder}
+    :rtype: LazyImages
     """
 
     def _init_images(self):
-        # Result to return:
-        result = {}
+        # Loader of each image, and the sprite sheet it is made from so it can be scaled ahead of time
+        loaders = {}
+        sheets = {}
         # Projectiles to render
         projectiles_to_init = [e for e in ProjectileID if e not in self._projectiles_with_no_sprite]
         # Effects to render
@@ -162,50 +221,94 @@ class View:
         for id_name, size in self._ship_scaling.items():
             ship_name = id_name.name
             image_path = os.path.join(self._image_path, ship_name + '.png')
-            container = ImageHolder(image_path, int(self._ship_size * size))
-            result[id_name] = container
+            loaders[id_name] = functools.partial(ImageHolder, image_path, int(self._ship_size * size))
+            sheets[id_name] = (image_path, 4, (int(self._ship_size * size),) * 2, True)
         # Renders each projectile
         projectile_size = self._ship_size // 2
         for id_name in projectiles_to_init:
             projectile_name = id_name.name
             image_path = os.path.join(self._image_path, projectile_name + '.png')
-            image = pygame.image.load(image_path).convert_alpha()
-            image = pygame.transform.scale(image, (projectile_size, projectile_size))
-            result[id_name] = image
+            loaders[id_name] = functools.partial(assets.get_image, image_path, (projectile_size, projectile_size))
+            sheets[id_name] = (image_path, 1, (projectile_size, projectile_size), True)
         # Renders each weapon sprite
+        weapon_size = (int(config.ship_size * 1.2), int(config.ship_size * 1.2))
         for weapon_id in WeaponID:
             weapon_name = weapon_id.name
             image_path = os.path.join(self._image_path, weapon_name + '.png')
-            image = pygame.image.load(image_path).convert_alpha()
-            image = pygame.transform.scale(image, (int(config.ship_size * 1.2), int(config.ship_size * 1.2)))
-            result[weapon_id] = image
+            loaders[weapon_id] = functools.partial(assets.get_image, image_path, weapon_size)
+            sheets[weapon_id] = (image_path, 1, weapon_size, True)
         # Renders each effect (explosions)
         for id_name in effects_to_init:
             effect_name = id_name.name
             image_paths = os.path.join(self._image_path, effect_name + '.png')
-            container = ExplosionImages(image_paths, int(self._ship_size * 1.5))
             # Two additional effects that do not have different sprites
             if effect_name == "EXPLOSION":
-                big_container = ExplosionImages(image_paths, int(self._ship_size * 8))
-                result[EffectID.TITAN_EXPLOSION] = big_container
+                loaders[EffectID.TITAN_EXPLOSION] = functools.partial(ExplosionImages, image_paths,
+                                                                      int(self._ship_size * 8))
+                sheets[EffectID.TITAN_EXPLOSION] = (image_paths, 5, (int(self._ship_size * 8),) * 2, True)
             elif effect_name == "RED_EXPLOSION":
-                charge_effect_container = ChargeUpImages(image_paths, int(self._ship_size * 1.5))
-                result[EffectID.RED_CHARGE] = charge_effect_container
+                loaders[EffectID.RED_CHARGE] = functools.partial(ChargeUpImages, image_paths,
+                                                                 int(self._ship_size * 1.5))
+                sheets[EffectID.RED_CHARGE] = (image_paths, 5, (int(self._ship_size * 1.5),) * 2, True)
             elif effect_name == "BLUE_EXPLOSION":
-                charge_effect_container = ChargeUpImages(image_paths, int(self._ship_size * 1.5))
-                result[EffectID.BLUE_CHARGE] = charge_effect_container
-            result[id_name] = container
+                loaders[EffectID.BLUE_CHARGE] = functools.partial(ChargeUpImages, image_paths,
+                                                                  int(self._ship_size * 1.5))
+                sheets[EffectID.BLUE_CHARGE] = (image_paths, 5, (int(self._ship_size * 1.5),) * 2, True)
+            loaders[id_name] = functools.partial(ExplosionImages, image_paths, int(self._ship_size * 1.5))
+            sheets[id_name] = (image_paths, 5, (int(self._ship_size * 1.5),) * 2, True)
         # Screen tints
         blue_tint = os.path.join(self._image_path, 'shield_damage_screen_effect.png')
         red_tint = os.path.join(self._image_path, 'damage_screen_effect.png')
-        shield_damage_tint = ScreenTintImages(blue_tint)
-        damage_tint = ScreenTintImages(red_tint)
-        result[EffectID.SHIELD_TINT] = shield_damage_tint
-        result[EffectID.HP_TINT] = damage_tint
+        loaders[EffectID.SHIELD_TINT] = functools.partial(ScreenTintImages, blue_tint)
+        loaders[EffectID.HP_TINT] = functools.partial(ScreenTintImages, red_tint)
+        screen_size = (config.display_width, config.display_height)
+        sheets[EffectID.SHIELD_TINT] = (blue_tint, 1, screen_size, True)
+        sheets[EffectID.HP_TINT] = (red_tint, 1, screen_size, True)
         # Popup text
-        result[EffectID.POPUP] = PopUpImage(self._text_font)
+        loaders[EffectID.POPUP] = functools.partial(PopUpImage, self._text_font)
+        return LazyImages(loaders, sheets)
+
+    """Returns the images to load before the first frame: the player's ship, every projectile and small effect, and
+    what the game mode can spawn.
+
+    :returns: keys of the images to load
+    :rtype: [EntityID]
+    """
+
+    def _get_startup_assets(self):
+        result = [config.player_ship]
+        result.extend(e for e in ProjectileID if e not in self._projectiles_with_no_sprite)
+        result.extend(e for e in EffectID if e != EffectID.TITAN_EXPLOSION)
+        result.extend(self._mode_assets.get(self._curr_game_mode, []))
         return result
 
+    """Loads and scales the sprite sheets of every image and background not loaded yet. Runs on a background thread so
+    no sheet has to be scaled in the middle of a frame, the main thread converts them between frames.
+    """
+
+    def _prefetch_assets(self):
+        try:
+            for sheet in self._image_dict.get_unloaded_sheets() + self._background_images.get_unloaded_sheets():
+                assets.prepare(*sheet)
+        except pygame.error:
+            # Pygame was shut down while reading, such as when the game is closed
+            return
+
+    """Rotates the sprites of regular sized ships and projectiles to common angles ahead of time.
+    """
+
+    def _prewarm_rotations(self):
+        for id_name, size in self._ship_scaling.items():
+            # Larger ships take up too much memory to rotate ahead of time, ships not loaded yet are rotated when
+            # first drawn
+            if size == 1 and id_name in self._image_dict:
+                for variant, image in self._image_dict[id_name].variants.items():
+                    self._rotation_cache.prewarm(id_name, variant, image, self._prewarmed_ship_angles)
+        for id_name in ProjectileID:
+            if id_name in self._image_dict:
+                self._rotation_cache.prewarm(id_name, None, self._image_dict[id_name],
+                                             self._prewarmed_projectile_angles)
+
     """Returns a list of the image paths for a ship.
 
     :param ship_name: Name of the ship and the image file
@@ -227,30 +330,96 @@ class View:
     def animate(self):
         self._animation_switch = not self._animation_switch
 
-    """Renders the game, including background, ships, and projectiles.
-
-    :param items: ships and projectiles to render
-    :type items: list of Ship or Projectile
+    """Renders the game, including background, ships, and projectiles. Takes either the model's entities or the
+    copies of them in a RenderSnapshot, which have the same attributes.
+
+    :param player: the player's ship
+    :type player: Player or PlayerSnapshot
+    :param projectiles: projectiles to render
+    :type projectiles: iterable of Projectile or ProjectileSnapshot
+    :param ships: ships other than the player to render
+    :type ships: iterable of Ship or ShipSnapshot
+    :param effects: effects to render
+    :type effects: iterable of Effect or EffectSnapshot
     """
 
     def render(self, player, projectiles, ships, effects):
-        # Scrolling background
-        self._draw_background(self._background)
+        profiler.start("BACKGROUND")
+        if self._dirty_rects:
+            self._restore_background()
+        else:
+            # Scrolling background
+            self._draw_background(self._background)
+        profiler.stop("BACKGROUND")
+        profiler.start("RENDER SHIPS")
         # Renders enemies to face the player
         for ship in ships:
             self._render_ship(ship, ship.angle)
+        profiler.stop("RENDER SHIPS")
+        profiler.start("RENDER PROJECTILES")
         # Renders projectiles
         for projectile in projectiles:
             self._render_projectile(projectile)
-
+        profiler.stop("RENDER PROJECTILES")
+        profiler.start("RENDER SHIPS")
         # If the player isn't dead, it is rendered
         if not player.is_dead:
             self._render_ship(player, 0)
+        profiler.stop("RENDER SHIPS")
+        profiler.start("RENDER EFFECTS")
         # Renders effects
-        for effect in effects:
-            self._render_effect(effect)
+        self._render_effects(effects)
+        profiler.stop("RENDER EFFECTS")
+        profiler.start("HUD")
         # Renders HUD
         self._draw_hud(player)
+        profiler.stop("HUD")
+
+    """Updates the display with what was rendered this frame. With dirty rectangles on, only the parts of the screen
+    drawn over this frame or the last are updated, unless something covered the whole screen such as a screen tint.
+    Sprites scaled ahead of time are readied for drawing once the frame is shown.
+    """
+
+    def update_display(self):
+        if not self._dirty_rects:
+            pygame.display.update()
+        else:
+            rects = self._previous_rects + self._drawn_rects
+            if self._full_update or self._screen_rect in rects:
+                pygame.display.update()
+            else:
+                pygame.display.update(rects)
+            self._full_update = False
+            self._previous_rects = self._drawn_rects
+            self._drawn_rects = []
+        # Readies a few of the sprites the prefetch thread scaled each frame, so none have to be made when they spawn
+        if config.prefetch_assets:
+            assets.finish_prepared(2)
+
+    """Draws the still background over everything drawn last frame, or over the whole screen on the first frame.
+    """
+
+    def _restore_background(self):
+        if self._full_update:
+            self._game_display.blit(self._background, (0, 0))
+        else:
+            for rect in self._previous_rects:
+                self._game_display.blit(self._background, rect, rect)
+        # The HUD is redrawn every frame
+        self._drawn_rects.append(self._hud_rect)
+
+    """Draws an image and keeps track of where it was drawn if using dirty rectangles.
+
+    :param image: image to draw
+    :type image: pygame.Surface
+    :param posn: top left position to draw it at
+    :type posn: (int, int)
+    """
+
+    def _blit(self, image, posn):
+        rect = self._game_display.blit(image, posn)
+        if self._dirty_rects:
+            self._drawn_rects.append(rect)
 
     """Draws the scrolling background.
     
@@ -286,9 +455,8 @@ class View:
         self._game_display.blit(self._hp_text, (0, self._height - self._font_size))
         # Score
         self._game_display.blit(self._score_text, (self._score_x, self._height - self._font_size))
-        score = self._text_font.render(str(player.score), 1, self.WHITE).convert_alpha()
-        self._game_display.blit(score, (self._score_x + self._score_width,
-                                        self._height - self._font_size))
+        self._hud_text.blit_number(self._game_display, player.score, (self._score_x + self._score_width,
+                                                                      self._height - self._font_size))
 
     """Renders an individual ship depending on if it's damaged etc.
 
@@ -300,21 +468,19 @@ class View:
 
     def _render_ship(self, ship, angle):
         image_holder = self._image_dict.get(ship.entity_id)
-        image = image_holder.base_image
+        variant = "BASE"
         # Decides which image to use:
         # damaged image, base image, or second base image for animation for engines
         if ship.is_damaged:
             if ship.shield > 0:
-                image = image_holder.shield_damage_image
+                variant = "SHIELD_DAMAGE"
             else:
-                image = image_holder.damaged_image
+                variant = "DAMAGED"
         elif self._animation_switch:
-            image = image_holder.animated_image
+            variant = "ANIMATED"
         # Rotates ship to face the given angle
-        ship_image = pygame.transform.rotate(image, angle)
-
-        self._game_display.blit(ship_image,
-                                self._find_posn(ship_image, ship.x + ship.size / 2, ship.y + ship.size / 2))
+        ship_image, offset = self._rotation_cache.get(ship.entity_id, variant, image_holder.variants[variant], angle)
+        self._blit(ship_image, self._offset_posn(offset, ship.x + ship.size / 2, ship.y + ship.size / 2))
 
     """Renders an individual projectile depending on its orientation.
 
@@ -327,24 +493,24 @@ class View:
             return
         image = self._image_dict.get(projectile.entity_id)
         # Rotates the projectile depending on its angle
-        projectile_image = pygame.transform.rotate(image, projectile.direction - 90)
+        projectile_image, offset = self._rotation_cache.get(projectile.entity_id, None, image,
+                                                            projectile.direction - 90)
         center_height = projectile.y + self._ship_size / 2
         center_width = projectile.x + self._ship_size / 2
-        self._game_display.blit(projectile_image,
-                                self._find_posn(projectile_image, center_width, center_height))
+        self._blit(projectile_image, self._offset_posn(offset, center_width, center_height))
 
-    """Renders the given effect. Returns the effect.
+    """Renders the given effects on their current frames in one batch.
 
-    :param effect: effect to render
-    :type effect: Effect
-    :returns: the effect
-    :rtype: Effect
+    :param effects: effects to render
+    :type effects: [Effect]
     """
 
-    def _render_effect(self, effect):
-        image = self._image_dict.get(effect.entity_id).get_frame(effect)
-        self._game_display.blit(image, (effect.x, effect.y))
-        return effect
+    def _render_effects(self, effects):
+        if not effects:
+            return
+        rects = self._game_display.blits(EffectEngine.get_draws(effects, self._image_dict), self._dirty_rects)
+        if self._dirty_rects:
+            self._drawn_rects.extend(rects)
 
     """Renders the FPS counter for the game.
 
@@ -354,8 +520,33 @@ class View:
 
     def render_fps(self, fps):
         self._game_display.blit(self._fps_text, (self._width - (5 * self._font_size), self._height - self._font_size))
-        fps_number = self._text_font.render(str(fps), 1, self.WHITE).convert_alpha()
-        self._game_display.blit(fps_number, (self._width - (2 * self._font_size), self._height - self._font_size))
+        self._hud_text.blit_number(self._game_display, fps, (self._width - (2 * self._font_size),
+                                                             self._height - self._font_size))
+
+    """Renders the profiler overlay in the top left corner, listing the 50th, 95th, and 99th percentile milliseconds
+    each stage of the frame took.
+    """
+
+    def render_profiler(self):
+        lines = ["SECTION  P50  P95  P99 (MS)"]
+        for section, p50, p95, p99 in profiler.summary():
+            lines.append("{}  {:.2f}  {:.2f}  {:.2f}".format(section, p50, p95, p99))
+        lines.append("CACHE  HITS  MISSES")
+        for name, stats in self.get_cache_stats().items():
+            lines.append("{}  {}  {}".format(name, stats["HITS"], stats["MISSES"]))
+        for i, line in enumerate(lines):
+            self._blit(self._profiler_text.render(line), (0, i * self._profiler_line_height))
+
+    """Returns how often the rotated sprite and text caches were used.
+
+    :returns: stats of each cache by name
+    :rtype: {str: {str: int}}
+    """
+
+    def get_cache_stats(self):
+        return {"ROTATION": self._rotation_cache.get_stats(),
+                "HUD TEXT": self._hud_text.get_stats(),
+                "POPUP TEXT": self._image_dict[EffectID.POPUP].text_cache.get_stats()}
 
     """Finds position given a Surface and coordinates for the center. Returns the coordinates that
     correspond to the correct top left position to place the surface to achieve the given center.
@@ -374,6 +565,22 @@ class View:
         rect = image.get_rect(center=(x, y))
         return rect.topleft
 
+    """Finds the top left position to place a surface given its offset from a RotationCache and its center. Rounds the
+    center the same way _find_posn does.
+
+    :param offset: offset from the center of the surface to its top left corner
+    :type offset: (int, int)
+    :param x: x position
+    :type x: float
+    :param y: y position
+    :type y: float
+    :returns: tuple of the coordinates to place it
+    :rtype: (int, int)
+    """
+
+    def _offset_posn(self, offset, x, y):
+        return math.floor(x + .5) + offset[0], math.floor(y + .5) + offset[1]
+
     """Makes a background transition by fading in.
     
     :param background_id: The new background to transition to
@@ -385,7 +592,7 @@ class View:
             if self._background_alpha > 0:
                 self._background_alpha -= 15
                 self._background.set_alpha(self._background_alpha)
-                self._new_background = self._backgrounds[background_id]
+                self._new_background = self._background_images[background_id]
                 self._new_background.set_alpha(255 - self._background_alpha)
                 self._draw_background(self._new_background)
             else: